@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlmodel import select
+from sqlmodel import case, delete, func, select, update
 
 from asymmetric.db.alert_models import Alert, AlertHistory
 from asymmetric.db.database import get_session, get_stock_by_ticker
@@ -291,14 +291,20 @@ class AlertChecker:
         ticker: Optional[str] = None,
         active_only: bool = True,
         triggered_only: bool = False,
+        limit: Optional[int] = None,
+        inactive_only: bool = False,
     ) -> list[tuple[Alert, str]]:
         """
-        Get alerts with optional filtering.
+        Get alerts with optional filtering, newest first.
+
+        All filters are applied in SQL.
 
         Args:
             ticker: Optional ticker to filter by
             active_only: Only return active alerts
             triggered_only: Only return triggered alerts
+            limit: Maximum results (None for all)
+            inactive_only: Only return inactive alerts (ignored if active_only)
 
         Returns:
             List of (Alert, ticker) tuples
@@ -310,9 +316,15 @@ class AlertChecker:
                 stmt = stmt.where(Stock.ticker == ticker.upper())
             if active_only:
                 stmt = stmt.where(Alert.is_active == True)
+            elif inactive_only:
+                stmt = stmt.where(Alert.is_active == False)
             if triggered_only:
                 stmt = stmt.where(Alert.is_triggered == True)
 
+            stmt = stmt.order_by(Alert.created_at.desc(), Alert.id.desc())
+            if limit is not None:
+                stmt = stmt.limit(limit)
+
             results = session.exec(stmt).all()
 
             # Refresh and expunge Alert objects to prevent DetachedInstanceError
@@ -388,6 +400,35 @@ class AlertChecker:
             session.flush()
         return True
 
+    def acknowledge_many(self, alert_history_ids: list[int], acknowledged_by: str = "user") -> int:
+        """
+        Acknowledge several triggered alerts with one UPDATE.
+
+        Records that are already acknowledged are left untouched.
+
+        Args:
+            alert_history_ids: IDs of the AlertHistory records
+            acknowledged_by: Who acknowledged (user, system, etc.)
+
+        Returns:
+            Number of records acknowledged
+        """
+        if not alert_history_ids:
+            return 0
+
+        with get_session() as session:
+            result = session.exec(
+                update(AlertHistory)
+                .where(AlertHistory.id.in_(alert_history_ids))
+                .where(AlertHistory.acknowledged == False)
+                .values(
+                    acknowledged=True,
+                    acknowledged_at=datetime.now(timezone.utc),
+                    acknowledged_by=acknowledged_by,
+                )
+            )
+            return result.rowcount
+
     def remove_alert(self, alert_id: int) -> bool:
         """
         Remove an alert configuration.
@@ -413,6 +454,27 @@ class AlertChecker:
             session.flush()
         return True
 
+    def remove_many(self, alert_ids: list[int]) -> int:
+        """
+        Remove several alert configurations and their history at once.
+
+        Issues one DELETE for the history rows and one for the alerts,
+        instead of a round trip per alert.
+
+        Args:
+            alert_ids: IDs of the Alerts to remove
+
+        Returns:
+            Number of alerts removed
+        """
+        if not alert_ids:
+            return 0
+
+        with get_session() as session:
+            session.exec(delete(AlertHistory).where(AlertHistory.alert_id.in_(alert_ids)))
+            result = session.exec(delete(Alert).where(Alert.id.in_(alert_ids)))
+            return result.rowcount
+
     def get_triggered_alerts(self) -> list[tuple[AlertHistory, str, str]]:
         """
         Get all currently triggered, unacknowledged alerts.
@@ -421,3 +483,32 @@ class AlertChecker:
             List of (AlertHistory, ticker, alert_type) tuples
         """
         return self.get_alert_history(unacknowledged_only=True)
+
+    def get_summary(self) -> dict[str, int]:
+        """
+        Get alert counts for status displays in a single query.
+
+        Returns:
+            Dict with "active" (active alerts), "triggered" (active alerts
+            currently triggered) and "unacknowledged" (history records not
+            yet acknowledged) counts.
+        """
+        unacknowledged = (
+            select(func.count(AlertHistory.id))
+            .where(AlertHistory.acknowledged == False)
+            .scalar_subquery()
+        )
+        stmt = select(
+            func.sum(case((Alert.is_active == True, 1), else_=0)),
+            func.sum(case(((Alert.is_active == True) & (Alert.is_triggered == True), 1), else_=0)),
+            unacknowledged,
+        ).select_from(Alert)
+
+        with get_session() as session:
+            active, triggered, unack = session.exec(stmt).one()
+
+        return {
+            "active": active or 0,
+            "triggered": triggered or 0,
+            "unacknowledged": unack or 0,
+        }
@@ -83,6 +83,52 @@ def _validate_ticker(ticker: str) -> str:
     return ticker
 
 
+def _value_series_stats(values: List[float]) -> tuple:
+    """Scan a portfolio value series once for drawdown and return statistics.
+
+    Tracks the running peak (max drawdown), a Welford running mean/variance
+    of snapshot-to-snapshot % returns, and the first best/worst return index,
+    in a single loop instead of building an intermediate list of return dicts.
+    Returns whose previous value is 0 are skipped.
+
+    Returns:
+        (max_drawdown, return_count, mean_return, volatility,
+        best_idx, best_return, worst_idx, worst_return) where best_idx and
+        worst_idx index into ``values`` (None if there are no returns).
+    """
+    max_drawdown = 0.0
+    running_peak = values[0]
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    best_idx = worst_idx = None
+    best = worst = 0.0
+    prev = None
+
+    for i, value in enumerate(values):
+        if value > running_peak:
+            running_peak = value
+        if running_peak != 0:
+            drawdown = ((value - running_peak) / running_peak) * 100
+            if drawdown < max_drawdown:
+                max_drawdown = drawdown
+
+        if prev is not None and prev != 0:
+            ret = ((value - prev) / prev) * 100
+            count += 1
+            delta = ret - mean
+            mean += delta / count
+            m2 += delta * (ret - mean)
+            if best_idx is None or ret > best:
+                best, best_idx = ret, i
+            if worst_idx is None or ret < worst:
+                worst, worst_idx = ret, i
+        prev = value
+
+    volatility = (m2 / (count - 1)) ** 0.5 if count > 1 else 0.0
+    return max_drawdown, count, mean, volatility, best_idx, best, worst_idx, worst
+
+
 @dataclass
 class PortfolioSummary:
     """Overall portfolio summary."""
@@ -106,6 +152,13 @@ class PortfolioSummary:
         if self.missing_prices is None:
             self.missing_prices = []
 
+    @property
+    def total_return_percent(self) -> float:
+        """Realized plus unrealized P&L as a percent of cash invested (0 when nothing invested)."""
+        if self.cash_invested <= 0:
+            return 0.0
+        return (self.realized_pnl_total + self.unrealized_pnl) / self.cash_invested * 100
+
 
 @dataclass
 class HoldingDetail:
@@ -512,6 +565,11 @@ class PortfolioManager:
 
         Returns:
             Dict mapping ticker -> current price (None if unavailable)
+
+        Note:
+            All tickers go out in a single fetch_batch_prices() request;
+            duplicates are dropped first and tickers missing from the batch
+            response map to None.
         """
         if not PRICE_DATA_AVAILABLE:
             return {ticker: None for ticker in tickers}
@@ -519,11 +577,12 @@ class PortfolioManager:
         if not tickers:
             return {}
 
+        unique_tickers = tuple(dict.fromkeys(tickers))
         try:
-            price_data = fetch_batch_prices(tuple(tickers))
+            price_data = fetch_batch_prices(unique_tickers)
 
             # Extract just the price field, handle errors gracefully
-            prices = {}
+            prices = dict.fromkeys(unique_tickers)
             for ticker, data in price_data.items():
                 if "error" in data:
                     prices[ticker] = None
@@ -536,6 +595,23 @@ class PortfolioManager:
             logger.warning(f"Failed to fetch prices: {e}")
             return {ticker: None for ticker in tickers}
 
+    def get_open_tickers(self) -> list[str]:
+        """
+        Get tickers of all open positions, without building holding details.
+
+        Returns:
+            Sorted list of ticker symbols
+        """
+        with get_session() as session:
+            statement = (
+                select(Stock.ticker)
+                .join(Holding, Holding.stock_id == Stock.id)
+                .where(Holding.quantity > 0)
+                .where(Holding.status == "open")
+                .order_by(Stock.ticker)
+            )
+            return list(session.exec(statement).all())
+
     def get_holdings(
         self,
         sort_by: str = "value",
@@ -1101,8 +1177,7 @@ class PortfolioManager:
         if ticker:
             tickers_to_sync = [_validate_ticker(ticker)]
         else:
-            holdings = self.get_holdings(include_market_data=False)
-            tickers_to_sync = [h.ticker for h in holdings]
+            tickers_to_sync = self.get_open_tickers()
 
         for t in tickers_to_sync:
             try:
@@ -1188,42 +1263,39 @@ class PortfolioManager:
                 distress_allocation=0.0,
             )
 
-        total_value = sum(h.cost_basis_total for h in holdings)
-
-        weighted_fscore = 0.0
-        weighted_zscore = 0.0
+        # Single pass: accumulate cost-weighted sums, divide once at the end
+        total_value = 0.0
+        fscore_sum = 0.0
+        zscore_sum = 0.0
         with_scores = 0
-        without_scores = 0
-        safe_value = 0.0
-        grey_value = 0.0
-        distress_value = 0.0
+        zone_values = {"Safe": 0.0, "Grey": 0.0, "Distress": 0.0}
 
         for h in holdings:
-            weight = h.cost_basis_total / total_value if total_value > 0 else 0
-
+            cost = h.cost_basis_total
+            total_value += cost
             if h.fscore is not None and h.zscore is not None:
-                weighted_fscore += h.fscore * weight
-                weighted_zscore += h.zscore * weight
+                fscore_sum += h.fscore * cost
+                zscore_sum += h.zscore * cost
                 with_scores += 1
+                if h.zone in zone_values:
+                    zone_values[h.zone] += cost
 
-                # Zone allocation
-                if h.zone == "Safe":
-                    safe_value += h.cost_basis_total
-                elif h.zone == "Grey":
-                    grey_value += h.cost_basis_total
-                elif h.zone == "Distress":
-                    distress_value += h.cost_basis_total
-            else:
-                without_scores += 1
+        if total_value > 0:
+            weighted_fscore = fscore_sum / total_value
+            weighted_zscore = zscore_sum / total_value
+            zone_pct = {zone: value / total_value * 100 for zone, value in zone_values.items()}
+        else:
+            weighted_fscore = weighted_zscore = 0.0
+            zone_pct = dict.fromkeys(zone_values, 0.0)
 
         return WeightedScores(
             weighted_fscore=round(weighted_fscore, 2),
             weighted_zscore=round(weighted_zscore, 2),
             holdings_with_scores=with_scores,
-            holdings_without_scores=without_scores,
-            safe_allocation=round((safe_value / total_value * 100) if total_value > 0 else 0, 1),
-            grey_allocation=round((grey_value / total_value * 100) if total_value > 0 else 0, 1),
-            distress_allocation=round((distress_value / total_value * 100) if total_value > 0 else 0, 1),
+            holdings_without_scores=len(holdings) - with_scores,
+            safe_allocation=round(zone_pct["Safe"], 1),
+            grey_allocation=round(zone_pct["Grey"], 1),
+            distress_allocation=round(zone_pct["Distress"], 1),
         )
 
     def take_snapshot(self, auto: bool = False) -> PortfolioSnapshot:
@@ -1237,8 +1309,7 @@ class PortfolioManager:
             Created PortfolioSnapshot
         """
         # Fetch prices once, share across summary + weighted scores (avoids redundant API calls)
-        _tickers_holdings = self.get_holdings(include_market_data=False)
-        _tickers = [h.ticker for h in _tickers_holdings]
+        _tickers = self.get_open_tickers()
         prices = self.refresh_market_prices(_tickers) if _tickers else {}
         summary = self.get_portfolio_summary(include_market_data=True, market_prices=prices)
         holdings = self.get_holdings(market_prices=prices)
@@ -1452,21 +1523,10 @@ class PortfolioManager:
 
         # Extract values for calculations (convert Decimal → float for stats math)
         values = [float(s.total_value) for s in snapshots]
-        dates = [s.snapshot_date for s in snapshots]
 
         first_value = values[0]
         latest_value = values[-1]
 
-        # Calculate snapshot-to-snapshot returns
-        daily_returns = []
-        for i in range(1, len(values)):
-            if values[i - 1] != 0:  # Avoid division by zero
-                daily_return = ((values[i] - values[i - 1]) / values[i - 1]) * 100
-                daily_returns.append({
-                    "date": dates[i],
-                    "return": daily_return
-                })
-
         # Total return
         total_return = 0.0
         total_return_dollars = 0.0
@@ -1474,38 +1534,30 @@ class PortfolioManager:
             total_return = ((latest_value - first_value) / first_value) * 100
             total_return_dollars = latest_value - first_value
 
-        # Peak value and drawdown calculations
+        # Peak value and current drawdown
         peak_value = max(values)
         current_drawdown = 0.0
         if peak_value != 0:
             current_drawdown = ((latest_value - peak_value) / peak_value) * 100
 
-        # Max drawdown (worst peak-to-trough decline)
-        max_drawdown = 0.0
-        running_peak = values[0]
-        for value in values:
-            if value > running_peak:
-                running_peak = value
-            if running_peak != 0:
-                drawdown = ((value - running_peak) / running_peak) * 100
-                if drawdown < max_drawdown:
-                    max_drawdown = drawdown
-
-        # Average daily return
-        avg_daily_return = 0.0
-        if daily_returns:
-            avg_daily_return = sum(r["return"] for r in daily_returns) / len(daily_returns)
-
-        # Volatility (standard deviation of daily returns)
-        volatility = 0.0
-        if len(daily_returns) > 1:
-            mean_return = avg_daily_return
-            variance = sum((r["return"] - mean_return) ** 2 for r in daily_returns) / (len(daily_returns) - 1)
-            volatility = variance ** 0.5
-
-        # Best and worst days
-        best_day = max(daily_returns, key=lambda x: x["return"]) if daily_returns else None
-        worst_day = min(daily_returns, key=lambda x: x["return"]) if daily_returns else None
+        # Max drawdown, snapshot-to-snapshot return mean/volatility and
+        # best/worst days in one pass over the values
+        (
+            max_drawdown,
+            return_count,
+            avg_daily_return,
+            volatility,
+            best_idx,
+            best_return,
+            worst_idx,
+            worst_return,
+        ) = _value_series_stats(values)
+
+        best_day = None
+        worst_day = None
+        if return_count:
+            best_day = {"date": snapshots[best_idx].snapshot_date, "return": best_return}
+            worst_day = {"date": snapshots[worst_idx].snapshot_date, "return": worst_return}
 
         # Calculate TWR (cash-flow-adjusted return)
         twr_result = self.calculate_twr(snapshots=snapshots)
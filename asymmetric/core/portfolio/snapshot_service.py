@@ -66,8 +66,7 @@ def should_take_snapshot() -> bool:
 
     # Check if portfolio has holdings
     manager = PortfolioManager()
-    summary = manager.get_portfolio_summary(include_market_data=False)  # Quick check
-    if summary.position_count == 0:
+    if not manager.get_open_tickers():  # Quick check, no P&L math
         logger.info("Portfolio is empty, skipping snapshot")
         return False
 
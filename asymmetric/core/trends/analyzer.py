@@ -83,6 +83,20 @@ class TurnaroundCandidate:
     periods_since_distress: int
 
 
+# ScoreHistory columns in ScoreHistoryRecord field order
+_HISTORY_RECORD_COLUMNS = (
+    ScoreHistory.fiscal_year,
+    ScoreHistory.fiscal_period,
+    ScoreHistory.piotroski_score,
+    ScoreHistory.piotroski_profitability,
+    ScoreHistory.piotroski_leverage,
+    ScoreHistory.piotroski_efficiency,
+    ScoreHistory.altman_z_score,
+    ScoreHistory.altman_zone,
+    ScoreHistory.recorded_at,
+)
+
+
 class TrendAnalyzer:
     """
     Analyzes score trends over time.
@@ -112,48 +126,35 @@ class TrendAnalyzer:
             period_type: "FY" for annual, "Q1"-"Q4" for quarterly
 
         Returns:
-            List of ScoreHistoryRecord, newest first
+            List of ScoreHistoryRecord, newest first. The year and period
+            filters are applied in SQL, so every record has fiscal_year and
+            fiscal_period set.
         """
-        with get_session() as session:
-            stock = get_stock_by_ticker(session, ticker)
-            if not stock:
-                return []
-
-            # Query score history
-            current_year = datetime.now(timezone.utc).year
-            min_year = current_year - years
-
-            stmt = (
-                select(ScoreHistory)
-                .where(ScoreHistory.stock_id == stock.id)
-                .where(ScoreHistory.fiscal_year >= min_year)
-            )
+        current_year = datetime.now(timezone.utc).year
+        min_year = current_year - years
+
+        # Select only the record's columns (no ORM entity hydration) and
+        # resolve the ticker in the same query via a join on Stock
+        stmt = (
+            select(*_HISTORY_RECORD_COLUMNS)
+            .join(Stock, ScoreHistory.stock_id == Stock.id)
+            .where(Stock.ticker == (ticker.upper() if ticker else ""))
+            .where(ScoreHistory.fiscal_year >= min_year)
+        )
 
-            if period_type == "FY":
-                stmt = stmt.where(ScoreHistory.fiscal_period == "FY")
-            else:
-                stmt = stmt.where(ScoreHistory.fiscal_period.in_(["Q1", "Q2", "Q3", "Q4"]))
+        if period_type == "FY":
+            stmt = stmt.where(ScoreHistory.fiscal_period == "FY")
+        else:
+            stmt = stmt.where(ScoreHistory.fiscal_period.in_(["Q1", "Q2", "Q3", "Q4"]))
 
-            results = session.exec(
+        with get_session() as session:
+            rows = session.exec(
                 stmt.order_by(
                     ScoreHistory.fiscal_year.desc(), ScoreHistory.fiscal_period.desc()
                 )
             ).all()
 
-            return [
-                ScoreHistoryRecord(
-                    fiscal_year=r.fiscal_year,
-                    fiscal_period=r.fiscal_period,
-                    piotroski_score=r.piotroski_score,
-                    piotroski_profitability=r.piotroski_profitability,
-                    piotroski_leverage=r.piotroski_leverage,
-                    piotroski_efficiency=r.piotroski_efficiency,
-                    altman_z_score=r.altman_z_score,
-                    altman_zone=r.altman_zone,
-                    recorded_at=r.recorded_at,
-                )
-                for r in results
-            ]
+        return [ScoreHistoryRecord(*row) for row in rows]
 
     def calculate_trend(self, ticker: str, periods: int = 4) -> Optional[TrendResult]:
         """
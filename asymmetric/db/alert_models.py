@@ -9,6 +9,7 @@ Defines the schema for:
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -28,6 +29,10 @@ class Alert(SQLModel, table=True):
     """
 
     __tablename__ = "alerts"
+    __table_args__ = (
+        # Alert list filters by stock and active status together
+        Index("ix_alerts_stock_active", "stock_id", "is_active"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     stock_id: int = Field(foreign_key="stocks.id", index=True)
@@ -99,6 +99,17 @@ def init_db() -> None:
     logger.info("Database tables initialized")
 
 
+# (table, index name, column list) for indexes declared in model
+# __table_args__ that create_all() will not add to existing tables.
+_INDEX_MIGRATIONS = (
+    # Filtered alert lists
+    ("alerts", "ix_alerts_stock_active", "stock_id, is_active"),
+    # Transaction history, newest first, optionally per ticker
+    ("transactions", "ix_transactions_stock_date", "stock_id, transaction_date"),
+    ("transactions", "ix_transactions_date", "transaction_date"),
+)
+
+
 def _run_migrations(engine) -> None:
     """Apply schema migrations for columns added after initial table creation.
 
@@ -123,6 +134,19 @@ def _run_migrations(engine) -> None:
                 )
             logger.info("Migration: added 'status' column to holdings table")
 
+    # --- composite indexes added after initial table creation ---
+    table_names = set(inspector.get_table_names())
+    for table, index_name, columns in _INDEX_MIGRATIONS:
+        if table not in table_names:
+            continue
+        indexes = {i["name"] for i in inspector.get_indexes(table)}
+        if index_name not in indexes:
+            with engine.begin() as conn:
+                conn.execute(
+                    text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})")
+                )
+            logger.info(f"Migration: added {index_name} index to {table} table")
+
 
 @contextmanager
 def get_session() -> Generator[Session, None, None]:
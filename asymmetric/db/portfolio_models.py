@@ -15,6 +15,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -30,6 +31,11 @@ class Transaction(SQLModel, table=True):
     """
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Transaction history lists newest first, optionally for one stock
+        Index("ix_transactions_stock_date", "stock_id", "transaction_date"),
+        Index("ix_transactions_date", "transaction_date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     stock_id: int = Field(foreign_key="stocks.id", index=True)
@@ -12,7 +12,10 @@ from dashboard.components.decisions.cards import (
     render_decision_card,
     render_decision_detail,
     render_decision_form,
+    render_decisions_table,
+    render_page_picker,
     render_status_badge,
+    render_theses_table,
     render_thesis_card,
     render_thesis_detail,
     render_thesis_edit_form,
@@ -30,7 +33,10 @@ __all__ = [
     "render_decision_card",
     "render_decision_detail",
     "render_decision_form",
+    "render_decisions_table",
+    "render_page_picker",
     "render_status_badge",
+    "render_theses_table",
     "render_thesis_card",
     "render_thesis_detail",
     "render_thesis_edit_form",
@@ -1,14 +1,12 @@
 """Analytics tab — decision-making track record analysis."""
 
-import plotly.express as px
 import streamlit as st
 
 from dashboard.theme import get_plotly_theme, get_semantic_color
-from dashboard.utils.decisions import (
-    analyze_by_conviction,
-    calculate_portfolio_return,
-    get_decisions_with_outcomes,
-)
+from dashboard.utils.decisions import analyze_by_conviction, calculate_what_if_returns
+from dashboard.utils.decisions_cache import get_cached_decisions_with_outcomes
+
+MAX_LESSONS_SHOWN = 10
 
 
 def render_analytics_tab() -> None:
@@ -16,7 +14,7 @@ def render_analytics_tab() -> None:
     st.subheader("Decision Analytics")
     st.caption("Analyze your decision-making track record")
 
-    decisions_with_outcomes = get_decisions_with_outcomes(limit=1000)
+    decisions_with_outcomes = get_cached_decisions_with_outcomes(limit=1000)
 
     if len(decisions_with_outcomes) < 5:
         st.info("""
@@ -49,6 +47,8 @@ Analytics will show:
 
 def _render_conviction_chart(conviction_analysis) -> None:
     """Render hit rate by conviction level chart."""
+    import plotly.express as px
+
     st.markdown("**Hit Rate by Conviction Level**")
     st.caption("Does higher conviction correlate with better outcomes?")
 
@@ -92,30 +92,27 @@ def _render_what_if_analysis(decisions_with_outcomes: list) -> None:
     st.markdown("**What-If Analysis**")
     st.caption("How would returns differ if you only acted on high-conviction ideas?")
 
-    all_return = calculate_portfolio_return(decisions_with_outcomes, conviction_min=1)
-    high_conviction_return = calculate_portfolio_return(decisions_with_outcomes, conviction_min=4)
-    very_high_conviction_return = calculate_portfolio_return(decisions_with_outcomes, conviction_min=5)
-
-    all_count = sum(1 for d in decisions_with_outcomes if d.get("confidence", 3) >= 1)
-    high_count = sum(1 for d in decisions_with_outcomes if d.get("confidence", 3) >= 4)
-    very_high_count = sum(1 for d in decisions_with_outcomes if d.get("confidence", 3) >= 5)
+    what_if = calculate_what_if_returns(decisions_with_outcomes, conviction_mins=(1, 4, 5))
+    all_return = what_if[1]["avg_return"]
+    high_conviction_return = what_if[4]["avg_return"]
+    very_high_conviction_return = what_if[5]["avg_return"]
 
     st.metric(
         "All Decisions (1-5)",
         f"{all_return:.1f}%",
-        help=f"Average return across {all_count} decisions",
+        help=f"Average return across {what_if[1]['decision_count']} decisions",
     )
     st.metric(
         "High Conviction Only (4-5)",
         f"{high_conviction_return:.1f}%",
         delta=f"{high_conviction_return - all_return:+.1f}%",
-        help=f"Average return across {high_count} high-conviction decisions",
+        help=f"Average return across {what_if[4]['decision_count']} high-conviction decisions",
     )
     st.metric(
         "Very High Conviction Only (5)",
         f"{very_high_conviction_return:.1f}%",
         delta=f"{very_high_conviction_return - all_return:+.1f}%",
-        help=f"Average return across {very_high_count} very-high-conviction decisions",
+        help=f"Average return across {what_if[5]['decision_count']} very-high-conviction decisions",
     )
 
     st.divider()
@@ -141,17 +138,22 @@ def _render_lessons_learned(decisions_with_outcomes: list) -> None:
     st.markdown("**Common Lessons Learned**")
     st.caption("Aggregated insights from your decision outcomes")
 
-    lessons = [
-        d.get("lessons_learned")
-        for d in decisions_with_outcomes
-        if d.get("lessons_learned")
-    ]
-
-    if lessons:
-        with st.expander(f"View {len(lessons)} lesson(s)"):
-            for i, lesson in enumerate(lessons[:10], 1):
+    # Single pass: count every lesson but keep only the first few for display
+    total_lessons = 0
+    shown_lessons = []
+    for decision in decisions_with_outcomes:
+        lesson = decision.get("lessons_learned")
+        if not lesson:
+            continue
+        total_lessons += 1
+        if len(shown_lessons) < MAX_LESSONS_SHOWN:
+            shown_lessons.append(lesson)
+
+    if total_lessons:
+        with st.expander(f"View {total_lessons} lesson(s)"):
+            for i, lesson in enumerate(shown_lessons, 1):
                 st.markdown(f"{i}. {lesson}")
-            if len(lessons) > 10:
-                st.caption(f"...and {len(lessons) - 10} more")
+            if total_lessons > MAX_LESSONS_SHOWN:
+                st.caption(f"...and {total_lessons - MAX_LESSONS_SHOWN} more")
     else:
         st.info("No lessons recorded yet. Add lessons in the 'Review Outcomes' tab.")
@@ -6,6 +6,7 @@ following the same patterns as score_display.py and comparison.py.
 
 from typing import Any, Optional
 
+import pandas as pd
 import streamlit as st
 
 from dashboard.components import icons
@@ -175,6 +176,157 @@ def render_thesis_card(
                 st.rerun()
 
 
+def render_decisions_table(decisions: list[dict[str, Any]]) -> None:
+    """
+    Render the decision log as one table plus a detail picker.
+
+    A single dataframe replaces a card (and its widgets) per decision;
+    full details open in the sidebar via render_decision_detail().
+
+    Args:
+        decisions: Decision dicts from get_decisions().
+    """
+    labels = {}
+    rows = {
+        "Ticker": [],
+        "Action": [],
+        "Confidence": [],
+        "Target": [],
+        "Stop Loss": [],
+        "Thesis": [],
+        "Decided": [],
+    }
+    for decision in decisions:
+        action_label = DECISION_ACTIONS.get(
+            decision.get("action", "pass"), DECISION_ACTIONS["pass"]
+        )["label"]
+        date_str = format_date(decision.get("decided_at"))
+        labels[decision["id"]] = f"{decision.get('ticker', '?')} | {action_label} | {date_str}"
+
+        rows["Ticker"].append(decision.get("ticker", "?"))
+        rows["Action"].append(action_label)
+        rows["Confidence"].append(decision.get("confidence"))
+        rows["Target"].append(decision.get("target_price"))
+        rows["Stop Loss"].append(decision.get("stop_loss"))
+        rows["Thesis"].append(decision.get("thesis_summary", ""))
+        rows["Decided"].append(date_str)
+
+    st.dataframe(
+        pd.DataFrame(rows),
+        column_config={
+            "Confidence": st.column_config.NumberColumn("Confidence", format="%d/5"),
+            "Target": st.column_config.NumberColumn("Target", format="$%.2f"),
+            "Stop Loss": st.column_config.NumberColumn("Stop Loss", format="$%.2f"),
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+
+    _render_detail_picker(labels, "selected_decision_id", "View Full Details", "decision")
+
+
+def render_theses_table(theses: list[dict[str, Any]]) -> None:
+    """
+    Render the thesis library as one table plus a detail picker.
+
+    Args:
+        theses: Thesis dicts from get_theses().
+    """
+    labels = {}
+    rows = {
+        "Ticker": [],
+        "Status": [],
+        "Summary": [],
+        "Decisions": [],
+        "Source": [],
+        "Created": [],
+    }
+    for thesis in theses:
+        status_label = THESIS_STATUS.get(
+            thesis.get("status", "draft"), THESIS_STATUS["draft"]
+        )["label"]
+        labels[thesis["id"]] = f"{thesis.get('ticker', '?')} | {status_label} | #{thesis['id']}"
+
+        rows["Ticker"].append(thesis.get("ticker", "?"))
+        rows["Status"].append(status_label)
+        rows["Summary"].append(thesis.get("summary") or "No summary")
+        rows["Decisions"].append(thesis.get("decision_count", 0))
+        rows["Source"].append(
+            f"AI: {thesis.get('ai_model') or 'unknown'}" if thesis.get("ai_generated") else "Manual"
+        )
+        rows["Created"].append(format_date(thesis.get("created_at")))
+
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+    _render_detail_picker(labels, "selected_thesis_id", "View Full Thesis", "thesis")
+
+
+def render_page_picker(total: int, page_size: int, key: str) -> int:
+    """
+    Render a page-number input for a paginated list.
+
+    Nothing is rendered when everything fits on one page. A stored page
+    past the end (e.g. after a filter narrows the list) is clamped first.
+
+    Args:
+        total: Total number of matching rows.
+        page_size: Rows per page.
+        key: Session state key for the page number.
+
+    Returns:
+        Row offset of the selected page.
+    """
+    page_count = max(1, -(-total // page_size))
+    if st.session_state.get(key, 1) > page_count:
+        st.session_state[key] = page_count
+    if page_count == 1:
+        return 0
+
+    page = st.number_input(
+        f"Page (of {page_count})",
+        min_value=1,
+        max_value=page_count,
+        step=1,
+        key=key,
+    )
+    return (int(page) - 1) * page_size
+
+
+def _render_detail_picker(
+    labels: dict[int, str],
+    state_key: str,
+    button_label: str,
+    kind: str,
+) -> None:
+    """Render a selectbox + button that opens one row's detail in the sidebar."""
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        choice = st.selectbox(
+            f"Select {kind}",
+            options=list(labels),
+            format_func=labels.get,
+            label_visibility="collapsed",
+            key=f"{kind}_detail_choice",
+        )
+    with col2:
+        # on_click runs before the next script pass, so the sidebar picks up
+        # the selection without an explicit st.rerun()
+        st.button(
+            button_label,
+            use_container_width=True,
+            key=f"view_{kind}_detail",
+            on_click=_open_detail,
+            args=(state_key, choice),
+        )
+
+
+def _open_detail(state_key: str, entity_id: int) -> None:
+    """Button callback: show one detail view in the sidebar, closing the other."""
+    st.session_state.selected_decision_id = None
+    st.session_state.selected_thesis_id = None
+    st.session_state[state_key] = entity_id
+
+
 def render_thesis_detail(thesis: dict[str, Any]) -> None:
     """
     Render full thesis details.
@@ -2,59 +2,110 @@
 
 import streamlit as st
 
-from dashboard.components.decisions.cards import render_decision_card, render_decision_form
-from dashboard.config import DECISION_ACTIONS, DECISIONS_PAGE_LIMIT
-from dashboard.utils.decisions import create_decision, get_decisions, get_theses
+from dashboard.components.decisions.cards import (
+    render_decision_form,
+    render_decisions_table,
+    render_page_picker,
+)
+from dashboard.config import DECISION_ACTIONS, DECISIONS_PAGE_LIMIT, DECISIONS_VIEW_KEY
+from dashboard.utils.decisions import create_decision
+from dashboard.utils.decisions_cache import (
+    clear_decisions_cache,
+    get_cached_active_theses,
+    get_cached_decision_count,
+    get_cached_decisions,
+)
 
+_ACTION_OPTIONS = ("all", "buy", "hold", "sell", "pass")
 
-def render_decisions_tab(ticker_options: list[str]) -> None:
+
+def _format_action(action: str) -> str:
+    """Label for the action filter options."""
+    return "All Actions" if action == "all" else DECISION_ACTIONS[action]["label"]
+
+
+def _format_ticker(ticker: str) -> str:
+    """Label for the ticker filter options."""
+    return "All Tickers" if ticker == "" else ticker
+
+
+def _open_decision_form() -> None:
+    """Button callback: show the decision form (and hide the thesis form)."""
+    st.session_state.show_decision_form = True
+    st.session_state.show_thesis_form = False
+
+
+def _close_decision_form() -> None:
+    """Button callback: hide the decision form."""
+    st.session_state.show_decision_form = False
+
+
+def _show_theses_view() -> None:
+    """Button callback: switch to the Theses Library view."""
+    st.session_state[DECISIONS_VIEW_KEY] = "Theses Library"
+
+
+def render_decisions_tab(ticker_options: tuple[str, ...]) -> None:
     """Render the My Decisions tab.
 
     Args:
-        ticker_options: List of ticker symbols for filter dropdown.
+        ticker_options: Ticker symbols for the filter dropdown ("" first for all).
     """
-    # Filters row
-    col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
-
-    with col1:
-        action_filter = st.selectbox(
-            "Filter by Action",
-            options=["all", "buy", "hold", "sell", "pass"],
-            format_func=lambda x: "All Actions" if x == "all" else DECISION_ACTIONS[x]["label"],
-            key="filter_action",
-        )
-        st.session_state.decision_action_filter = action_filter
-
-    with col2:
-        ticker_filter = st.selectbox(
-            "Filter by Ticker",
-            options=ticker_options,
-            format_func=lambda x: "All Tickers" if x == "" else x,
-            key="filter_ticker",
-        )
-        st.session_state.decision_ticker_filter = ticker_filter
+    # Filters row — the form applies both filters in one rerun and one query
+    col_filters, col3, col4 = st.columns([5, 1, 1])
+
+    with col_filters, st.form("decision_filters", border=False):
+        col1, col2, col_apply = st.columns([2, 2, 1])
+
+        with col1:
+            action_filter = st.selectbox(
+                "Filter by Action",
+                options=_ACTION_OPTIONS,
+                format_func=_format_action,
+                key="filter_action",
+            )
+            st.session_state.decision_action_filter = action_filter
+
+        with col2:
+            ticker_filter = st.selectbox(
+                "Filter by Ticker",
+                options=ticker_options,
+                format_func=_format_ticker,
+                key="filter_ticker",
+            )
+            st.session_state.decision_ticker_filter = ticker_filter
+
+        with col_apply:
+            st.write("")  # Spacer
+            st.write("")
+            st.form_submit_button("Apply", use_container_width=True)
 
     with col3:
+        # The click already reruns the script; just drop this tab's cached list
         if st.button("Refresh", use_container_width=True, key="refresh_decisions"):
-            st.rerun()
+            get_cached_decisions.clear()
+            get_cached_decision_count.clear()
 
     with col4:
-        if st.button("New Decision", type="primary", use_container_width=True):
-            st.session_state.show_decision_form = True
-            st.session_state.show_thesis_form = False
-            st.rerun()
+        st.button(
+            "New Decision",
+            type="primary",
+            use_container_width=True,
+            on_click=_open_decision_form,
+        )
 
     st.divider()
 
     # Show create form if requested
     if st.session_state.show_decision_form:
-        available_theses = get_theses(status="active", limit=50)
+        available_theses = get_cached_active_theses(limit=50)
         form_data = render_decision_form(available_theses=available_theses)
 
         if form_data:
             try:
                 decision_id = create_decision(**form_data)
                 st.success(f"Decision recorded! ID: {decision_id}")
+                clear_decisions_cache()
                 st.session_state.show_decision_form = False
                 st.rerun()
             except ValueError as e:
@@ -62,25 +113,27 @@ def render_decisions_tab(ticker_options: list[str]) -> None:
             except Exception as e:
                 st.error(f"Failed to create decision: {e}")
 
-        if st.button("Cancel", key="cancel_decision_form"):
-            st.session_state.show_decision_form = False
-            st.rerun()
+        st.button("Cancel", key="cancel_decision_form", on_click=_close_decision_form)
 
         st.divider()
 
-    # Fetch and display decisions
-    decisions = get_decisions(
-        action=action_filter if action_filter != "all" else None,
-        ticker=ticker_filter if ticker_filter else None,
+    # Fetch and display one page of decisions
+    action = action_filter if action_filter != "all" else None
+    ticker = ticker_filter if ticker_filter else None
+    total = get_cached_decision_count(action=action, ticker=ticker)
+    offset = render_page_picker(total, DECISIONS_PAGE_LIMIT, key="decisions_page")
+    decisions = get_cached_decisions(
+        action=action,
+        ticker=ticker,
         limit=DECISIONS_PAGE_LIMIT,
+        offset=offset,
     )
 
     if not decisions:
         st.info("No decisions recorded yet. Click 'New Decision' to create one.")
     else:
-        st.caption(f"Showing {len(decisions)} decision(s)")
-        for decision in decisions:
-            render_decision_card(decision)
+        st.caption(f"Showing {offset + 1}-{offset + len(decisions)} of {total} decision(s)")
+        render_decisions_table(decisions)
 
     # Quick actions
     if decisions:
@@ -89,8 +142,7 @@ def render_decisions_tab(ticker_options: list[str]) -> None:
         action_cols = st.columns(3)
 
         with action_cols[0]:
-            if st.button("View Theses", use_container_width=True):
-                st.info("Switch to the 'Theses Library' tab above")
+            st.button("View Theses", use_container_width=True, on_click=_show_theses_view)
 
         with action_cols[1]:
             if st.button("Go to Compare", use_container_width=True):
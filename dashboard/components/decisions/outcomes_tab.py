@@ -1,20 +1,28 @@
 """Outcomes tab — review and record decision outcomes."""
 
+import pandas as pd
 import streamlit as st
 
-from dashboard.utils.decisions import (
-    get_decisions,
-    get_decisions_with_outcomes,
-    update_decision_outcome,
+from dashboard.utils.decisions import update_decision_outcome
+from dashboard.utils.decisions_cache import (
+    clear_decisions_cache,
+    get_cached_decisions_with_outcomes,
+    get_cached_review_decisions,
 )
 
+_OUTCOME_OPTIONS = ("success", "partial", "failure", "ongoing")
+
+_READ_ONLY_COLUMNS = ("id", "ticker", "action", "confidence", "decided_at", "target_price")
+_EDITABLE_COLUMNS = ("outcome", "actual_price", "lessons", "hit")
+_OUTCOME_COLUMNS = [*_READ_ONLY_COLUMNS, *_EDITABLE_COLUMNS]
+
 
 def render_outcomes_tab() -> None:
     """Render the Review Outcomes tab."""
     st.subheader("Review Decision Outcomes")
     st.caption("Record what actually happened for retrospective analysis")
 
-    all_decisions = get_decisions(limit=100)
+    all_decisions, ticker_options = get_cached_review_decisions(limit=100)
 
     if not all_decisions:
         st.info("No decisions recorded yet. Create decisions first, then return here to review outcomes.")
@@ -23,7 +31,7 @@ def render_outcomes_tab() -> None:
     # Filter controls
     ticker_filter_outcomes = st.selectbox(
         "Filter by Ticker",
-        options=[""] + sorted(set(d["ticker"] for d in all_decisions)),
+        options=ticker_options,
         format_func=lambda x: "All Tickers" if x == "" else x,
         key="outcome_ticker_filter",
     )
@@ -37,7 +45,9 @@ def render_outcomes_tab() -> None:
     ]
 
     if not show_all:
-        decisions_with_outcome_ids = {d["id"] for d in get_decisions_with_outcomes(limit=1000)}
+        decisions_with_outcome_ids = {
+            d["id"] for d in get_cached_decisions_with_outcomes(limit=1000)
+        }
         decisions_to_review = [
             d for d in decisions_to_review
             if d["id"] not in decisions_with_outcome_ids
@@ -51,76 +61,102 @@ def render_outcomes_tab() -> None:
         return
 
     st.caption(f"Showing {len(decisions_to_review)} decision(s)")
+    st.caption("Pick an outcome for each decision you want to record, then save once.")
+
+    edit_df = _build_outcome_frame(decisions_to_review)
+
+    # One editor inside one form: edits don't trigger reruns until "Save Outcomes"
+    with st.form("outcomes_editor_form"):
+        edited_df = st.data_editor(
+            edit_df,
+            column_config={
+                "id": st.column_config.NumberColumn("ID", format="%d"),
+                "ticker": st.column_config.TextColumn("Ticker"),
+                "action": st.column_config.TextColumn("Action"),
+                "confidence": st.column_config.NumberColumn("Confidence", format="%d/5"),
+                "decided_at": st.column_config.TextColumn("Decided"),
+                "target_price": st.column_config.NumberColumn("Target", format="$%.2f"),
+                "outcome": st.column_config.SelectboxColumn(
+                    "Outcome", options=list(_OUTCOME_OPTIONS)
+                ),
+                "actual_price": st.column_config.NumberColumn(
+                    "Actual Price ($)", min_value=0.0, step=1.0, format="%.2f"
+                ),
+                "lessons": st.column_config.TextColumn("Lessons Learned"),
+                "hit": st.column_config.CheckboxColumn("Hit"),
+            },
+            disabled=list(_READ_ONLY_COLUMNS),
+            num_rows="fixed",
+            hide_index=True,
+            use_container_width=True,
+            key="outcomes_editor",
+        )
+        submitted = st.form_submit_button("Save Outcomes", type="primary")
+
+    if not submitted:
+        return
+
+    changes = _collect_outcomes(edited_df)
+    if not changes:
+        st.info("No outcomes selected. Choose an outcome for at least one decision.")
+        return
+
+    failed = [change["decision_id"] for change in changes if not update_decision_outcome(**change)]
+    if failed:
+        st.error(f"Failed to save outcome for decision(s): {', '.join(map(str, failed))}")
+        return
+
+    st.success(f"Recorded {len(changes)} outcome(s)!")
+    clear_decisions_cache()
+    # Drop the editor's pending edits so they don't re-apply to the refreshed rows
+    st.session_state.pop("outcomes_editor", None)
+    st.rerun()
+
+
+def _build_outcome_frame(decisions: list[dict]) -> pd.DataFrame:
+    """Build the editable outcome-review frame, one row per decision."""
+    return pd.DataFrame(
+        {
+            "id": [d["id"] for d in decisions],
+            "ticker": [d["ticker"] for d in decisions],
+            "action": [d["action"].upper() for d in decisions],
+            "confidence": [d.get("confidence") for d in decisions],
+            "decided_at": [(d.get("decided_at") or "N/A")[:10] for d in decisions],
+            "target_price": [d.get("target_price") for d in decisions],
+            "outcome": pd.Series([None] * len(decisions), dtype="object"),
+            "actual_price": [d.get("target_price") for d in decisions],
+            "lessons": [""] * len(decisions),
+            "hit": [False] * len(decisions),
+        },
+        columns=_OUTCOME_COLUMNS,
+    )
+
 
-    for decision in decisions_to_review:
-        with st.expander(
-            f"**{decision['ticker']}** \u2014 {decision['action'].upper()} "
-            f"({decision.get('decided_at', 'N/A')[:10]})"
-        ):
-            col1, col2 = st.columns([2, 1])
-
-            with col1:
-                st.markdown(f"**Company:** {decision.get('company_name', 'N/A')}")
-                st.markdown(f"**Action:** {decision['action'].upper()}")
-                st.markdown(f"**Confidence:** {decision.get('confidence', 'N/A')}/5")
-                if decision.get("target_price"):
-                    st.markdown(f"**Target Price:** ${decision['target_price']:.2f}")
-                st.markdown(f"**Rationale:** {decision.get('rationale', 'N/A')[:200]}...")
-
-            with col2:
-                st.markdown(f"**Decision ID:** {decision['id']}")
-                st.markdown(f"**Decided:** {decision.get('decided_at', 'N/A')[:10]}")
-
-            st.divider()
-
-            # Outcome entry form
-            with st.form(f"outcome_form_{decision['id']}"):
-                st.markdown("**Record Outcome**")
-
-                outcome_col1, outcome_col2 = st.columns(2)
-
-                with outcome_col1:
-                    actual_outcome = st.selectbox(
-                        "Outcome",
-                        options=["success", "partial", "failure", "ongoing"],
-                        format_func=lambda x: x.title(),
-                        key=f"outcome_{decision['id']}",
-                    )
-
-                with outcome_col2:
-                    actual_price = st.number_input(
-                        "Actual Price ($)",
-                        min_value=0.0,
-                        value=decision.get("target_price", 100.0) or 100.0,
-                        step=1.0,
-                        format="%.2f",
-                        key=f"price_{decision['id']}",
-                    )
-
-                lessons_learned = st.text_area(
-                    "Lessons Learned",
-                    placeholder="What did you learn from this decision? What would you do differently?",
-                    height=100,
-                    key=f"lessons_{decision['id']}",
-                )
-
-                hit = st.checkbox(
-                    "Thesis proved correct (hit)",
-                    value=actual_outcome == "success",
-                    key=f"hit_{decision['id']}",
-                )
-
-                if st.form_submit_button("Save Outcome", type="primary"):
-                    success = update_decision_outcome(
-                        decision_id=decision["id"],
-                        actual_outcome=actual_outcome,
-                        actual_price=actual_price if actual_price > 0 else None,
-                        lessons_learned=lessons_learned if lessons_learned else None,
-                        hit=hit,
-                    )
-
-                    if success:
-                        st.success("Outcome recorded!")
-                        st.rerun()
-                    else:
-                        st.error("Failed to save outcome")
+def _collect_outcomes(edited: pd.DataFrame) -> list[dict]:
+    """Build outcome updates from the edited review frame.
+
+    Rows start with no outcome, so only rows where the user picked one are
+    returned and untouched rows never hit the database.
+
+    Args:
+        edited: Frame returned by st.data_editor.
+
+    Returns:
+        List of keyword-argument dicts for update_decision_outcome().
+    """
+    changes = []
+    for decision_id, outcome, actual_price, lessons, hit in edited[
+        ["id", *_EDITABLE_COLUMNS]
+    ].itertuples(index=False):
+        if not outcome:
+            continue
+
+        price = None if pd.isna(actual_price) else float(actual_price)
+        changes.append({
+            "decision_id": int(decision_id),
+            "actual_outcome": outcome,
+            "actual_price": price if price and price > 0 else None,
+            "lessons_learned": lessons if lessons else None,
+            "hit": bool(hit),
+        })
+    return changes
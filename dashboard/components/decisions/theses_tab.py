@@ -3,55 +3,108 @@
 import streamlit as st
 
 from dashboard.components.decisions.cards import (
-    render_thesis_card,
+    render_page_picker,
+    render_theses_table,
     render_thesis_edit_form,
     render_thesis_form,
 )
-from dashboard.config import THESIS_STATUS, THESES_PAGE_LIMIT
+from dashboard.config import DECISIONS_VIEW_KEY, THESIS_STATUS, THESES_PAGE_LIMIT
 from dashboard.utils.decisions import (
     create_thesis,
-    get_theses,
-    get_thesis_by_id,
     update_thesis,
 )
+from dashboard.utils.decisions_cache import (
+    clear_decisions_cache,
+    get_cached_entities,
+    get_cached_theses,
+    get_cached_thesis_count,
+)
+
+_STATUS_OPTIONS = ("all", "draft", "active", "archived")
+
+
+def _format_status(status: str) -> str:
+    """Label for the status filter options."""
+    return "All Statuses" if status == "all" else THESIS_STATUS[status]["label"]
+
+
+def _format_ticker(ticker: str) -> str:
+    """Label for the ticker filter options."""
+    return "All Tickers" if ticker == "" else ticker
+
+
+def _open_thesis_form() -> None:
+    """Button callback: show the thesis form (and hide the decision form)."""
+    st.session_state.show_thesis_form = True
+    st.session_state.show_decision_form = False
+
+
+def _close_thesis_form() -> None:
+    """Button callback: hide the thesis form."""
+    st.session_state.show_thesis_form = False
 
 
-def render_theses_tab(ticker_options: list[str]) -> None:
+def _cancel_thesis_edit() -> None:
+    """Button callback: close the thesis edit form."""
+    st.session_state.editing_thesis_id = None
+
+
+def _record_decision() -> None:
+    """Button callback: open the decision form in the My Decisions view."""
+    st.session_state.show_decision_form = True
+    st.session_state.show_thesis_form = False
+    # The decision form lives in the My Decisions view
+    st.session_state[DECISIONS_VIEW_KEY] = "My Decisions"
+
+
+def render_theses_tab(ticker_options: tuple[str, ...]) -> None:
     """Render the Theses Library tab.
 
     Args:
-        ticker_options: List of ticker symbols for filter dropdown.
+        ticker_options: Ticker symbols for the filter dropdown ("" first for all).
     """
-    # Filters row
-    col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
-
-    with col1:
-        status_filter = st.selectbox(
-            "Filter by Status",
-            options=["all", "draft", "active", "archived"],
-            format_func=lambda x: "All Statuses" if x == "all" else THESIS_STATUS[x]["label"],
-            key="filter_thesis_status",
-        )
-        st.session_state.thesis_status_filter = status_filter
-
-    with col2:
-        thesis_ticker_filter = st.selectbox(
-            "Filter by Ticker",
-            options=ticker_options,
-            format_func=lambda x: "All Tickers" if x == "" else x,
-            key="filter_thesis_ticker",
-        )
-        st.session_state.thesis_ticker_filter = thesis_ticker_filter
+    # Filters row — the form applies both filters in one rerun and one query
+    col_filters, col3, col4 = st.columns([5, 1, 1])
+
+    with col_filters, st.form("thesis_filters", border=False):
+        col1, col2, col_apply = st.columns([2, 2, 1])
+
+        with col1:
+            status_filter = st.selectbox(
+                "Filter by Status",
+                options=_STATUS_OPTIONS,
+                format_func=_format_status,
+                key="filter_thesis_status",
+            )
+            st.session_state.thesis_status_filter = status_filter
+
+        with col2:
+            thesis_ticker_filter = st.selectbox(
+                "Filter by Ticker",
+                options=ticker_options,
+                format_func=_format_ticker,
+                key="filter_thesis_ticker",
+            )
+            st.session_state.thesis_ticker_filter = thesis_ticker_filter
+
+        with col_apply:
+            st.write("")  # Spacer
+            st.write("")
+            st.form_submit_button("Apply", use_container_width=True)
 
     with col3:
+        # The click already reruns the script; just drop this tab's cached list
         if st.button("Refresh", use_container_width=True, key="refresh_theses"):
-            st.rerun()
+            get_cached_theses.clear()
+            get_cached_thesis_count.clear()
 
     with col4:
-        if st.button("New Thesis", type="primary", use_container_width=True):
-            st.session_state.show_thesis_form = True
-            st.session_state.show_decision_form = False
-            st.rerun()
+        st.button(
+            "New Thesis",
+            type="primary",
+            use_container_width=True,
+            on_click=_open_thesis_form,
+        )
 
     st.divider()
 
@@ -63,20 +116,20 @@ def render_theses_tab(ticker_options: list[str]) -> None:
             try:
                 thesis_id = create_thesis(**form_data)
                 st.success(f"Thesis created! ID: {thesis_id}")
+                clear_decisions_cache()
                 st.session_state.show_thesis_form = False
                 st.rerun()
             except Exception as e:
                 st.error(f"Failed to create thesis: {e}")
 
-        if st.button("Cancel", key="cancel_thesis_form"):
-            st.session_state.show_thesis_form = False
-            st.rerun()
+        st.button("Cancel", key="cancel_thesis_form", on_click=_close_thesis_form)
 
         st.divider()
 
     # Show edit form if requested
     if st.session_state.editing_thesis_id:
-        thesis_to_edit = get_thesis_by_id(st.session_state.editing_thesis_id)
+        editing_id = st.session_state.editing_thesis_id
+        thesis_to_edit = get_cached_entities((), (editing_id,))[1].get(editing_id)
         if thesis_to_edit:
             form_data = render_thesis_edit_form(thesis_to_edit)
 
@@ -84,6 +137,7 @@ def render_theses_tab(ticker_options: list[str]) -> None:
                 try:
                     thesis_id = form_data.pop("thesis_id")
                     success = update_thesis(thesis_id, **form_data)
+                    clear_decisions_cache()
                     if success:
                         st.success("Thesis updated!")
                         st.session_state.editing_thesis_id = None
@@ -97,27 +151,29 @@ def render_theses_tab(ticker_options: list[str]) -> None:
                     st.session_state.editing_thesis_id = None
                     st.rerun()
 
-            if st.button("Cancel Edit", key="cancel_thesis_edit"):
-                st.session_state.editing_thesis_id = None
-                st.rerun()
+            st.button("Cancel Edit", key="cancel_thesis_edit", on_click=_cancel_thesis_edit)
 
             st.divider()
         else:
             st.session_state.editing_thesis_id = None
 
-    # Fetch and display theses
-    theses = get_theses(
-        status=status_filter if status_filter != "all" else None,
-        ticker=thesis_ticker_filter if thesis_ticker_filter else None,
+    # Fetch and display one page of theses
+    status = status_filter if status_filter != "all" else None
+    ticker = thesis_ticker_filter if thesis_ticker_filter else None
+    total = get_cached_thesis_count(status=status, ticker=ticker)
+    offset = render_page_picker(total, THESES_PAGE_LIMIT, key="theses_page")
+    theses = get_cached_theses(
+        status=status,
+        ticker=ticker,
         limit=THESES_PAGE_LIMIT,
+        offset=offset,
     )
 
     if not theses:
         st.info("No theses created yet. Click 'New Thesis' or generate one from the Compare page.")
     else:
-        st.caption(f"Showing {len(theses)} thesis/theses")
-        for thesis in theses:
-            render_thesis_card(thesis)
+        st.caption(f"Showing {offset + 1}-{offset + len(theses)} of {total} thesis/theses")
+        render_theses_table(theses)
 
     # Quick actions
     if not theses:
@@ -136,9 +192,7 @@ def render_theses_tab(ticker_options: list[str]) -> None:
         action_cols = st.columns(3)
 
         with action_cols[0]:
-            if st.button("Record Decision", use_container_width=True):
-                st.session_state.show_decision_form = True
-                st.rerun()
+            st.button("Record Decision", use_container_width=True, on_click=_record_decision)
 
         with action_cols[1]:
             if st.button("Generate AI Thesis", use_container_width=True):
@@ -1,11 +1,65 @@
 """Health tab — weighted scores, zone allocation, and health assessment."""
 
-import pandas as pd
-import plotly.express as px
+from datetime import date
+
+import plotly.graph_objects as go
 import streamlit as st
 
 from asymmetric.core.portfolio import PortfolioManager
-from dashboard.theme import get_plotly_theme
+from dashboard.theme import get_plotly_layout
+from dashboard.utils.portfolio_cache import clear_portfolio_cache, get_cached_last_snapshot_date
+
+_ZONES = ("Safe", "Grey", "Distress")
+_ZONE_COLORS = ("green", "orange", "red")
+
+# Health assessment rules, checked in order; the first match wins.
+# F-Score: (minimum weighted F-Score, message, color)
+_FSCORE_ASSESSMENTS = (
+    (7, "Strong financial health across portfolio", "green"),
+    (5, "Moderate financial health - some holdings may need review", "orange"),
+    (float("-inf"), "Weak financial health - consider reviewing underperformers", "red"),
+)
+# Z-Score: (WeightedScores allocation field, threshold % it must exceed, message template, color)
+_ZONE_ASSESSMENTS = (
+    ("distress_allocation", 20, "{:.1f}% in Distress zone - high bankruptcy risk exposure", "red"),
+    ("grey_allocation", 40, "{:.1f}% in Grey zone - moderate uncertainty", "orange"),
+    ("safe_allocation", 60, "{:.1f}% in Safe zone - low bankruptcy risk", "green"),
+)
+
+
+def _health_assessments(weighted_scores) -> list:
+    """Return (metric, assessment, color) lines for the Health Assessment block."""
+    fscore = weighted_scores.weighted_fscore
+    message, color = next((m, c) for floor, m, c in _FSCORE_ASSESSMENTS if fscore >= floor)
+    assessments = [("F-Score", message, color)]
+
+    for field, threshold, template, color in _ZONE_ASSESSMENTS:
+        allocation = getattr(weighted_scores, field)
+        if allocation > threshold:
+            assessments.append(("Z-Score", template.format(allocation), color))
+            break
+    return assessments
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _zone_allocation_bar(safe: float, grey: float, distress: float):
+    """Build the zone allocation bar chart, reused while allocations are unchanged.
+
+    Callers pass the allocations already rounded by get_weighted_scores(),
+    so equal portfolios always hit the same cache entry.
+    """
+    fig = go.Figure(go.Bar(
+        x=_ZONES,
+        y=(safe, grey, distress),
+        marker_color=_ZONE_COLORS,
+    ))
+    fig.update_layout(**get_plotly_layout(
+        showlegend=False,
+        title="Allocation by Z-Score Zone",
+        xaxis={"title": "Zone"},
+        yaxis={"title": "Allocation %"},
+    ))
+    return fig
 
 
 def render_health_tab(
@@ -65,24 +119,11 @@ def render_health_tab(
 
     with col2:
         st.markdown("**Zone Allocation**")
-        zone_data = {
-            "Zone": ["Safe", "Grey", "Distress"],
-            "Allocation %": [
-                weighted_scores.safe_allocation,
-                weighted_scores.grey_allocation,
-                weighted_scores.distress_allocation,
-            ],
-        }
-        zone_df = pd.DataFrame(zone_data)
-
-        fig = px.bar(
-            zone_df,
-            x="Zone",
-            y="Allocation %",
-            color="Zone",
-            color_discrete_map={"Safe": "green", "Grey": "orange", "Distress": "red"},
+        fig = _zone_allocation_bar(
+            weighted_scores.safe_allocation,
+            weighted_scores.grey_allocation,
+            weighted_scores.distress_allocation,
         )
-        fig.update_layout(showlegend=False, title="Allocation by Z-Score Zone", **get_plotly_theme())
         st.plotly_chart(fig, use_container_width=True)
 
     # Score explainer
@@ -106,34 +147,18 @@ A score of **7+** means most signals are positive. Below **4** is a red flag.
     st.divider()
     st.markdown("**Health Assessment**")
 
-    assessments = []
-
-    if weighted_scores.weighted_fscore >= 7:
-        assessments.append(("F-Score", "Strong financial health across portfolio", "green"))
-    elif weighted_scores.weighted_fscore >= 5:
-        assessments.append(("F-Score", "Moderate financial health - some holdings may need review", "orange"))
-    else:
-        assessments.append(("F-Score", "Weak financial health - consider reviewing underperformers", "red"))
-
-    if weighted_scores.distress_allocation > 20:
-        assessments.append(("Z-Score", f"{weighted_scores.distress_allocation:.1f}% in Distress zone - high bankruptcy risk exposure", "red"))
-    elif weighted_scores.grey_allocation > 40:
-        assessments.append(("Z-Score", f"{weighted_scores.grey_allocation:.1f}% in Grey zone - moderate uncertainty", "orange"))
-    elif weighted_scores.safe_allocation > 60:
-        assessments.append(("Z-Score", f"{weighted_scores.safe_allocation:.1f}% in Safe zone - low bankruptcy risk", "green"))
-
-    for metric, assessment, color in assessments:
-        st.markdown(f":{color}[**{metric}**]: {assessment}")
+    assessments = _health_assessments(weighted_scores)
+    st.markdown("\n\n".join(
+        f":{color}[**{metric}**]: {assessment}" for metric, assessment, color in assessments
+    ))
 
     # Take snapshot button
     st.divider()
     if st.button("Take Portfolio Snapshot"):
-        from asymmetric.core.portfolio.snapshot_service import get_last_snapshot_date
-        from datetime import date
-
-        last_date = get_last_snapshot_date()
+        last_date = get_cached_last_snapshot_date()
         if last_date and last_date.date() == date.today():
             st.warning(f"Snapshot already exists for today ({last_date.strftime('%Y-%m-%d %H:%M')}). Only one snapshot per day is recommended.")
         else:
             snapshot = manager.take_snapshot()
+            clear_portfolio_cache()
             st.success(f"Snapshot saved at {snapshot.snapshot_date}")
@@ -8,8 +8,37 @@ from dashboard.utils.performance_charts import (
     create_return_percentage_chart,
     create_portfolio_health_chart,
     create_position_count_chart,
+    snapshot_frame,
+)
+from dashboard.utils.portfolio_cache import (
+    get_cached_performance_stats,
+    get_cached_snapshots,
+    snapshot_fingerprint,
+)
+
+# (heading, caption, builder, error label) for each chart, in display order
+_CHARTS = (
+    ("Portfolio Value Progression", None, create_portfolio_value_chart, "value chart"),
+    (
+        "P&L Attribution",
+        "Unrealized (current positions) vs Realized (closed positions)",
+        create_pnl_attribution_chart,
+        "P&L chart",
+    ),
+    ("Cumulative Return %", None, create_return_percentage_chart, "return chart"),
+    (
+        "Portfolio Health Over Time",
+        "Weighted F-Score and Z-Score based on position sizes",
+        create_portfolio_health_chart,
+        "health chart",
+    ),
+    (
+        "Diversification Trend",
+        "Number of open positions over time",
+        create_position_count_chart,
+        "position count chart",
+    ),
 )
-from dashboard.utils.portfolio_cache import get_cached_snapshots, get_cached_performance_stats
 
 
 def render_historical_tab() -> None:
@@ -30,7 +59,6 @@ def render_historical_tab() -> None:
     with col3:
         if st.button("Refresh Data", key="refresh_snapshots"):
             get_cached_snapshots.clear()
-            get_cached_performance_stats.clear()
             st.rerun()
 
     try:
@@ -114,39 +142,36 @@ def _render_performance_stats(time_range: str) -> None:
     st.divider()
 
 
-def _render_charts(snapshots: list) -> None:
-    """Render all historical charts."""
-    snapshot_dicts = [s.model_dump() for s in snapshots]
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _snapshot_charts(fingerprint: tuple, _snapshots: list) -> tuple:
+    """Build every historical chart once per distinct snapshot series.
 
-    st.markdown("### Portfolio Value Progression")
-    try:
-        st.plotly_chart(create_portfolio_value_chart(snapshot_dicts), use_container_width=True)
-    except Exception as e:
-        st.error(f"Error creating value chart: {e}")
+    Keyed on the snapshot fingerprint, so tab switches and other reruns reuse
+    the figures instead of rebuilding the frame and five Plotly charts.
 
-    st.markdown("### P&L Attribution")
-    st.caption("Unrealized (current positions) vs Realized (closed positions)")
-    try:
-        st.plotly_chart(create_pnl_attribution_chart(snapshot_dicts), use_container_width=True)
-    except Exception as e:
-        st.error(f"Error creating P&L chart: {e}")
+    Returns:
+        One entry per _CHARTS row: the figure, or the error message if the
+        builder failed.
+    """
+    snapshot_df = snapshot_frame(_snapshots)
+    figures = []
+    for _heading, _caption, builder, _label in _CHARTS:
+        try:
+            figures.append(builder(snapshot_df))
+        except Exception as e:
+            figures.append(str(e))
+    return tuple(figures)
 
-    st.markdown("### Cumulative Return %")
-    try:
-        st.plotly_chart(create_return_percentage_chart(snapshot_dicts), use_container_width=True)
-    except Exception as e:
-        st.error(f"Error creating return chart: {e}")
 
-    st.markdown("### Portfolio Health Over Time")
-    st.caption("Weighted F-Score and Z-Score based on position sizes")
-    try:
-        st.plotly_chart(create_portfolio_health_chart(snapshot_dicts), use_container_width=True)
-    except Exception as e:
-        st.error(f"Error creating health chart: {e}")
-
-    st.markdown("### Diversification Trend")
-    st.caption("Number of open positions over time")
-    try:
-        st.plotly_chart(create_position_count_chart(snapshot_dicts), use_container_width=True)
-    except Exception as e:
-        st.error(f"Error creating position count chart: {e}")
+def _render_charts(snapshots: list) -> None:
+    """Render all historical charts."""
+    figures = _snapshot_charts(snapshot_fingerprint(snapshots), snapshots)
+
+    for (heading, caption, _builder, label), fig in zip(_CHARTS, figures):
+        st.markdown(f"### {heading}")
+        if caption:
+            st.caption(caption)
+        if isinstance(fig, str):
+            st.error(f"Error creating {label}: {fig}")
+        else:
+            st.plotly_chart(fig, use_container_width=True)
@@ -7,9 +7,138 @@ import plotly.express as px
 import streamlit as st
 
 from asymmetric.core.portfolio import PortfolioManager
+from dashboard.config import ALLOCATION_PIE_MAX_SLICES
 from dashboard.styles import section_header
 from dashboard.theme import get_plotly_theme, get_plotly_pie_theme, get_plotly_chart_config, get_semantic_color
 
+# Sort keys mirroring PortfolioManager.get_holdings(sort_by=...), applied to the
+# already-fetched holdings so changing the sort never re-queries the database.
+_SORT_KEYS = {
+    "value": lambda h: -(h.market_value if h.market_value is not None else h.cost_basis_total),
+    "gainloss": lambda h: -(
+        h.unrealized_pnl_percent if h.unrealized_pnl_percent is not None else -float("inf")
+    ),
+    "ticker": lambda h: h.ticker,
+    "fscore": lambda h: -(h.fscore or 0),
+}
+_SORT_LABELS = {
+    "value": "Value",
+    "gainloss": "Gain/Loss %",
+    "ticker": "Ticker",
+    "fscore": "F-Score",
+}
+_SORT_OPTIONS = tuple(_SORT_LABELS)
+
+
+HOLDINGS_COLUMNS = (
+    "Ticker",
+    "Company",
+    "Shares",
+    "Cost Basis",
+    "Current Price",
+    "Market Value",
+    "Unrealized P&L",
+    "_pnl_pct",
+    "Allocation %",
+    "Days Held",
+    "F-Score",
+    "Z-Zone",
+)
+
+
+def _holding_row(h) -> tuple:
+    """Build one Holdings table row in HOLDINGS_COLUMNS order.
+
+    Unrealized P&L, F-Score and Z-Zone are left raw; holdings_frame() formats
+    them per column.
+    """
+    return (
+        h.ticker,
+        h.company_name,
+        h.quantity,
+        h.cost_basis_total,
+        h.current_price if h.current_price else 0.0,
+        h.market_value if h.market_value else h.cost_basis_total,
+        h.unrealized_pnl,
+        h.unrealized_pnl_percent if h.unrealized_pnl_percent is not None else 0.0,
+        h.allocation_percent,
+        h.days_held,
+        h.fscore,
+        h.zone,
+    )
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _allocation_pie(values: tuple, names: tuple, name_label: str, title: str):
+    """Build an allocation pie figure, reused while its inputs are unchanged.
+
+    Keyed on the plotted values rather than the DataFrame, so reruns that
+    only touch other widgets skip Plotly figure construction entirely.
+    """
+    chart_df = pd.DataFrame({name_label: names, "Market Value": values})
+    fig = px.pie(chart_df, values="Market Value", names=name_label, title=title)
+    fig.update_traces(textposition="inside", textinfo="percent+label")
+    fig.update_layout(**get_plotly_pie_theme())
+    return fig
+
+
+def _top_positions(df: pd.DataFrame, limit: int) -> pd.Series:
+    """Largest positions by market value, indexed by ticker, for the bar fallback."""
+    return df.set_index("Ticker")["Market Value"].nlargest(limit)
+
+
+def holdings_frame(holdings: list) -> pd.DataFrame:
+    """Build the Holdings table DataFrame.
+
+    Args:
+        holdings: List of HoldingDetail objects, in display order.
+
+    Returns:
+        DataFrame with HOLDINGS_COLUMNS; F-Score shown as "n/9" and missing
+        scores or zones as "N/A".
+    """
+    df = pd.DataFrame.from_records(
+        (_holding_row(h) for h in holdings), columns=HOLDINGS_COLUMNS
+    )
+    df["Unrealized P&L"] = _pnl_text(df["Unrealized P&L"].astype(float), df["_pnl_pct"])
+    fscore = df["F-Score"].astype("Int64").astype("string")
+    df["F-Score"] = (fscore + "/9").fillna("N/A").astype(object)
+    df["Z-Zone"] = df["Z-Zone"].fillna("N/A")
+    return df
+
+
+def _pnl_text(pnl: pd.Series, pnl_pct: pd.Series) -> pd.Series:
+    """Format P&L as "▲ $1,234.56 (+5.0%)" per row, "N/A" where P&L is missing."""
+    arrow = pd.Series("—", index=pnl.index)
+    arrow[pnl > 0] = "▲"
+    arrow[pnl < 0] = "▼"
+    text = arrow + " $" + pnl.map("{:,.2f}".format) + " (" + pnl_pct.map("{:+.1f}%".format) + ")"
+    return text.where(pnl.notna(), "N/A")
+
+
+def _pnl_styles(pnl_pct: pd.Series) -> pd.Series:
+    """Map P&L percentages to CSS color rules for the Unrealized P&L column."""
+    styles = pd.Series("", index=pnl_pct.index)
+    styles[pnl_pct > 0] = f"color: {get_semantic_color('green')}"
+    styles[pnl_pct < 0] = f"color: {get_semantic_color('red')}"
+    return styles
+
+
+def sort_holdings(holdings: list, sort_by: str) -> list:
+    """Return holdings ordered by one of the Holdings tab sort options.
+
+    Args:
+        holdings: List of HoldingDetail objects.
+        sort_by: One of "value", "gainloss", "ticker", "fscore".
+
+    Returns:
+        New sorted list; unknown sort keys keep the original order.
+    """
+    key = _SORT_KEYS.get(sort_by)
+    if key is None:
+        return list(holdings)
+    return sorted(holdings, key=key)
+
 
 def render_holdings_tab(
     holdings: list,
@@ -34,57 +163,20 @@ def render_holdings_tab(
     with col2:
         sort_by = st.selectbox(
             "Sort by",
-            ["value", "gainloss", "ticker", "fscore"],
-            format_func=lambda x: {
-                "value": "Value",
-                "gainloss": "Gain/Loss %",
-                "ticker": "Ticker",
-                "fscore": "F-Score",
-            }.get(x, x),
+            _SORT_OPTIONS,
+            format_func=_SORT_LABELS.get,
+            key="holdings_sort_by",
         )
 
-    # Re-fetch with sort using cached prices (no redundant API call)
-    try:
-        holdings = manager.get_holdings(sort_by=sort_by, market_prices=prices)
-    except Exception as e:
-        st.error(f"Error sorting holdings: {e}")
+    holdings = sort_holdings(holdings, sort_by)
 
     # Holdings table
-    holdings_data = []
-    for h in holdings:
-        if h.unrealized_pnl is not None:
-            arrow = "▲" if h.unrealized_pnl > 0 else "▼" if h.unrealized_pnl < 0 else "—"
-            pnl_text = f"{arrow} ${h.unrealized_pnl:,.2f} ({h.unrealized_pnl_percent:+.1f}%)"
-        else:
-            pnl_text = "N/A"
-
-        holdings_data.append({
-            "Ticker": h.ticker,
-            "Company": h.company_name,
-            "Shares": h.quantity,
-            "Cost Basis": h.cost_basis_total,
-            "Current Price": h.current_price if h.current_price else 0.0,
-            "Market Value": h.market_value if h.market_value else h.cost_basis_total,
-            "Unrealized P&L": pnl_text,
-            "_pnl_pct": h.unrealized_pnl_percent if h.unrealized_pnl_percent is not None else 0.0,
-            "Allocation %": h.allocation_percent,
-            "Days Held": h.days_held,
-            "F-Score": f"{h.fscore}/9" if h.fscore is not None else "N/A",
-            "Z-Zone": h.zone or "N/A",
-        })
-
-    df = pd.DataFrame(holdings_data)
-
-    # Style P&L coloring based on raw numeric value (theme-aware)
-    green = get_semantic_color("green")
-    red = get_semantic_color("red")
-
-    def style_pnl(row):
-        pct = row["_pnl_pct"]
-        color = green if pct > 0 else red if pct < 0 else ""
-        return [f"color: {color}" if col == "Unrealized P&L" and color else "" for col in row.index]
-
-    styled_df = df.style.apply(style_pnl, axis=1)
+    df = holdings_frame(holdings)
+
+    # Style P&L coloring based on raw numeric value (theme-aware); the
+    # helper column is split off so only displayed columns reach the grid
+    pnl_styles = _pnl_styles(df.pop("_pnl_pct"))
+    styled_df = df.style.apply(lambda _: pnl_styles, subset=["Unrealized P&L"])
 
     st.dataframe(
         styled_df,
@@ -95,7 +187,6 @@ def render_holdings_tab(
             "Market Value": st.column_config.NumberColumn(format="$%.2f"),
             "Allocation %": st.column_config.NumberColumn(format="%.1f%%"),
             "Unrealized P&L": st.column_config.TextColumn("Unrealized P&L"),
-            "_pnl_pct": None,  # Hide helper column
         },
     )
 
@@ -105,15 +196,15 @@ def render_holdings_tab(
     alloc_col1, alloc_col2 = st.columns(2)
 
     with alloc_col1:
-        fig = px.pie(
-            df,
-            values="Market Value",
-            names="Ticker",
-            title="By Position",
-        )
-        fig.update_traces(textposition="inside", textinfo="percent+label")
-        fig.update_layout(**get_plotly_pie_theme())
-        st.plotly_chart(fig, use_container_width=True, config=get_plotly_chart_config())
+        if len(df) > ALLOCATION_PIE_MAX_SLICES:
+            # Too many slices to read; show the largest positions instead
+            st.caption(f"Top {ALLOCATION_PIE_MAX_SLICES} positions by market value")
+            st.bar_chart(_top_positions(df, ALLOCATION_PIE_MAX_SLICES))
+        else:
+            fig = _allocation_pie(
+                tuple(df["Market Value"]), tuple(df["Ticker"]), "Ticker", "By Position"
+            )
+            st.plotly_chart(fig, use_container_width=True, config=get_plotly_chart_config())
 
     with alloc_col2:
         _render_sector_chart(holdings)
@@ -145,17 +236,11 @@ def _render_sector_chart(holdings: list) -> None:
         st.caption("No sector data available")
         return
 
-    sector_df = pd.DataFrame([
-        {"Sector": sector, "Market Value": value}
-        for sector, value in sorted(sector_values.items(), key=lambda x: x[1], reverse=True)
-    ])
-
-    fig = px.pie(
-        sector_df,
-        values="Market Value",
-        names="Sector",
-        title="By Sector",
+    ordered = sorted(sector_values.items(), key=lambda x: x[1], reverse=True)
+    fig = _allocation_pie(
+        tuple(value for _, value in ordered),
+        tuple(sector for sector, _ in ordered),
+        "Sector",
+        "By Sector",
     )
-    fig.update_traces(textposition="inside", textinfo="percent+label")
-    fig.update_layout(**get_plotly_pie_theme())
     st.plotly_chart(fig, use_container_width=True, config=get_plotly_chart_config())
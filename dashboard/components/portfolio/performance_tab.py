@@ -1,17 +1,76 @@
 """Performance tab — winners/losers, P&L chart, metrics, and price history."""
 
-import plotly.graph_objects as go
+import heapq
+
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
-from dashboard.styles import section_header, metric_card
-from dashboard.theme import get_plotly_theme, get_plotly_chart_config, get_semantic_color
+from dashboard.styles import metric_card, section_header
+from dashboard.theme import (
+    get_plotly_chart_config,
+    get_plotly_layout,
+    get_plotly_theme,
+    get_semantic_color,
+)
 from dashboard.utils.portfolio_cache import get_cached_realized_pnl
 from dashboard.utils.price_data import get_batch_price_history
 
 
-def _render_insights(holdings_with_prices: list) -> None:
+def _win_loss_stats(holdings: list) -> dict:
+    """Summarize winners, losers, and extremes in a single pass.
+
+    Args:
+        holdings: Non-empty list of holdings with unrealized P&L.
+
+    Returns:
+        Dict with count, winners, losers, win_rate, avg_gain, avg_loss,
+        best/worst holdings with their P&L percentages, and total market value.
+    """
+    win_sum = loss_sum = total_value = 0.0
+    wins = losses = 0
+    best = worst = None
+    best_pct, worst_pct = float("-inf"), float("inf")
+
+    for h in holdings:
+        pnl = h.unrealized_pnl or 0
+        if pnl > 0:
+            win_sum += pnl
+            wins += 1
+        elif pnl < 0:
+            loss_sum += pnl
+            losses += 1
+        if h.market_value:
+            total_value += h.market_value
+        pct = h.unrealized_pnl_percent
+        if pct is not None:
+            if pct > best_pct:
+                best, best_pct = h, pct
+            if pct < worst_pct:
+                worst, worst_pct = h, pct
+
+    # No percentages at all (zero cost basis): fall back to the first position
+    if best is None:
+        best = worst = holdings[0]
+        best_pct = worst_pct = 0.0
+
+    return {
+        "count": len(holdings),
+        "winners": wins,
+        "losers": losses,
+        "win_rate": wins / len(holdings) * 100,
+        "avg_gain": win_sum / wins if wins else 0,
+        "avg_loss": loss_sum / losses if losses else 0,
+        "best": best,
+        "worst": worst,
+        "best_pct": best_pct,
+        "worst_pct": worst_pct,
+        "total_market_value": total_value,
+    }
+
+
+def _render_insights(holdings_with_prices: list, stats: dict) -> None:
     """Show up to 3 actionable insights based on current holdings."""
     if not holdings_with_prices:
         return
@@ -19,11 +78,8 @@ def _render_insights(holdings_with_prices: list) -> None:
     insights: list[str] = []
 
     # Best/worst performer callout
-    best = max(holdings_with_prices, key=lambda h: h.unrealized_pnl_percent or -999)
-    worst = min(holdings_with_prices, key=lambda h: h.unrealized_pnl_percent or 999)
-
-    best_pct = best.unrealized_pnl_percent or 0
-    worst_pct = worst.unrealized_pnl_percent or 0
+    best, worst = stats["best"], stats["worst"]
+    best_pct, worst_pct = stats["best_pct"], stats["worst_pct"]
 
     if best_pct > 20:
         insights.append(
@@ -35,7 +91,7 @@ def _render_insights(holdings_with_prices: list) -> None:
         )
 
     # Concentration warning
-    total_value = sum(h.market_value for h in holdings_with_prices if h.market_value)
+    total_value = stats["total_market_value"]
     if total_value > 0:
         for h in holdings_with_prices:
             weight = (h.market_value / total_value * 100) if h.market_value else 0
@@ -46,8 +102,7 @@ def _render_insights(holdings_with_prices: list) -> None:
                 break
 
     # Win rate context
-    winners = [h for h in holdings_with_prices if h.unrealized_pnl and h.unrealized_pnl > 0]
-    win_rate = (len(winners) / len(holdings_with_prices) * 100) if holdings_with_prices else 0
+    win_rate = stats["win_rate"]
 
     if win_rate < 40 and len(holdings_with_prices) >= 3:
         insights.append(
@@ -63,6 +118,76 @@ def _render_insights(holdings_with_prices: list) -> None:
         st.info(insight)
 
 
+PERFORMER_COLUMNS = ("Ticker", "Cost Basis", "Market Value", "P&L ($)", "P&L (%)", "Days Held")
+
+
+def _performer_row(h) -> tuple:
+    """Build one winners/losers table row in PERFORMER_COLUMNS order."""
+    pnl = h.unrealized_pnl
+    if pnl > 0:
+        pnl_text = f"▲ ${pnl:,.2f}"
+    elif pnl < 0:
+        pnl_text = f"▼ ${pnl:,.2f}"
+    else:
+        pnl_text = "— $0.00"
+    pnl_pct = h.unrealized_pnl_percent if h.unrealized_pnl_percent is not None else 0.0
+    return (
+        h.ticker,
+        f"${h.cost_basis_total:,.2f}",
+        f"${h.market_value:,.2f}",
+        pnl_text,
+        f"{pnl_pct:+.1f}%",
+        h.days_held,
+    )
+
+
+def _pnl_pct_key(holding) -> float:
+    """Rank key for performers; missing P&L % ranks as 0."""
+    pct = holding.unrealized_pnl_percent
+    return pct if pct is not None else 0
+
+
+def _top_bottom_performers(holdings: list, n: int = 5) -> tuple[list, list]:
+    """Select the n best and n worst holdings by P&L %, without a full sort.
+
+    Returns:
+        (top, bottom): best first, and worst first.
+    """
+    return (
+        heapq.nlargest(n, holdings, key=_pnl_pct_key),
+        heapq.nsmallest(n, holdings, key=_pnl_pct_key),
+    )
+
+
+def _performers_frame(holdings: list) -> pd.DataFrame:
+    """Build the Top/Bottom performers table for already-ranked holdings."""
+    return pd.DataFrame.from_records(
+        (_performer_row(h) for h in holdings), columns=PERFORMER_COLUMNS
+    )
+
+
+def _pnl_chart_frame(holdings: list, realized_by_ticker: dict) -> pd.DataFrame:
+    """Build long-form Realized/Unrealized P&L rows for the grouped bar chart.
+
+    Args:
+        holdings: Holdings with unrealized P&L.
+        realized_by_ticker: Ticker -> realized gain; zero and closed-position
+            entries are left out.
+    """
+    tickers = [h.ticker for h in holdings]
+    unrealized = pd.DataFrame({
+        "Ticker": tickers,
+        "P&L": [h.unrealized_pnl for h in holdings],
+        "Type": "Unrealized",
+    })
+    held = set(tickers)
+    realized = pd.DataFrame(
+        [(t, v) for t, v in realized_by_ticker.items() if v != 0 and t in held],
+        columns=["Ticker", "P&L"],
+    ).assign(Type="Realized")
+    return pd.concat([unrealized, realized], ignore_index=True)
+
+
 def render_performance_tab(holdings: list) -> None:
     """Render the Performance Analysis tab.
 
@@ -83,57 +208,29 @@ def render_performance_tab(holdings: list) -> None:
             st.warning("Market prices unavailable. Cannot calculate performance metrics.")
             return
 
+        # One pass over the positions feeds both insights and the summary
+        stats = _win_loss_stats(holdings_with_prices)
+
         # Actionable insights
-        _render_insights(holdings_with_prices)
+        _render_insights(holdings_with_prices, stats)
 
         # Winners & Losers
+        top, bottom = _top_bottom_performers(holdings_with_prices)
         col1, col2 = st.columns(2)
 
         with col1:
             st.markdown("**Top 5 Performers**")
-            winners = sorted(holdings_with_prices, key=lambda x: x.unrealized_pnl_percent or -999, reverse=True)[:5]
-            winners_data = [
-                {
-                    "Ticker": h.ticker,
-                    "Cost Basis": f"${h.cost_basis_total:,.2f}",
-                    "Market Value": f"${h.market_value:,.2f}",
-                    "P&L ($)": f"▲ ${h.unrealized_pnl:,.2f}" if h.unrealized_pnl > 0 else f"▼ ${h.unrealized_pnl:,.2f}" if h.unrealized_pnl < 0 else "— $0.00",
-                    "P&L (%)": f"{h.unrealized_pnl_percent:+.1f}%",
-                    "Days Held": h.days_held,
-                }
-                for h in winners
-            ]
-            st.dataframe(pd.DataFrame(winners_data), use_container_width=True, hide_index=True)
+            st.dataframe(_performers_frame(top), use_container_width=True, hide_index=True)
 
         with col2:
             st.markdown("**Bottom 5 Performers**")
-            losers = sorted(holdings_with_prices, key=lambda x: x.unrealized_pnl_percent or 999)[:5]
-            losers_data = [
-                {
-                    "Ticker": h.ticker,
-                    "Cost Basis": f"${h.cost_basis_total:,.2f}",
-                    "Market Value": f"${h.market_value:,.2f}",
-                    "P&L ($)": f"▲ ${h.unrealized_pnl:,.2f}" if h.unrealized_pnl > 0 else f"▼ ${h.unrealized_pnl:,.2f}" if h.unrealized_pnl < 0 else "— $0.00",
-                    "P&L (%)": f"{h.unrealized_pnl_percent:+.1f}%",
-                    "Days Held": h.days_held,
-                }
-                for h in losers
-            ]
-            st.dataframe(pd.DataFrame(losers_data), use_container_width=True, hide_index=True)
+            st.dataframe(_performers_frame(bottom), use_container_width=True, hide_index=True)
 
         # Realized vs Unrealized P&L Chart
         st.divider()
         st.markdown("**Realized vs Unrealized P&L**")
 
-        chart_data = [{"Ticker": h.ticker, "P&L": h.unrealized_pnl, "Type": "Unrealized"} for h in holdings_with_prices]
-
-        realized_by_ticker = get_cached_realized_pnl()
-        for h in holdings_with_prices:
-            realized_for_ticker = realized_by_ticker.get(h.ticker, 0.0)
-            if realized_for_ticker != 0:
-                chart_data.append({"Ticker": h.ticker, "P&L": realized_for_ticker, "Type": "Realized"})
-
-        chart_df = pd.DataFrame(chart_data)
+        chart_df = _pnl_chart_frame(holdings_with_prices, get_cached_realized_pnl())
         fig = px.bar(
             chart_df,
             x="Ticker",
@@ -147,29 +244,24 @@ def render_performance_tab(holdings: list) -> None:
             title="Realized vs Unrealized P&L by Position",
         )
         fig.update_layout(**get_plotly_theme())
-        fig.update_yaxis(title="P&L ($)")
+        fig.update_yaxes(title="P&L ($)")
         st.plotly_chart(fig, use_container_width=True, config=get_plotly_chart_config())
 
         # Performance Summary
         st.divider()
         section_header("Performance Summary")
 
-        winning_positions = [h for h in holdings_with_prices if h.unrealized_pnl and h.unrealized_pnl > 0]
-        losing_positions = [h for h in holdings_with_prices if h.unrealized_pnl and h.unrealized_pnl < 0]
-
-        avg_gain = sum(h.unrealized_pnl for h in winning_positions) / len(winning_positions) if winning_positions else 0
-        avg_loss = sum(h.unrealized_pnl for h in losing_positions) / len(losing_positions) if losing_positions else 0
-        win_rate = (len(winning_positions) / len(holdings_with_prices) * 100) if holdings_with_prices else 0
-
-        best = max(holdings_with_prices, key=lambda x: x.unrealized_pnl_percent or -999)
-        worst = min(holdings_with_prices, key=lambda x: x.unrealized_pnl_percent or 999)
+        win_rate = stats["win_rate"]
+        avg_gain = stats["avg_gain"]
+        avg_loss = stats["avg_loss"]
+        best, worst = stats["best"], stats["worst"]
 
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
             st.markdown(
                 metric_card("Win Rate", f"{win_rate:.1f}%",
-                            delta=f"{len(winning_positions)}/{len(holdings_with_prices)} winners",
+                            delta=f"{stats['winners']}/{stats['count']} winners",
                             delta_type="neutral"),
                 unsafe_allow_html=True,
             )
@@ -188,8 +280,7 @@ def render_performance_tab(holdings: list) -> None:
                 unsafe_allow_html=True,
             )
         with col4:
-            best_pct = best.unrealized_pnl_percent or 0
-            worst_pct = worst.unrealized_pnl_percent or 0
+            best_pct, worst_pct = stats["best_pct"], stats["worst_pct"]
             st.markdown(
                 metric_card("Best / Worst",
                             f"{best.ticker} / {worst.ticker}",
@@ -350,7 +441,8 @@ def _create_single_chart(holding, history: dict, period: str):
     )
 
     company = getattr(holding, "company_name", holding.ticker)
-    fig.update_layout(
+    # Chart-specific settings over the theme (legend merges into the theme's)
+    fig.update_layout(**get_plotly_layout(
         title=f"{holding.ticker} — {company}",
         xaxis_title="Date",
         yaxis_title="Price ($)",
@@ -358,8 +450,7 @@ def _create_single_chart(holding, history: dict, period: str):
         margin=dict(t=60, l=25, r=25, b=25),
         hovermode="x unified",
         legend=dict(orientation="h", yanchor="bottom", y=1.02),
-        **get_plotly_theme(),
-    )
+    ))
 
     return fig
 
@@ -426,7 +517,8 @@ def _create_normalized_chart(holdings: list, all_histories: dict, period: str):
         annotation_font_color=gray,
     )
 
-    fig.update_layout(
+    # Chart-specific settings over the theme (legend merges into the theme's)
+    fig.update_layout(**get_plotly_layout(
         title="All Holdings — Return From Cost Basis",
         xaxis_title="Date",
         yaxis_title="Return (%)",
@@ -434,8 +526,7 @@ def _create_normalized_chart(holdings: list, all_histories: dict, period: str):
         margin=dict(t=60, l=25, r=25, b=25),
         hovermode="x unified",
         legend=dict(orientation="h", yanchor="bottom", y=1.02),
-        **get_plotly_theme(),
-    )
+    ))
 
     return fig
 
@@ -6,7 +6,94 @@ import pandas as pd
 import streamlit as st
 
 from asymmetric.core.portfolio import PortfolioManager
-from dashboard.utils.portfolio_cache import clear_portfolio_cache
+from dashboard.utils.csv_export import export_csv_bytes
+from dashboard.utils.portfolio_cache import clear_portfolio_cache, get_cached_transaction_history
+
+HISTORY_COLUMNS = (
+    "Date",
+    "Type",
+    "Ticker",
+    "Shares",
+    "Price",
+    "Fees",
+    "Total Cost",
+    "Proceeds",
+    "Realized Gain",
+    "Notes",
+)
+
+CASH_FLOW_COLUMNS = ("Date", "Type", "Amount", "Notes")
+
+
+def _history_row(t) -> tuple:
+    """Build one raw Transaction History row in HISTORY_COLUMNS order.
+
+    Date, Type and the buy/sell-only amounts are finished column-wise in
+    history_frame().
+    """
+    return (
+        t.transaction_date,
+        t.transaction_type,
+        t.ticker,
+        t.quantity,
+        t.price_per_share,
+        t.fees,
+        t.total_cost,
+        t.total_proceeds,
+        t.realized_gain,
+        t.notes or "",
+    )
+
+
+def history_frame(history: list) -> pd.DataFrame:
+    """Build the Transaction History table DataFrame.
+
+    Args:
+        history: TransactionRecord objects, newest first.
+
+    Returns:
+        DataFrame with HISTORY_COLUMNS; dates as YYYY-MM-DD strings, Total Cost
+        shown only for buys and Proceeds only for sells.
+    """
+    df = pd.DataFrame.from_records(
+        (_history_row(t) for t in history), columns=HISTORY_COLUMNS
+    )
+    df["Date"] = pd.to_datetime(df["Date"]).dt.strftime("%Y-%m-%d").fillna("")
+    is_buy = df["Type"] == "buy"
+    df["Type"] = df["Type"].str.upper()
+    df["Total Cost"] = df["Total Cost"].where(is_buy, 0)
+    df["Proceeds"] = df["Proceeds"].where(~is_buy, 0)
+    return df
+
+
+def cash_flow_frame(cash_flows: list) -> pd.DataFrame:
+    """Build the Cash Flow History table DataFrame.
+
+    Args:
+        cash_flows: CashFlow records, oldest first.
+
+    Returns:
+        DataFrame with CASH_FLOW_COLUMNS; dates as YYYY-MM-DD strings and
+        amounts as floats.
+    """
+    df = pd.DataFrame.from_records(
+        ((cf.flow_date, cf.flow_type, cf.amount, cf.notes or "") for cf in cash_flows),
+        columns=CASH_FLOW_COLUMNS,
+    )
+    df["Date"] = pd.to_datetime(df["Date"]).dt.strftime("%Y-%m-%d").fillna("")
+    df["Type"] = df["Type"].str.title()
+    df["Amount"] = df["Amount"].astype(float)
+    return df
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _history_csv(df: pd.DataFrame) -> bytes:
+    """Serialize the history table for export, with CSV injection protection.
+
+    Keyed on the frame's contents, so the sanitize + to_csv pass only
+    runs when the displayed history actually changes.
+    """
+    return export_csv_bytes(df)
 
 
 def render_add_transaction_tab(manager: PortfolioManager) -> None:
@@ -18,12 +105,10 @@ def render_add_transaction_tab(manager: PortfolioManager) -> None:
     st.subheader("Record Transaction")
 
     # Handle pending confirmations first
-    if st.session_state.pending_buy:
-        _render_buy_confirmation(manager)
-        return
-    if st.session_state.pending_sell:
-        _render_sell_confirmation(manager)
-        return
+    for side in _TRADE_SIDES:
+        if st.session_state[f"pending_{side}"]:
+            _render_trade_confirmation(manager, side)
+            return
     if st.session_state.pending_cash_flow:
         _render_cash_flow_confirmation(manager)
         return
@@ -47,60 +132,28 @@ def render_add_transaction_tab(manager: PortfolioManager) -> None:
         _render_dividend_form(manager)
 
 
-def _render_buy_confirmation(manager: PortfolioManager) -> None:
-    """Render buy confirmation dialog."""
-    pending = st.session_state.pending_buy
-    total_cost = (pending["quantity"] * pending["price"]) + pending["fees"]
-
-    st.info("Review and confirm your purchase:")
-    with st.container():
-        st.markdown("### Confirm Purchase")
-        col_info1, col_info2 = st.columns(2)
-        with col_info1:
-            st.markdown(f"**Ticker:** {pending['ticker']}")
-            st.markdown(f"**Quantity:** {pending['quantity']:,.3f} shares")
-            st.markdown(f"**Price:** ${pending['price']:,.2f}/share")
-        with col_info2:
-            st.markdown(f"**Fees:** ${pending['fees']:,.2f}")
-            st.markdown(f"**Date:** {pending['date']}")
-            if pending["notes"]:
-                st.markdown(f"**Notes:** {pending['notes']}")
-
-        st.divider()
-        st.markdown(f"**Total Cost: ${total_cost:,.2f}**")
+# Per-side wording and sign for the shared buy/sell confirmation dialog
+_TRADE_SIDES = {
+    "buy": {"noun": "purchase", "title": "Purchase", "total": "Total Cost", "fee_sign": 1},
+    "sell": {"noun": "sale", "title": "Sale", "total": "Total Proceeds", "fee_sign": -1},
+}
 
-        col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 2])
-        with col_btn1:
-            if st.button("Confirm Purchase", type="primary", use_container_width=True):
-                try:
-                    manager.add_buy(
-                        ticker=pending["ticker"],
-                        quantity=pending["quantity"],
-                        price_per_share=pending["price"],
-                        transaction_date=datetime.combine(pending["date"], datetime.min.time(), tzinfo=UTC),
-                        fees=pending["fees"],
-                        notes=pending["notes"] if pending["notes"] else None,
-                    )
-                    st.session_state.pending_buy = None
-                    clear_portfolio_cache()
-                    st.success(f"Recorded purchase of {pending['quantity']} shares of {pending['ticker']}")
-                    st.rerun()
-                except ValueError as e:
-                    st.error(str(e))
-        with col_btn2:
-            if st.button("Cancel", type="secondary", use_container_width=True):
-                st.session_state.pending_buy = None
-                st.rerun()
 
+def _render_trade_confirmation(manager: PortfolioManager, side: str) -> None:
+    """Render the buy or sell confirmation dialog.
 
-def _render_sell_confirmation(manager: PortfolioManager) -> None:
-    """Render sell confirmation dialog."""
-    pending = st.session_state.pending_sell
-    total_proceeds = (pending["quantity"] * pending["price"]) - pending["fees"]
+    Args:
+        manager: PortfolioManager instance.
+        side: "buy" or "sell"; selects st.session_state.pending_<side>.
+    """
+    state_key = f"pending_{side}"
+    labels = _TRADE_SIDES[side]
+    pending = st.session_state[state_key]
+    total = (pending["quantity"] * pending["price"]) + labels["fee_sign"] * pending["fees"]
 
-    st.info("Review and confirm your sale:")
+    st.info(f"Review and confirm your {labels['noun']}:")
     with st.container():
-        st.markdown("### Confirm Sale")
+        st.markdown(f"### Confirm {labels['title']}")
         col_info1, col_info2 = st.columns(2)
         with col_info1:
             st.markdown(f"**Ticker:** {pending['ticker']}")
@@ -113,30 +166,45 @@ def _render_sell_confirmation(manager: PortfolioManager) -> None:
                 st.markdown(f"**Notes:** {pending['notes']}")
 
         st.divider()
-        st.markdown(f"**Total Proceeds: ${total_proceeds:,.2f}**")
+        st.markdown(f"**{labels['total']}: ${total:,.2f}**")
 
         col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 2])
         with col_btn1:
-            if st.button("Confirm Sale", type="primary", use_container_width=True):
+            if st.button(f"Confirm {labels['title']}", type="primary", use_container_width=True):
+                record = manager.add_buy if side == "buy" else manager.add_sell
                 try:
-                    transaction = manager.add_sell(
+                    transaction = record(
                         ticker=pending["ticker"],
                         quantity=pending["quantity"],
                         price_per_share=pending["price"],
-                        transaction_date=datetime.combine(pending["date"], datetime.min.time(), tzinfo=UTC),
+                        transaction_date=datetime.combine(
+                            pending["date"], datetime.min.time(), tzinfo=UTC
+                        ),
                         fees=pending["fees"],
                         notes=pending["notes"] if pending["notes"] else None,
                     )
-                    st.session_state.pending_sell = None
+                    st.session_state[state_key] = None
                     clear_portfolio_cache()
-                    gain_text = f"${transaction.realized_gain:,.2f}" if transaction.realized_gain else "N/A"
-                    st.success(f"Recorded sale of {pending['quantity']} shares of {pending['ticker']}. Realized gain: {gain_text}")
+                    message = (
+                        f"Recorded {labels['noun']} of {pending['quantity']} shares "
+                        f"of {pending['ticker']}"
+                    )
+                    if side == "sell":
+                        gain_text = (
+                            f"${transaction.realized_gain:,.2f}"
+                            if transaction.realized_gain
+                            else "N/A"
+                        )
+                        message += f". Realized gain: {gain_text}"
+                    st.success(message)
                     st.rerun()
                 except ValueError as e:
                     st.error(str(e))
         with col_btn2:
-            if st.button("Cancel", type="secondary", use_container_width=True, key="cancel_sell"):
-                st.session_state.pending_sell = None
+            if st.button(
+                "Cancel", type="secondary", use_container_width=True, key=f"cancel_{side}"
+            ):
+                st.session_state[state_key] = None
                 st.rerun()
 
 
@@ -213,55 +281,50 @@ def _render_dividend_confirmation(manager: PortfolioManager) -> None:
 
 def _render_transaction_forms() -> None:
     """Render buy and sell forms side by side."""
+    today = datetime.now(UTC)
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("**Buy Stock**")
-        with st.form("buy_form"):
-            buy_ticker = st.text_input("Ticker", key="buy_ticker").upper()
-            buy_quantity = st.number_input("Quantity", min_value=0.001, value=1.0, key="buy_qty")
-            buy_price = st.number_input("Price per Share", min_value=0.01, value=100.0, key="buy_price")
-            buy_fees = st.number_input("Fees", min_value=0.0, value=0.0, key="buy_fees")
-            buy_date = st.date_input("Date", value=datetime.now(UTC), key="buy_date")
-            buy_notes = st.text_input("Notes (optional)", key="buy_notes")
-
-            if st.form_submit_button("Review Buy", type="primary"):
-                if buy_ticker and buy_quantity > 0:
-                    st.session_state.pending_buy = {
-                        "ticker": buy_ticker,
-                        "quantity": buy_quantity,
-                        "price": buy_price,
-                        "fees": buy_fees,
-                        "date": buy_date,
-                        "notes": buy_notes,
-                    }
-                    st.rerun()
-                else:
-                    st.error("Please enter ticker and quantity")
+        _render_trade_form("buy", "Review Buy", "primary", today)
 
     with col2:
         st.markdown("**Sell Stock**")
-        with st.form("sell_form"):
-            sell_ticker = st.text_input("Ticker", key="sell_ticker").upper()
-            sell_quantity = st.number_input("Quantity", min_value=0.001, value=1.0, key="sell_qty")
-            sell_price = st.number_input("Price per Share", min_value=0.01, value=100.0, key="sell_price")
-            sell_fees = st.number_input("Fees", min_value=0.0, value=0.0, key="sell_fees")
-            sell_date = st.date_input("Date", value=datetime.now(UTC), key="sell_date")
-            sell_notes = st.text_input("Notes (optional)", key="sell_notes")
-
-            if st.form_submit_button("Review Sell", type="secondary"):
-                if sell_ticker and sell_quantity > 0:
-                    st.session_state.pending_sell = {
-                        "ticker": sell_ticker,
-                        "quantity": sell_quantity,
-                        "price": sell_price,
-                        "fees": sell_fees,
-                        "date": sell_date,
-                        "notes": sell_notes,
-                    }
-                    st.rerun()
-                else:
-                    st.error("Please enter ticker and quantity")
+        _render_trade_form("sell", "Review Sell", "secondary", today)
+
+
+def _render_trade_form(kind: str, submit_label: str, submit_type: str, today: datetime) -> None:
+    """Render one buy or sell form that stages a pending trade for review.
+
+    Args:
+        kind: "buy" or "sell"; prefixes the form/widget keys and selects
+            the ``pending_<kind>`` session state slot.
+        submit_label: Submit button label.
+        submit_type: Submit button type ("primary" or "secondary").
+        today: Default value for the date input.
+    """
+    with st.form(f"{kind}_form"):
+        ticker = st.text_input("Ticker", key=f"{kind}_ticker")
+        quantity = st.number_input("Quantity", min_value=0.001, value=1.0, key=f"{kind}_qty")
+        price = st.number_input("Price per Share", min_value=0.01, value=100.0, key=f"{kind}_price")
+        fees = st.number_input("Fees", min_value=0.0, value=0.0, key=f"{kind}_fees")
+        trade_date = st.date_input("Date", value=today, key=f"{kind}_date")
+        notes = st.text_input("Notes (optional)", key=f"{kind}_notes")
+
+        if st.form_submit_button(submit_label, type=submit_type):
+            ticker = ticker.strip().upper()
+            if ticker and quantity > 0:
+                st.session_state[f"pending_{kind}"] = {
+                    "ticker": ticker,
+                    "quantity": quantity,
+                    "price": price,
+                    "fees": fees,
+                    "date": trade_date,
+                    "notes": notes,
+                }
+                st.rerun()
+            else:
+                st.error("Please enter ticker and quantity")
 
 
 def _render_cash_flow_form() -> None:
@@ -292,12 +355,13 @@ def _render_dividend_form(manager: PortfolioManager) -> None:
     with col1:
         st.markdown("**Record Dividend**")
         with st.form("dividend_form"):
-            div_ticker = st.text_input("Ticker", key="div_ticker").upper()
+            div_ticker = st.text_input("Ticker", key="div_ticker")
             div_amount = st.number_input("Total Amount ($)", min_value=0.01, value=10.0, key="div_amount")
             div_date = st.date_input("Pay Date", value=datetime.now(UTC), key="div_date")
             div_notes = st.text_input("Notes (optional)", key="div_notes")
 
             if st.form_submit_button("Review Dividend", type="primary"):
+                div_ticker = div_ticker.strip().upper()
                 if div_ticker and div_amount > 0:
                     st.session_state.pending_dividend = {
                         "ticker": div_ticker,
@@ -312,9 +376,10 @@ def _render_dividend_form(manager: PortfolioManager) -> None:
     with col2:
         st.markdown("**Sync from yfinance**")
         st.caption("Auto-import dividend history for your holdings")
-        sync_ticker = st.text_input("Ticker (blank = all holdings)", key="sync_div_ticker").upper()
+        sync_ticker = st.text_input("Ticker (blank = all holdings)", key="sync_div_ticker")
 
         if st.button("Sync Dividends", type="secondary", use_container_width=True):
+            sync_ticker = sync_ticker.strip().upper()
             with st.spinner("Syncing dividends..."):
                 result = manager.sync_dividends(
                     ticker=sync_ticker if sync_ticker else None,
@@ -339,42 +404,16 @@ def render_transaction_history_tab(manager: PortfolioManager) -> None:
 
     col1, col2 = st.columns([3, 1])
     with col1:
-        hist_ticker = st.text_input("Filter by Ticker", key="hist_ticker").upper()
+        hist_ticker = st.text_input("Filter by Ticker", key="hist_ticker").strip().upper()
     with col2:
         hist_limit = st.selectbox("Show", [20, 50, 100], key="hist_limit")
 
-    history = manager.get_transaction_history(
-        ticker=hist_ticker if hist_ticker else None,
-        limit=hist_limit,
-    )
+    history = get_cached_transaction_history(hist_ticker or None, hist_limit)
 
     if not history:
         st.info("No transactions recorded yet.")
     else:
-        history_data = []
-        for t in history:
-            row = {
-                "Date": t.transaction_date.strftime("%Y-%m-%d") if t.transaction_date else "",
-                "Type": t.transaction_type.upper(),
-                "Ticker": t.ticker,
-                "Shares": t.quantity,
-                "Price": t.price_per_share,
-                "Fees": t.fees,
-            }
-            if t.transaction_type == "buy":
-                row["Total Cost"] = t.total_cost
-                row["Proceeds"] = 0
-            elif t.transaction_type == "dividend":
-                row["Total Cost"] = 0
-                row["Proceeds"] = t.total_proceeds
-            else:
-                row["Total Cost"] = 0
-                row["Proceeds"] = t.total_proceeds
-            row["Realized Gain"] = t.realized_gain
-            row["Notes"] = t.notes or ""
-            history_data.append(row)
-
-        df = pd.DataFrame(history_data)
+        df = history_frame(history)
         st.dataframe(
             df,
             use_container_width=True,
@@ -387,11 +426,7 @@ def render_transaction_history_tab(manager: PortfolioManager) -> None:
             },
         )
 
-        # Export with CSV injection protection
-        from dashboard.utils.csv_export import sanitize_csv_dataframe
-        export_df = sanitize_csv_dataframe(df)
-        csv = export_df.to_csv(index=False)
-        st.download_button("Export to CSV", csv, "transactions.csv", "text/csv")
+        st.download_button("Export to CSV", _history_csv(df), "transactions.csv", "text/csv")
 
     # Cash Flow History
     with st.expander("Cash Flow History (Deposits / Withdrawals)"):
@@ -399,17 +434,8 @@ def render_transaction_history_tab(manager: PortfolioManager) -> None:
         if not cash_flows:
             st.info("No deposits or withdrawals recorded yet.")
         else:
-            cf_data = []
-            for cf in cash_flows:
-                cf_data.append({
-                    "Date": cf.flow_date.strftime("%Y-%m-%d") if cf.flow_date else "",
-                    "Type": cf.flow_type.title(),
-                    "Amount": float(cf.amount),
-                    "Notes": cf.notes or "",
-                })
-            cf_df = pd.DataFrame(cf_data)
             st.dataframe(
-                cf_df,
+                cash_flow_frame(cash_flows),
                 use_container_width=True,
                 column_config={
                     "Amount": st.column_config.NumberColumn(format="$%.2f"),
@@ -13,7 +13,7 @@ def render_analytics_tab() -> None:
     from dashboard.utils.decisions import (
         get_decisions_with_outcomes,
         analyze_by_conviction,
-        calculate_portfolio_return,
+        calculate_what_if_returns,
     )
 
     decisions_with_outcomes = get_decisions_with_outcomes(limit=100)
@@ -40,7 +40,7 @@ def render_analytics_tab() -> None:
     st.divider()
 
     # What-If Calculator
-    _render_what_if_analysis(decisions_with_outcomes, calculate_portfolio_return)
+    _render_what_if_analysis(decisions_with_outcomes, calculate_what_if_returns)
 
 
 def _render_conviction_chart(conviction_stats: list) -> None:
@@ -75,15 +75,18 @@ def _render_conviction_chart(conviction_stats: list) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
-def _render_what_if_analysis(decisions_with_outcomes, calculate_portfolio_return):
+def _render_what_if_analysis(decisions_with_outcomes, calculate_what_if_returns):
     """Render the what-if analysis section."""
     st.markdown("### What-If Analysis")
     st.caption("See how returns vary by conviction threshold")
 
     min_conviction = st.slider("Minimum Conviction Level", min_value=1, max_value=5, value=3, help="Only include decisions with conviction >= this level")
 
-    avg_return = calculate_portfolio_return(decisions_with_outcomes, conviction_min=min_conviction)
-    filtered_count = sum(1 for d in decisions_with_outcomes if (d.get("confidence") or 3) >= min_conviction)
+    what_if = calculate_what_if_returns(
+        decisions_with_outcomes, conviction_mins=(min_conviction, 1)
+    )
+    avg_return = what_if[min_conviction]["avg_return"]
+    filtered_count = what_if[min_conviction]["decision_count"]
 
     col1, col2 = st.columns(2)
     with col1:
@@ -92,7 +95,7 @@ def _render_what_if_analysis(decisions_with_outcomes, calculate_portfolio_return
         st.metric("Decisions Included", filtered_count)
 
     if min_conviction > 1:
-        all_return = calculate_portfolio_return(decisions_with_outcomes, conviction_min=1)
+        all_return = what_if[1]["avg_return"]
         improvement = avg_return - all_return
         if improvement > 0:
             st.success(f"High-conviction filter improved returns by {improvement:+.2f}%")
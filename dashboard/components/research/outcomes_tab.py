@@ -101,6 +101,9 @@ def _render_pending_reviews(pending_decisions, get_decision_by_id, update_decisi
                     hit=hit,
                 )
                 if success:
+                    from dashboard.utils.decisions_cache import clear_decisions_cache
+
+                    clear_decisions_cache()
                     st.success(f"Outcome recorded for {ticker}!")
                     st.balloons()
                     st.rerun()
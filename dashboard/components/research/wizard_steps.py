@@ -9,18 +9,76 @@ from dashboard.components.stock_card import (
     render_sparkline,
     render_key_metrics_row,
 )
+from dashboard.config import SCORE_CACHE_TTL
 from dashboard.theme import get_semantic_color
 from dashboard.utils.scoring import get_scores_for_ticker
+from dashboard.utils.session_state import reset_page_state
 from dashboard.utils.validators import sanitize_html
-from dashboard.utils.watchlist import get_cached_scores, get_stocks, add_stock
+from dashboard.utils.watchlist import get_cached_scores, add_stock
+from dashboard.utils.watchlist_cache import get_cached_ticker_options, get_cached_ticker_positions
+
+# Imported once at module load rather than on each button click; the flags
+# keep the wizard usable when the AI or decision backends are unavailable.
+try:
+    from dashboard.utils.ai_analysis import (
+        handle_ai_analysis_error,
+        run_many_models,
+        run_single_stock_analysis,
+    )
 
+    AI_AVAILABLE = True
+except ImportError:
+    AI_AVAILABLE = False
 
-def render_step_indicator(current_step: int) -> None:
-    """Render the wizard step indicator with numbered circles and connecting lines."""
-    steps = ["Research", "Thesis", "Decision"]
+try:
+    from dashboard.utils.decisions import create_decision, create_thesis
+    from dashboard.utils.decisions_cache import clear_decisions_cache
+
+    DECISIONS_AVAILABLE = True
+except ImportError:
+    DECISIONS_AVAILABLE = False
+
+
+class _ScoreLookupFailed(Exception):
+    """Carries an error result out of _fetch_scores so it is not cached."""
+
+    def __init__(self, scores: dict):
+        super().__init__(scores.get("message", ""))
+        self.scores = scores
+
+
+@st.cache_data(ttl=SCORE_CACHE_TTL, max_entries=32, show_spinner=False)
+def _fetch_scores(ticker: str) -> dict:
+    """Fetch scores from SEC EDGAR, caching successful lookups only.
+
+    Re-analyzing a ticker (e.g. after going Back from the thesis step)
+    reuses the result instead of repeating the EDGAR requests, including
+    for tickers that are not on the watchlist.
+    """
+    scores = get_scores_for_ticker(ticker)
+    if "error" in scores:
+        raise _ScoreLookupFailed(scores)
+    return scores
 
+
+def _load_scores(ticker: str) -> dict:
+    """Get scores for the research step: watchlist cache first, then EDGAR."""
+    cached = get_cached_scores(ticker)
+    if cached and "piotroski" in cached:
+        return cached
+    try:
+        return _fetch_scores(ticker)
+    except _ScoreLookupFailed as e:
+        return e.scores
+
+
+_WIZARD_STEPS = ("Research", "Thesis", "Decision")
+
+
+def _step_indicator_html(current_step: int) -> str:
+    """Build the step indicator markup: numbered circles and connecting lines."""
     parts = []
-    for i, label in enumerate(steps):
+    for i, label in enumerate(_WIZARD_STEPS):
         if i < current_step:
             state = "completed"
             circle_content = "\u2713"
@@ -39,36 +97,39 @@ def render_step_indicator(current_step: int) -> None:
         )
 
         # Add connector between steps (not after last)
-        if i < len(steps) - 1:
+        if i < len(_WIZARD_STEPS) - 1:
             connector_state = "completed" if i < current_step else "pending"
             parts.append(f'<div class="asym-wizard-connector {connector_state}"></div>')
 
-    st.markdown(
-        f'<div class="asym-wizard-steps">{"".join(parts)}</div>',
-        unsafe_allow_html=True,
-    )
+    return f'<div class="asym-wizard-steps">{"".join(parts)}</div>'
+
+
+# One indicator per wizard step, built at import instead of on every rerun
+_STEP_INDICATOR_HTML = {step: _step_indicator_html(step) for step in range(len(_WIZARD_STEPS))}
+
+
+def render_step_indicator(current_step: int) -> None:
+    """Render the wizard step indicator with numbered circles and connecting lines."""
+    html = _STEP_INDICATOR_HTML.get(current_step) or _step_indicator_html(current_step)
+    st.markdown(html, unsafe_allow_html=True)
 
 
 def render_research_step() -> None:
     """Render Step 1: Research - stock selection and score analysis."""
     st.subheader("Step 1: Research Stock")
 
-    watchlist = get_stocks()
+    # "" followed by the sorted tickers; re-read only when the watchlist file
+    # changes, so the add_stock() on save is picked up without invalidation
+    options = get_cached_ticker_options()
 
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        if watchlist:
+        if len(options) > 1:
             ticker = st.selectbox(
                 "Select from watchlist or enter ticker",
-                options=[""] + sorted(watchlist),
-                index=0
-                if not st.session_state.research_ticker
-                else (
-                    sorted(watchlist).index(st.session_state.research_ticker) + 1
-                    if st.session_state.research_ticker in watchlist
-                    else 0
-                ),
+                options=options,
+                index=get_cached_ticker_positions().get(st.session_state.research_ticker, 0),
                 format_func=lambda x: "Choose a stock..." if x == "" else x,
             )
         else:
@@ -97,11 +158,7 @@ def render_research_step() -> None:
         if st.button("Analyze Stock", type="primary"):
             with st.spinner(f"Fetching data for {selected_ticker}..."):
                 try:
-                    cached = get_cached_scores(selected_ticker)
-                    if cached and "piotroski" in cached:
-                        st.session_state.research_scores = cached
-                    else:
-                        st.session_state.research_scores = get_scores_for_ticker(selected_ticker)
+                    st.session_state.research_scores = _load_scores(selected_ticker)
                 except Exception as e:
                     st.error(f"Failed to fetch data for {selected_ticker}: {str(e)}")
                     st.session_state.research_scores = {"error": True, "message": str(e)}
@@ -147,7 +204,7 @@ def _render_score_and_ai_panels(ticker: str, scores: dict) -> None:
 
     # AI Analysis section
     st.markdown("**AI Analysis (Optional)**")
-    ai_col1, ai_col2 = st.columns(2)
+    ai_col1, ai_col2, ai_col3 = st.columns(3)
 
     with ai_col1:
         if st.button("Quick Analysis (Flash)", use_container_width=True):
@@ -157,8 +214,11 @@ def _render_score_and_ai_panels(ticker: str, scores: dict) -> None:
         if st.button("Deep Analysis (Pro)", use_container_width=True):
             _run_ai_analysis(ticker, scores, "pro")
 
-    if st.session_state.research_ai_analysis:
-        ai_result = st.session_state.research_ai_analysis
+    with ai_col3:
+        if st.button("Run Both (Flash + Pro)", use_container_width=True):
+            _run_ai_analysis(ticker, scores, "flash", "pro")
+
+    for ai_result in st.session_state.research_ai_analyses.values():
         if "error" not in ai_result:
             render_ai_section(
                 content=ai_result.get("content", ""),
@@ -170,18 +230,33 @@ def _render_score_and_ai_panels(ticker: str, scores: dict) -> None:
             )
 
 
-def _run_ai_analysis(ticker: str, scores: dict, model: str) -> None:
-    """Run AI analysis for the given ticker and model."""
-    model_name = "Gemini Flash" if model == "flash" else "Gemini Pro"
-    with st.spinner(f"Analyzing with {model_name}..."):
-        try:
-            from dashboard.utils.ai_analysis import run_single_stock_analysis, handle_ai_analysis_error
+def _run_ai_analysis(ticker: str, scores: dict, *models: str) -> None:
+    """Run AI analysis for the given ticker, with several models concurrently.
 
-            st.session_state.research_ai_analysis = run_single_stock_analysis(ticker, scores, model=model)
-        except ImportError:
-            st.error("AI analysis not available. Please check your Gemini API key configuration.")
+    Every result is kept in ``research_ai_analyses``; ``research_ai_analysis``
+    holds the preferred one (the last successful model given) for the
+    thesis step.
+    """
+    if not AI_AVAILABLE:
+        st.error("AI analysis not available. Please check your Gemini API key configuration.")
+        return
+
+    model_names = " + ".join("Gemini Flash" if m == "flash" else "Gemini Pro" for m in models)
+    with st.spinner(f"Analyzing with {model_names}..."):
+        try:
+            if len(models) == 1:
+                results = {models[0]: run_single_stock_analysis(ticker, scores, model=models[0])}
+            else:
+                results = run_many_models(ticker, scores, models)
         except Exception as e:
             handle_ai_analysis_error(e)
+            return
+
+    ok = [r for r in results.values() if "error" not in r]
+    st.session_state.update(
+        research_ai_analyses=results,
+        research_ai_analysis=ok[-1] if ok else results[models[-1]],
+    )
 
 
 def render_thesis_step() -> None:
@@ -342,9 +417,11 @@ def render_decision_step() -> None:
 
 def _save_thesis_and_decision(ticker, thesis_draft, action, confidence, rationale, target_price, stop_loss):
     """Save thesis and decision to database."""
-    try:
-        from dashboard.utils.decisions import create_thesis, create_decision
+    if not DECISIONS_AVAILABLE:
+        st.error("Decision utilities not available. Please check your installation.")
+        return
 
+    try:
         thesis_id = create_thesis(
             ticker=ticker,
             summary=thesis_draft.get("summary", ""),
@@ -365,20 +442,15 @@ def _save_thesis_and_decision(ticker, thesis_draft, action, confidence, rational
             stop_loss=stop_loss if stop_loss > 0 else None,
         )
 
+        clear_decisions_cache()
         add_stock(ticker, f"Thesis created: {thesis_draft.get('summary', '')[:50]}...")
 
         st.success(f"Thesis and decision saved for {ticker}!")
         st.balloons()
 
-        st.session_state.research_step = 0
-        st.session_state.research_ticker = None
-        st.session_state.research_scores = None
-        st.session_state.research_ai_analysis = None
-        st.session_state.research_thesis_draft = {}
+        reset_page_state("research")
 
         st.info("View your thesis in the Decisions page.")
 
-    except ImportError:
-        st.error("Decision utilities not available. Please check your installation.")
     except Exception as e:
         st.error(f"Failed to save: {e}")
@@ -26,6 +26,9 @@ ZSCORE_ZONES = {
     "Distress": {"color": "red", "icon": "distress"},
 }
 
+# Portfolio settings
+ALLOCATION_PIE_MAX_SLICES = 25  # Above this many positions, show a top-N bar chart instead
+
 # Comparison settings
 MAX_COMPARE_STOCKS = 3
 MIN_COMPARE_STOCKS = 2
@@ -60,3 +63,8 @@ CONFIDENCE_LEVELS = {
 # Decision page settings
 DECISIONS_PAGE_LIMIT = 20
 THESES_PAGE_LIMIT = 20
+DECISIONS_VIEWS = ("My Decisions", "Theses Library", "Review Outcomes", "Analytics")
+DECISIONS_VIEW_KEY = "decisions_active_view"  # session-state key of the view selector
+
+# Alerts page settings
+ALERTS_BATCH_SIZE = 25
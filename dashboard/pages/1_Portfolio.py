@@ -3,11 +3,13 @@ Portfolio Page - Track holdings, transactions, and P&L.
 
 Manage your investment portfolio with lot-level cost basis tracking,
 realized/unrealized P&L, and portfolio-weighted score analysis.
+
+Each tab body renders as a fragment, so sorting holdings, changing the
+history range, or filling in a transaction form reruns only that tab.
 """
 
 import streamlit as st
 
-from asymmetric.core.portfolio import PortfolioManager
 from dashboard.components.page_header import render_page_header
 from dashboard.components.portfolio import (
     render_holdings_tab,
@@ -19,7 +21,14 @@ from dashboard.components.portfolio import (
 )
 from dashboard.styles import inject_global_styles, metric_card, page_footer
 from dashboard.theme import THEME
-from dashboard.utils.portfolio_cache import get_cached_portfolio_data
+from dashboard.utils.fragments import fragment
+from dashboard.utils.portfolio_cache import (
+    get_cached_portfolio_data,
+    get_portfolio_manager,
+    get_stale_portfolio_data,
+    prices_pending,
+    refresh_portfolio_prices,
+)
 from dashboard.utils.session_state import init_page_state
 from dashboard.utils.sidebar import render_full_sidebar
 
@@ -36,13 +45,21 @@ render_page_header(
     breadcrumbs=[("Home", "app.py"), ("Portfolio", "")],
 )
 
-# Initialize manager
-manager = PortfolioManager()
+# Shared manager instance (stateless, cached per process)
+manager = get_portfolio_manager()
 
-# Fetch portfolio data (cached 60s — avoids redundant DB + yfinance calls on tab switches)
+# Fetch portfolio data (cached 5 min — avoids redundant DB + yfinance calls on tab switches)
 try:
+    # Live prices load on a background thread; until they arrive, render with
+    # the last known prices rather than blocking on yfinance. Older Streamlit
+    # without st.fragment cannot poll for the result, so it waits as before.
+    _prices_loading = hasattr(st, "fragment") and prices_pending()
+
     with st.spinner("Loading portfolio data..."):
-        summary, holdings, weighted_scores, _prices = get_cached_portfolio_data()
+        if _prices_loading:
+            summary, holdings, weighted_scores, _prices = get_stale_portfolio_data()
+        else:
+            summary, holdings, weighted_scores, _prices = get_cached_portfolio_data()
 except Exception as e:
     st.error(f"Error loading portfolio data: {e}")
     st.info("Please check your database connection and try refreshing the page.")
@@ -57,58 +74,84 @@ except Exception as e:
             st.rerun()
     st.stop()
 
+
+@fragment(run_every=1)
+def _await_live_prices() -> None:
+    """Rerun the page once the background price fetch has finished."""
+    if not prices_pending():
+        st.rerun()
+
+
 # Warn if some prices were unavailable
-if summary.missing_prices:
+if _prices_loading:
+    st.caption("Fetching live prices — values use the last known prices until they arrive.")
+    _await_live_prices()
+elif summary.missing_prices:
     st.warning(
         f"Live prices unavailable for: {', '.join(summary.missing_prices)}. "
         "Values shown use cost basis as fallback."
     )
 
-# Top-level metrics — 3+2 layout for readability
-col1, col2, col3 = st.columns(3)
 
-with col1:
-    st.markdown(
-        metric_card("Total Market Value", f"${summary.total_market_value:,.2f}"),
-        unsafe_allow_html=True,
-    )
+def _delta_type(value: float) -> str:
+    """Map a signed amount to a metric_card delta style."""
+    return "positive" if value > 0 else "negative" if value < 0 else "neutral"
 
-with col2:
-    unrealized_pnl_pct = f"{summary.unrealized_pnl_percent:+.2f}%" if summary.unrealized_pnl_percent is not None else "N/A"
-    delta_text = f"${summary.unrealized_pnl:+,.2f}" if summary.unrealized_pnl != 0 else ""
-    delta_type = "positive" if summary.unrealized_pnl > 0 else "negative" if summary.unrealized_pnl < 0 else "neutral"
-    st.markdown(
-        metric_card("Unrealized P&L", unrealized_pnl_pct, delta=delta_text, delta_type=delta_type),
-        unsafe_allow_html=True,
-    )
 
-with col3:
-    st.markdown(
-        metric_card("Positions", str(summary.position_count)),
-        unsafe_allow_html=True,
-    )
-
-col4, col5 = st.columns(2)
-
-with col4:
-    realized_text = f"${summary.realized_pnl_total:,.2f}"
-    realized_delta = f"${summary.realized_pnl_total:+,.2f}" if summary.realized_pnl_total != 0 else ""
-    realized_type = "positive" if summary.realized_pnl_total > 0 else "negative" if summary.realized_pnl_total < 0 else "neutral"
-    st.markdown(
-        metric_card("Realized P&L (Total)", realized_text, delta=realized_delta, delta_type=realized_type),
-        unsafe_allow_html=True,
-    )
+# Top-level metrics — 3+2 layout for readability
+unrealized_pnl_pct = (
+    f"{summary.unrealized_pnl_percent:+.2f}%"
+    if summary.unrealized_pnl_percent is not None
+    else "N/A"
+)
+realized_pnl = summary.realized_pnl_total
+total_return_pct = summary.total_return_percent
+total_return_text = f"{total_return_pct:+.2f}%"
+
+# (label, value, delta, delta_type) per card; one tuple per row of columns
+metric_rows = (
+    (
+        (
+            "Total Market Value",
+            f"${summary.total_market_value:,.2f}",
+            "",
+            "neutral",
+        ),
+        (
+            "Unrealized P&L",
+            unrealized_pnl_pct,
+            f"${summary.unrealized_pnl:+,.2f}" if summary.unrealized_pnl != 0 else "",
+            _delta_type(summary.unrealized_pnl),
+        ),
+        (
+            "Positions",
+            str(summary.position_count),
+            "",
+            "neutral",
+        ),
+    ),
+    (
+        (
+            "Realized P&L (Total)",
+            f"${realized_pnl:,.2f}",
+            f"${realized_pnl:+,.2f}" if realized_pnl != 0 else "",
+            _delta_type(realized_pnl),
+        ),
+        (
+            "Total Return",
+            total_return_text,
+            total_return_text if total_return_pct != 0 else "",
+            _delta_type(total_return_pct),
+        ),
+    ),
+)
 
-with col5:
-    total_return_pct = 0.0
-    if summary.cash_invested > 0:
-        total_return_pct = ((summary.realized_pnl_total + summary.unrealized_pnl) / summary.cash_invested) * 100
-    return_delta = f"{total_return_pct:+.2f}%" if total_return_pct != 0 else ""
-    return_type = "positive" if total_return_pct > 0 else "negative" if total_return_pct < 0 else "neutral"
-    st.markdown(
-        metric_card("Total Return", f"{total_return_pct:+.2f}%", delta=return_delta, delta_type=return_type),
-        unsafe_allow_html=True,
-    )
+for cards in metric_rows:
+    for col, (label, value, delta, delta_type) in zip(st.columns(len(cards)), cards):
+        col.markdown(
+            metric_card(label, value, delta=delta, delta_type=delta_type),
+            unsafe_allow_html=True,
+        )
 
 st.divider()
 
@@ -119,16 +162,20 @@ tab_overview, tab_performance, tab_transactions = st.tabs([
     "Transactions",
 ])
 
-with tab_overview:
-    # Holdings table + allocation charts
-    render_holdings_tab(holdings, manager, _prices)
+
+@fragment
+def _render_overview(holdings, weighted_scores, manager, prices) -> None:
+    """Render holdings table, allocation charts, and the health expander."""
+    render_holdings_tab(holdings, manager, prices)
 
     # Portfolio Health (collapsed by default, below holdings)
     with st.expander("Portfolio Health", expanded=False):
         render_health_tab(holdings, weighted_scores, manager)
 
-with tab_performance:
-    # Performance analysis (winners/losers, metrics)
+
+@fragment
+def _render_performance(holdings) -> None:
+    """Render winners/losers metrics and the historical charts."""
     render_performance_tab(holdings)
 
     st.divider()
@@ -136,26 +183,53 @@ with tab_performance:
     # Historical charts (snapshots, time-series)
     render_historical_tab()
 
-with tab_transactions:
-    # Add transaction form
+
+@fragment
+def _render_transactions(manager) -> None:
+    """Render the add-transaction forms and the transaction history."""
     render_add_transaction_tab(manager)
 
     st.divider()
 
-    # Transaction history table
     render_transaction_history_tab(manager)
 
-# Sidebar quick stats
-st.sidebar.markdown("---")
+
+with tab_overview:
+    _render_overview(holdings, weighted_scores, manager, _prices)
+
+with tab_performance:
+    _render_performance(holdings)
+
+with tab_transactions:
+    _render_transactions(manager)
+
+# Sidebar quick stats — divider, heading and rows rendered as one markdown element
+_quick_stat_rows = "".join(
+    f'<div style="display:flex;justify-content:space-between;padding:4px 0;'
+    f'border-bottom:1px solid {THEME["border"]}">'
+    f'<span style="color:{THEME["text_secondary"]}">{label}</span>'
+    f'<span style="font-weight:600;color:{THEME["text_primary"]}">{value}</span></div>'
+    for label, value in (
+        ("Market Value", f"${summary.total_market_value:,.0f}"),
+        ("Unrealized P&L", f"${summary.unrealized_pnl:+,.0f}"),
+        ("Positions", summary.position_count),
+        ("Cash Invested", f"${summary.cash_invested:,.0f}"),
+        ("Cash Received", f"${summary.cash_received:,.0f}"),
+    )
+)
 st.sidebar.markdown(
+    '<hr style="margin:1em 0">'
     f'<div style="font-size:0.75rem;font-weight:700;text-transform:uppercase;'
-    f'letter-spacing:0.05em;color:{THEME["text_secondary"]};padding:4px 0 8px">Quick Stats</div>',
+    f'letter-spacing:0.05em;color:{THEME["text_secondary"]};padding:4px 0 8px">Quick Stats</div>'
+    f'<div style="font-size:0.9rem;margin-bottom:12px">{_quick_stat_rows}</div>',
     unsafe_allow_html=True,
 )
-st.sidebar.metric("Market Value", f"${summary.total_market_value:,.0f}")
-st.sidebar.metric("Unrealized P&L", f"${summary.unrealized_pnl:+,.0f}")
-st.sidebar.metric("Positions", summary.position_count)
-st.sidebar.metric("Cash Invested", f"${summary.cash_invested:,.0f}")
-st.sidebar.metric("Cash Received", f"${summary.cash_received:,.0f}")
+
+st.sidebar.button(
+    "Refresh Prices",
+    on_click=refresh_portfolio_prices,
+    help="Fetch live prices now instead of waiting for the 5-minute cache",
+    use_container_width=True,
+)
 
 page_footer()
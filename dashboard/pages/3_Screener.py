@@ -21,6 +21,7 @@ from dashboard.utils.bulk_data import (
     get_screener_results,
     has_precomputed_scores,
 )
+from dashboard.utils.csv_export import export_csv_bytes
 from dashboard.utils.price_data import get_batch_price_data
 from dashboard.utils.sidebar import render_full_sidebar
 from dashboard.utils.watchlist import add_stock, get_stocks
@@ -51,6 +52,17 @@ def _format_score_note(result: dict) -> str:
     return f"Screen: {f_part}, {z_part}"
 
 
+@st.cache_data(ttl=60, max_entries=8, show_spinner=False)
+def _results_csv(results: list) -> bytes:
+    """Serialize screener results for export, with CSV injection protection.
+
+    Keyed on the result rows themselves, so pagination and other reruns
+    over the same results reuse the bytes, and a refreshed result set
+    always exports what the table shows.
+    """
+    return export_csv_bytes(pd.DataFrame(results))
+
+
 # Data freshness indicator in sidebar
 with st.sidebar:
     st.subheader("Data Status")
@@ -206,12 +218,9 @@ with col1:
 with col2:
     # Export all results as CSV
     if results:
-        from dashboard.utils.csv_export import sanitize_csv_dataframe
-        df_export = sanitize_csv_dataframe(pd.DataFrame(results))
-        csv = df_export.to_csv(index=False)
         st.download_button(
             "Export CSV",
-            csv,
+            _results_csv(results),
             file_name="screener_results.csv",
             mime="text/csv",
         )
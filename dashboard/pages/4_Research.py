@@ -17,6 +17,7 @@ from dashboard.components.research import (
     render_analytics_tab,
 )
 from dashboard.styles import inject_global_styles, page_footer
+from dashboard.utils.session_state import init_page_state, reset_page_state
 from dashboard.utils.sidebar import render_full_sidebar
 
 st.set_page_config(page_title="Research | Asymmetric", layout="wide")
@@ -32,16 +33,15 @@ render_page_header(
 )
 
 # Initialize session state for wizard
-if "research_step" not in st.session_state:
-    st.session_state.research_step = 0
-if "research_ticker" not in st.session_state:
-    st.session_state.research_ticker = None
-if "research_scores" not in st.session_state:
-    st.session_state.research_scores = None
-if "research_ai_analysis" not in st.session_state:
-    st.session_state.research_ai_analysis = None
-if "research_thesis_draft" not in st.session_state:
-    st.session_state.research_thesis_draft = {}
+init_page_state("research")
+
+# Wizard data that makes the Reset button worth showing
+_WIZARD_DATA_KEYS = (
+    "research_ticker",
+    "research_scores",
+    "research_ai_analysis",
+    "research_thesis_draft",
+)
 
 # Tab selection
 tab1, tab2, tab3 = st.tabs(["New Research", "Review Outcomes", "Analytics"])
@@ -61,33 +61,19 @@ with tab1:
     # Reset button (always visible)
     st.divider()
 
-    has_data = (
-        st.session_state.research_ticker
-        or st.session_state.research_scores
-        or st.session_state.research_ai_analysis
-        or st.session_state.research_thesis_draft
-    )
-
-    if has_data:
+    if any(st.session_state[key] for key in _WIZARD_DATA_KEYS):
         col1, col2 = st.columns([3, 1])
         with col2:
             if st.button("Reset Wizard", type="secondary", use_container_width=True):
-                if "confirm_reset" not in st.session_state:
-                    st.session_state.confirm_reset = False
                 st.session_state.confirm_reset = True
                 st.rerun()
 
-        if st.session_state.get("confirm_reset", False):
+        if st.session_state.confirm_reset:
             st.warning("This will clear all unsaved research data. Are you sure?")
             conf_col1, conf_col2, conf_col3 = st.columns([1, 1, 2])
             with conf_col1:
                 if st.button("Yes, Reset", type="primary"):
-                    st.session_state.research_step = 0
-                    st.session_state.research_ticker = None
-                    st.session_state.research_scores = None
-                    st.session_state.research_ai_analysis = None
-                    st.session_state.research_thesis_draft = {}
-                    st.session_state.confirm_reset = False
+                    reset_page_state("research")
                     st.rerun()
             with conf_col2:
                 if st.button("Cancel"):
@@ -274,12 +274,14 @@ if st.session_state.compare_results:
                         with thesis_col2:
                             if st.button("Create Thesis", type="secondary", use_container_width=True):
                                 from dashboard.utils.decisions import create_thesis_from_comparison
+                                from dashboard.utils.decisions_cache import clear_decisions_cache
 
                                 try:
                                     thesis_id = create_thesis_from_comparison(
                                         ticker=ticker_for_thesis,
                                         comparison_result=ai_result,
                                     )
+                                    clear_decisions_cache()
                                     st.success(f"Thesis created! ID: {thesis_id}")
                                     st.caption("View it in the Decisions page.")
                                 except Exception as e:
@@ -1,7 +1,7 @@
 """
 Decisions Page - Track investment theses and decision log.
 
-Four tabs: My Decisions, Theses Library, Review Outcomes, Analytics.
+Four views: My Decisions, Theses Library, Review Outcomes, Analytics.
 Tab logic lives in dashboard/components/decisions/ for maintainability.
 """
 
@@ -16,11 +16,12 @@ from dashboard.components.decisions import (
     render_theses_tab,
 )
 from dashboard.components.page_header import render_page_header
+from dashboard.config import DECISIONS_VIEW_KEY, DECISIONS_VIEWS
 from dashboard.styles import inject_global_styles, page_footer
-from dashboard.utils.decisions import get_decision_by_id, get_thesis_by_id
+from dashboard.utils.decisions_cache import get_cached_entities
 from dashboard.utils.session_state import init_page_state
 from dashboard.utils.sidebar import render_full_sidebar
-from dashboard.utils.watchlist import get_stocks
+from dashboard.utils.watchlist_cache import get_cached_ticker_options
 
 st.set_page_config(page_title="Decisions | Asymmetric", layout="wide")
 
@@ -44,19 +45,43 @@ with st.container():
         if st.button("Research Wizard", type="secondary", use_container_width=True):
             st.switch_page("pages/4_Research.py")
 
-# Get watchlist for ticker filters
-watchlist_stocks = get_stocks()
-ticker_options = [""] + sorted(watchlist_stocks)
+# Get watchlist for ticker filters (one tuple shared by both views)
+ticker_options = get_cached_ticker_options()
 
 
 # --- Detail view handlers (shown in sidebar) ---
+# Buttons use on_click callbacks: the state change lands before the next
+# script pass, so no extra st.rerun() (and full re-query) is needed.
 
-def _handle_decision_detail() -> bool:
+def _close_decision_detail() -> None:
+    """Button callback: close the decision detail view."""
+    st.session_state.selected_decision_id = None
+
+
+def _close_thesis_detail() -> None:
+    """Button callback: close the thesis detail view."""
+    st.session_state.selected_thesis_id = None
+
+
+def _view_thesis(thesis_id: int) -> None:
+    """Button callback: switch the sidebar to the decision's thesis."""
+    st.session_state.selected_thesis_id = thesis_id
+    st.session_state.selected_decision_id = None
+
+
+def _edit_thesis(thesis_id: int) -> None:
+    """Button callback: open the thesis edit form."""
+    st.session_state.editing_thesis_id = thesis_id
+    st.session_state.selected_thesis_id = None
+    # The edit form lives in the Theses Library view
+    st.session_state[DECISIONS_VIEW_KEY] = "Theses Library"
+
+
+def _handle_decision_detail(decision: dict | None) -> bool:
     """Handle decision detail view in sidebar. Returns True if showing."""
     if not st.session_state.selected_decision_id:
         return False
 
-    decision = get_decision_by_id(st.session_state.selected_decision_id)
     if not decision:
         st.session_state.selected_decision_id = None
         return False
@@ -67,25 +92,31 @@ def _handle_decision_detail() -> bool:
 
         col1, col2 = st.columns(2)
         with col1:
-            if st.button("Close", use_container_width=True):
-                st.session_state.selected_decision_id = None
-                st.rerun()
+            st.button(
+                "Close",
+                use_container_width=True,
+                key="close_decision_detail",
+                on_click=_close_decision_detail,
+            )
         with col2:
             thesis_id = decision.get("thesis_id")
-            if thesis_id and st.button("View Thesis", use_container_width=True):
-                st.session_state.selected_thesis_id = thesis_id
-                st.session_state.selected_decision_id = None
-                st.rerun()
+            if thesis_id:
+                st.button(
+                    "View Thesis",
+                    use_container_width=True,
+                    key="view_decision_thesis",
+                    on_click=_view_thesis,
+                    args=(thesis_id,),
+                )
 
     return True
 
 
-def _handle_thesis_detail() -> bool:
+def _handle_thesis_detail(thesis: dict | None) -> bool:
     """Handle thesis detail view in sidebar. Returns True if showing."""
     if not st.session_state.selected_thesis_id:
         return False
 
-    thesis = get_thesis_by_id(st.session_state.selected_thesis_id)
     if not thesis:
         st.session_state.selected_thesis_id = None
         return False
@@ -96,40 +127,59 @@ def _handle_thesis_detail() -> bool:
 
         col1, col2 = st.columns(2)
         with col1:
-            if st.button("Close", use_container_width=True):
-                st.session_state.selected_thesis_id = None
-                st.rerun()
+            st.button(
+                "Close",
+                use_container_width=True,
+                key="close_thesis_detail",
+                on_click=_close_thesis_detail,
+            )
         with col2:
-            if st.button("Edit", use_container_width=True):
-                st.session_state.editing_thesis_id = thesis["id"]
-                st.session_state.selected_thesis_id = None
-                st.rerun()
+            st.button(
+                "Edit",
+                use_container_width=True,
+                key="edit_thesis_detail",
+                on_click=_edit_thesis,
+                args=(thesis["id"],),
+            )
 
     return True
 
 
 # Handle detail views (show in sidebar) — mutually exclusive
+selected_decision_id = st.session_state.selected_decision_id
+selected_thesis_id = st.session_state.selected_thesis_id
+
 # If both are set (e.g., user clicked decision then thesis), prefer the most recent
-if st.session_state.selected_decision_id and st.session_state.selected_thesis_id:
+if selected_decision_id and selected_thesis_id:
     # Both set — clear the decision (thesis was selected more recently via "View Thesis")
-    st.session_state.selected_decision_id = None
+    st.session_state.selected_decision_id = selected_decision_id = None
 
-if not _handle_decision_detail():
-    _handle_thesis_detail()
+# Fetch whichever details are selected in a single round-trip
+decisions_by_id, theses_by_id = get_cached_entities(
+    (selected_decision_id,) if selected_decision_id else (),
+    (selected_thesis_id,) if selected_thesis_id else (),
+)
 
-# Tab layout
-tab1, tab2, tab3, tab4 = st.tabs(["My Decisions", "Theses Library", "Review Outcomes", "Analytics"])
+if not _handle_decision_detail(decisions_by_id.get(selected_decision_id)):
+    _handle_thesis_detail(theses_by_id.get(selected_thesis_id))
+
+# View selector — st.tabs runs every tab body on each rerun, so a radio
+# selector is used instead and only the active view fetches its data
+active_view = st.radio(
+    "View",
+    options=DECISIONS_VIEWS,
+    horizontal=True,
+    label_visibility="collapsed",
+    key=DECISIONS_VIEW_KEY,
+)
 
-with tab1:
+if active_view == "My Decisions":
     render_decisions_tab(ticker_options)
-
-with tab2:
+elif active_view == "Theses Library":
     render_theses_tab(ticker_options)
-
-with tab3:
+elif active_view == "Review Outcomes":
     render_outcomes_tab()
-
-with tab4:
+else:
     render_analytics_tab()
 
 # Footer
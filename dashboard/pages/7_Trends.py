@@ -5,18 +5,16 @@ Visualizes F-Score and Z-Score changes over time using Plotly charts.
 Supports trend detection (improving, declining, consistent, turnaround).
 """
 
-import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+
 import pandas as pd
+import streamlit as st
 
 from asymmetric.core.trends import TrendAnalyzer
-from asymmetric.db.database import get_session
-from asymmetric.db.models import Stock
 from dashboard.components.page_header import render_page_header
-from dashboard.styles import inject_global_styles, section_header, empty_state, page_footer
-from dashboard.theme import get_semantic_color, get_plotly_theme, get_plotly_chart_config
+from dashboard.styles import empty_state, inject_global_styles, page_footer, section_header
+from dashboard.theme import get_plotly_chart_config, get_plotly_layout, get_semantic_color
 from dashboard.utils.sidebar import render_full_sidebar
 
 # Render sidebar (theme toggle, branding, navigation)
@@ -29,9 +27,168 @@ render_page_header(
     breadcrumbs=[("Home", "app.py"), ("Trends", "")],
 )
 
+_HISTORY_COLUMNS = (
+    "Year", "Period", "F-Score", "Z-Score", "Zone", "Profitability", "Leverage", "Efficiency",
+)
+_history_record = attrgetter(
+    "fiscal_year", "fiscal_period", "piotroski_score", "altman_z_score", "altman_zone",
+    "piotroski_profitability", "piotroski_leverage", "piotroski_efficiency",
+)
+_FIGURE_COLUMNS = ["Year", "F-Score", "Z-Score", "Profitability", "Leverage", "Efficiency"]
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _score_history_figures(ticker: str, rows: tuple) -> tuple:
+    """Build the score history and F-Score component figures for one ticker.
+
+    ``rows`` holds one (year, F, Z, profitability, leverage, efficiency)
+    tuple per period, already sorted by year. It doubles as the cache key,
+    so reruns over unchanged history reuse both figures.
+
+    Returns:
+        Tuple of (dual-axis score figure, stacked component figure).
+    """
+    # Plotly is only needed here, on a cache miss in the Stock History tab
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    from asymmetric.core.scoring.constants import ZSCORE_MFG_GREY_LOW, ZSCORE_MFG_SAFE
+
+    years, fscores, zscores, profitability, leverage, efficiency = zip(*rows)
+
+    # Dual-axis chart: F-Score on the primary axis, Z-Score on the secondary
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    for name, values, color, secondary in (
+        ("F-Score", fscores, get_semantic_color("blue"), False),
+        ("Z-Score", zscores, get_semantic_color("gray"), True),
+    ):
+        fig.add_trace(
+            go.Scatter(
+                x=years,
+                y=values,
+                name=name,
+                mode="lines+markers",
+                line=dict(color=color, width=3),
+                marker=dict(size=10)
+            ),
+            secondary_y=secondary
+        )
+
+    # Zone bands on the Z-Score axis (y2), passed as plain layout shapes in
+    # the single update_layout call instead of one add_hline round each
+    bands = (
+        (ZSCORE_MFG_SAFE, "green", "Safe Zone"),
+        (ZSCORE_MFG_GREY_LOW, "red", "Distress Zone"),
+    )
+    fig.update_layout(**get_plotly_layout(
+        title=f"{ticker} Score History",
+        hovermode="x unified",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02),
+        shapes=[
+            dict(type="line", xref="paper", x0=0, x1=1, yref="y2", y0=y, y1=y,
+                 line=dict(dash="dash", color=get_semantic_color(color)))
+            for y, color, _ in bands
+        ],
+        annotations=[
+            dict(text=label, xref="paper", x=1, xanchor="right", yref="y2", y=y,
+                 yanchor="bottom", showarrow=False)
+            for y, _, label in bands
+        ],
+    ))
+    fig.update_yaxes(title_text="F-Score (0-9)", secondary_y=False, range=[0, 9])
+    fig.update_yaxes(title_text="Z-Score", secondary_y=True)
+
+    # Component stack: data and layout passed to the constructor in one go
+    comp_fig = go.Figure(
+        data=[
+            go.Bar(name="Profitability (0-4)", x=years, y=profitability),
+            go.Bar(name="Leverage (0-3)", x=years, y=leverage),
+            go.Bar(name="Efficiency (0-2)", x=years, y=efficiency),
+        ],
+        layout=get_plotly_layout(barmode="stack", title="F-Score Components by Year"),
+    )
+    return fig, comp_fig
+
+
+# Improving/declining/turnaround result tables: one st.dataframe per list
+# instead of a bordered container of metrics per stock.
+_TREND_COLUMNS = ("Ticker", "Company", "F-Score", "F-Score Change", "Z-Score", "Zone", "Periods")
+_trend_record = attrgetter(
+    "ticker", "company_name", "current_fscore", "fscore_change",
+    "current_zscore", "current_zone", "periods_analyzed",
+)
+_TURNAROUND_COLUMNS = (
+    "Ticker", "Company", "From Zone", "To Zone", "Z-Score", "Z-Score Change", "F-Score",
+)
+_turnaround_record = attrgetter(
+    "ticker", "company_name", "previous_zone", "current_zone",
+    "current_zscore", "zscore_improvement", "current_fscore",
+)
+_RESULT_COLUMN_CONFIG = {
+    "F-Score": st.column_config.NumberColumn(format="%d/9"),
+    "F-Score Change": st.column_config.NumberColumn(format="%+.1f"),
+    "Z-Score": st.column_config.NumberColumn(format="%.2f"),
+    "Z-Score Change": st.column_config.NumberColumn(format="%+.2f"),
+}
+
+
+def _render_results(results: list, record, columns: tuple) -> None:
+    """Render a list of trend results as a single table."""
+    df = pd.DataFrame.from_records(map(record, results), columns=columns)
+    st.dataframe(df, use_container_width=True, hide_index=True, column_config=_RESULT_COLUMN_CONFIG)
+
+
 # Initialize analyzer
 analyzer = TrendAnalyzer()
 
+_TREND_RESULTS_KEY = "trend_scan_results"
+_HISTORY_STATE_KEY = "_trend_history"
+
+
+def _load_history(ticker: str, years: int) -> tuple:
+    """Score history and trend for the Stock History tab.
+
+    Kept in session state and reloaded only when the ticker or year range
+    changes, so reruns triggered from the other tabs skip both queries.
+
+    Returns:
+        Tuple of (history newest first, TrendResult or None).
+    """
+    cached = st.session_state.get(_HISTORY_STATE_KEY)
+    if cached is not None and cached[0] == (ticker, years):
+        return cached[1], cached[2]
+
+    history = analyzer.get_score_history(ticker, years=years)
+    trend = analyzer.calculate_trend(ticker, periods=min(4, len(history))) if history else None
+    st.session_state[_HISTORY_STATE_KEY] = ((ticker, years), history, trend)
+    return history, trend
+
+
+def _scan_trends(
+    min_improvement: int,
+    periods: int,
+    min_decline: int,
+    decline_periods: int,
+) -> tuple:
+    """Run the improving, declining and turnaround scans concurrently.
+
+    Each scan walks every ticker's score history with its own DB sessions,
+    so running them on worker threads overlaps their query waits.
+
+    Returns:
+        Tuple of (improving, declining, turnarounds) result lists.
+    """
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="trend-scan") as pool:
+        improving = pool.submit(
+            analyzer.find_improving, min_improvement=min_improvement, periods=periods, limit=20
+        )
+        declining = pool.submit(
+            analyzer.find_declining, min_decline=min_decline, periods=decline_periods, limit=20
+        )
+        turnarounds = pool.submit(analyzer.find_turnaround, limit=20)
+    return improving.result(), declining.result(), turnarounds.result()
+
+
 # Tabs for different views
 tab_history, tab_improving, tab_declining, tab_turnaround = st.tabs([
     "Stock History",
@@ -50,124 +207,55 @@ with tab_history:
             "Enter Ticker",
             placeholder="AAPL",
             key="trend_ticker"
-        ).upper()
+        ).strip().upper()
     with col2:
         years = st.selectbox("Years", [3, 5, 10], index=1)
 
     if ticker:
-        history = analyzer.get_score_history(ticker, years=years)
+        history, trend = _load_history(ticker, years)
 
         if not history:
             st.info(f"No score history found for {ticker}. Score the stock first using the CLI or Compare page.")
         else:
-            # Filter out records with NULL fiscal data and convert to DataFrame
-            valid_history = [
-                h for h in history
-                if h.fiscal_year is not None and h.fiscal_period is not None
-            ]
-
-            if not valid_history:
-                st.info(f"No valid historical score data available for {ticker}.")
-            else:
-                # Convert to DataFrame for plotting
-                df = pd.DataFrame([{
-                    "Year": h.fiscal_year,
-                    "Period": h.fiscal_period,
-                    "F-Score": h.piotroski_score,
-                    "Z-Score": h.altman_z_score,
-                    "Zone": h.altman_zone,
-                    "Profitability": h.piotroski_profitability,
-                    "Leverage": h.piotroski_leverage,
-                    "Efficiency": h.piotroski_efficiency,
-                } for h in valid_history])
-
-                # Sort by year
-                df = df.sort_values("Year")
-
-                # Create dual-axis chart
-                fig = make_subplots(specs=[[{"secondary_y": True}]])
-
-                # Get theme-aware colors for chart lines
-                blue = get_semantic_color('blue')
-                gray = get_semantic_color('gray')
-
-                # F-Score line (primary y-axis)
-                fig.add_trace(
-                    go.Scatter(
-                        x=df["Year"],
-                        y=df["F-Score"],
-                        name="F-Score",
-                        mode="lines+markers",
-                        line=dict(color=blue, width=3),
-                        marker=dict(size=10)
-                    ),
-                    secondary_y=False
-                )
-
-                # Z-Score line (secondary y-axis)
-                fig.add_trace(
-                    go.Scatter(
-                        x=df["Year"],
-                        y=df["Z-Score"],
-                        name="Z-Score",
-                        mode="lines+markers",
-                        line=dict(color=gray, width=3),
-                        marker=dict(size=10)
-                    ),
-                    secondary_y=True
-                )
-
-                # Add zone bands to Z-Score axis
-                green = get_semantic_color('green')
-                red = get_semantic_color('red')
-                from asymmetric.core.scoring.constants import ZSCORE_MFG_GREY_LOW, ZSCORE_MFG_SAFE
-
-                fig.add_hline(y=ZSCORE_MFG_SAFE, line_dash="dash", line_color=green,
-                             annotation_text="Safe Zone", secondary_y=True)
-                fig.add_hline(y=ZSCORE_MFG_GREY_LOW, line_dash="dash", line_color=red,
-                             annotation_text="Distress Zone", secondary_y=True)
-
-                fig.update_layout(
-                    title=f"{ticker} Score History",
-                    hovermode="x unified",
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02),
-                    **get_plotly_theme()
-                )
-                fig.update_yaxes(title_text="F-Score (0-9)", secondary_y=False, range=[0, 9])
-                fig.update_yaxes(title_text="Z-Score", secondary_y=True)
-
-                st.plotly_chart(fig, use_container_width=True, config=get_plotly_chart_config())
-
-                # Trend calculation
-                trend = analyzer.calculate_trend(ticker, periods=min(4, len(valid_history)))
-                if trend:
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        direction_icon = {"improving": "+", "declining": "-", "stable": "="}
-                        st.metric(
-                            "F-Score Trend",
-                            trend.trend_direction.title(),
-                            f"{direction_icon.get(trend.trend_direction, '=')} {abs(trend.fscore_change):.1f} pts"
-                        )
-                    with col2:
-                        zone_change_text = f"{trend.previous_zone} -> {trend.current_zone}" if trend.zone_changed else "No change"
-                        st.metric(
-                            "Z-Score Trend",
-                            f"{trend.zscore_change:+.2f}",
-                            zone_change_text
-                        )
-                    with col3:
-                        st.metric("Periods Analyzed", trend.periods_analyzed)
-
-                # F-Score component breakdown
-                section_header("F-Score Component Breakdown")
-                if "Profitability" in df.columns:
-                    comp_fig = go.Figure()
-                    comp_fig.add_trace(go.Bar(name="Profitability (0-4)", x=df["Year"], y=df["Profitability"]))
-                    comp_fig.add_trace(go.Bar(name="Leverage (0-3)", x=df["Year"], y=df["Leverage"]))
-                    comp_fig.add_trace(go.Bar(name="Efficiency (0-2)", x=df["Year"], y=df["Efficiency"]))
-                    comp_fig.update_layout(barmode="stack", title="F-Score Components by Year", **get_plotly_theme())
-                    st.plotly_chart(comp_fig, use_container_width=True, config=get_plotly_chart_config())
+            # Convert to DataFrame for plotting; history comes newest first
+            # (ordered in SQL), so reversing it gives oldest-to-newest years
+            df = pd.DataFrame.from_records(
+                map(_history_record, reversed(history)), columns=_HISTORY_COLUMNS
+            )
+
+            fig, comp_fig = _score_history_figures(
+                ticker, tuple(df[_FIGURE_COLUMNS].itertuples(index=False, name=None))
+            )
+            st.plotly_chart(fig, use_container_width=True, config=get_plotly_chart_config())
+
+            # Trend calculation
+            if trend:
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    direction_icon = {"improving": "+", "declining": "-", "stable": "="}
+                    st.metric(
+                        "F-Score Trend",
+                        trend.trend_direction.title(),
+                        f"{direction_icon.get(trend.trend_direction, '=')} "
+                        f"{abs(trend.fscore_change):.1f} pts",
+                    )
+                with col2:
+                    zone_change_text = (
+                        f"{trend.previous_zone} -> {trend.current_zone}"
+                        if trend.zone_changed
+                        else "No change"
+                    )
+                    st.metric(
+                        "Z-Score Trend",
+                        f"{trend.zscore_change:+.2f}",
+                        zone_change_text
+                    )
+                with col3:
+                    st.metric("Periods Analyzed", trend.periods_analyzed)
+
+            # F-Score component breakdown
+            section_header("F-Score Component Breakdown")
+            st.plotly_chart(comp_fig, use_container_width=True, config=get_plotly_chart_config())
 
             # Raw data table
             with st.expander("View Raw Data"):
@@ -183,33 +271,7 @@ with tab_improving:
     with col2:
         periods = st.slider("Over Periods", 2, 8, 4)
 
-    if st.button("Find Improving Stocks", key="find_improving"):
-        with st.spinner("Analyzing trends..."):
-            improving = analyzer.find_improving(
-                min_improvement=min_improvement,
-                periods=periods,
-                limit=20
-            )
-
-            if improving:
-                for trend in improving:
-                    with st.container(border=True):
-                        col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
-                        with col1:
-                            st.markdown(f"**{trend.ticker}**")
-                        with col2:
-                            st.metric("F-Score", f"{trend.current_fscore}/9", f"+{trend.fscore_change:.1f}")
-                        with col3:
-                            st.metric("Z-Score", f"{trend.current_zscore:.2f}" if trend.current_zscore else "N/A")
-                        with col4:
-                            st.caption(f"{trend.periods_analyzed} periods")
-            else:
-                from dashboard.components.icons import trending_up as trend_up_icon
-                empty_state(
-                    icon_html=trend_up_icon(size=48),
-                    title="No improving stocks found",
-                    message="Try adjusting the filters or score more stocks first.",
-                )
+    find_improving = st.button("Find Improving Stocks", key="find_improving")
 
 with tab_declining:
     section_header("Declining Stocks")
@@ -221,64 +283,62 @@ with tab_declining:
     with col2:
         decline_periods = st.slider("Over Periods", 2, 8, 4, key="decline_periods")
 
-    if st.button("Find Declining Stocks", key="find_declining"):
-        with st.spinner("Analyzing trends..."):
-            declining = analyzer.find_declining(
-                min_decline=min_decline,
-                periods=decline_periods,
-                limit=20
-            )
-
-            if declining:
-                for trend in declining:
-                    with st.container(border=True):
-                        col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
-                        with col1:
-                            st.markdown(f"**{trend.ticker}**")
-                        with col2:
-                            st.metric("F-Score", f"{trend.current_fscore}/9", f"{trend.fscore_change:.1f}")
-                        with col3:
-                            st.metric("Zone", trend.current_zone or "N/A")
-                        with col4:
-                            st.caption(f"{trend.periods_analyzed} periods")
-            else:
-                from dashboard.components.icons import trending_down as trend_down_icon
-                empty_state(
-                    icon_html=trend_down_icon(size=48),
-                    title="No declining stocks found",
-                    message="No stocks found meeting the decline criteria.",
-                )
+    find_declining = st.button("Find Declining Stocks", key="find_declining")
 
 with tab_turnaround:
     section_header("Turnaround Candidates")
     st.caption("Stocks that moved from Distress to Grey/Safe zone - potential recovery plays")
 
-    if st.button("Find Turnarounds", key="find_turnarounds"):
-        with st.spinner("Scanning for turnarounds..."):
-            turnarounds = analyzer.find_turnaround(limit=20)
-
-            if turnarounds:
-                for t in turnarounds:
-                    with st.container(border=True):
-                        col1, col2, col3 = st.columns([2, 2, 1])
-                        with col1:
-                            st.markdown(f"**{t.ticker}**")
-                            st.caption(f"Zone: {t.previous_zone} \u2192 {t.current_zone}")
-                        with col2:
-                            st.metric(
-                                "Z-Score Change",
-                                f"{t.current_zscore:.2f}" if t.current_zscore else "N/A",
-                                f"+{t.zscore_improvement:.2f}" if t.zscore_improvement else None
-                            )
-                        with col3:
-                            st.metric("F-Score", f"{t.current_fscore}/9" if t.current_fscore else "N/A")
-            else:
-                from dashboard.components.icons import refresh as refresh_icon
-                empty_state(
-                    icon_html=refresh_icon(size=48),
-                    title="No turnaround candidates",
-                    message="These are stocks that transitioned from Distress zone to Grey or Safe.",
-                )
+    find_turnarounds = st.button("Find Turnarounds", key="find_turnarounds")
+
+# Any of the three buttons runs all three scans; the results stay in session
+# state so switching to another tab shows its list without a second click.
+# They are stored with the slider values they were computed from and dropped
+# once any of those values change, so no table shows results for old filters.
+scan_params = (min_improvement, periods, min_decline, decline_periods)
+if find_improving or find_declining or find_turnarounds:
+    with st.spinner("Analyzing trends..."):
+        st.session_state[_TREND_RESULTS_KEY] = (scan_params, _scan_trends(*scan_params))
+
+trend_results = st.session_state.get(_TREND_RESULTS_KEY)
+if trend_results is not None and trend_results[0] != scan_params:
+    del st.session_state[_TREND_RESULTS_KEY]
+    trend_results = None
+if trend_results is not None:
+    improving, declining, turnarounds = trend_results[1]
+
+    with tab_improving:
+        if improving:
+            _render_results(improving, _trend_record, _TREND_COLUMNS)
+        else:
+            from dashboard.components.icons import trending_up as trend_up_icon
+            empty_state(
+                icon_html=trend_up_icon(size=48),
+                title="No improving stocks found",
+                message="Try adjusting the filters or score more stocks first.",
+            )
+
+    with tab_declining:
+        if declining:
+            _render_results(declining, _trend_record, _TREND_COLUMNS)
+        else:
+            from dashboard.components.icons import trending_down as trend_down_icon
+            empty_state(
+                icon_html=trend_down_icon(size=48),
+                title="No declining stocks found",
+                message="No stocks found meeting the decline criteria.",
+            )
+
+    with tab_turnaround:
+        if turnarounds:
+            _render_results(turnarounds, _turnaround_record, _TURNAROUND_COLUMNS)
+        else:
+            from dashboard.components.icons import refresh as refresh_icon
+            empty_state(
+                icon_html=refresh_icon(size=48),
+                title="No turnaround candidates",
+                message="These are stocks that transitioned from Distress zone to Grey or Safe.",
+            )
 
 # Sidebar info
 st.sidebar.markdown("---")
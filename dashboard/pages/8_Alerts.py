@@ -3,23 +3,56 @@ Alerts Page - Configure and monitor watchlist alerts.
 
 Set up F-Score and Z-Score threshold alerts for your watchlist stocks.
 View alert history and acknowledge triggered alerts.
-"""
 
-from datetime import datetime
+Each tab body and the sidebar summary render as fragments, so a filter
+change or button click reruns only the section that owns it.
+"""
 
+import pandas as pd
 import streamlit as st
 
 from asymmetric.core.alerts import AlertChecker
-from asymmetric.db.database import get_session
-from asymmetric.db.models import Stock
+from asymmetric.core.alerts.checker import AlertTrigger
 from dashboard.components.page_header import render_page_header
-from dashboard.styles import inject_global_styles, section_header, empty_state, page_footer
-from dashboard.theme import SEMANTIC_COLORS
+from dashboard.config import ALERTS_BATCH_SIZE
+from dashboard.styles import empty_state, inject_global_styles, page_footer, section_header
+from dashboard.utils.fragments import fragment
+from dashboard.utils.session_state import init_page_state
 from dashboard.utils.sidebar import render_full_sidebar
 
+# Alert condition text, formatted per row with the alert's threshold
+_ALERT_TEMPLATES = {
+    "fscore_above": "F-Score > {value}",
+    "fscore_below": "F-Score < {value}",
+    "zscore_above": "Z-Score > {value}",
+    "zscore_below": "Z-Score < {value}",
+    "zscore_zone": "Zone = {zone}",
+}
+
+_ALERT_TYPE_LABELS = {
+    "fscore_above": "F-Score rises above",
+    "fscore_below": "F-Score falls below",
+    "zscore_above": "Z-Score rises above",
+    "zscore_below": "Z-Score falls below",
+    "zscore_zone": "Z-Score enters zone",
+}
+
+_ALERT_TYPES = tuple(_ALERT_TYPE_LABELS)
+_ZONE_OPTIONS = ("Safe", "Grey", "Distress")
+_SEVERITY_OPTIONS = ("info", "warning", "critical")
+_STATUS_FILTER_OPTIONS = ("All", "Active Only", "Inactive Only")
+_HISTORY_LIMIT_OPTIONS = (10, 25, 50, 100)
+
+
+def _format_alert_type(alert_type: str) -> str:
+    """Label for the Alert Type selectbox options."""
+    return _ALERT_TYPE_LABELS.get(alert_type, alert_type)
+
+
 # Render sidebar (theme toggle, branding, navigation)
 render_full_sidebar(current_page="alerts")
 inject_global_styles()
+init_page_state("alerts")
 
 render_page_header(
     title="Alerts",
@@ -27,17 +60,151 @@ render_page_header(
     breadcrumbs=[("Home", "app.py"), ("Alerts", "")],
 )
 
-# Initialize checker
-checker = AlertChecker()
 
-# Tabs for different views
-tab_config, tab_history, tab_check = st.tabs([
-    "Configure Alerts",
-    "Alert History",
-    "Check Now"
-])
+@st.cache_resource
+def get_checker() -> AlertChecker:
+    """Get a cached AlertChecker instance.
 
-with tab_config:
+    The checker holds no per-request state and opens short-lived sessions
+    from the shared engine, so one instance can serve every rerun.
+    """
+    return AlertChecker()
+
+
+checker = get_checker()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_alert_summary() -> dict[str, int]:
+    """Fetch the sidebar alert counts (one aggregate query).
+
+    Shared by every caller in a run; the sidebar fragment re-reads it on
+    its own timer, so no spinner flashes when the entry expires.
+    """
+    return get_checker().get_summary()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _run_alert_check(ticker: str | None) -> list[AlertTrigger]:
+    """Check alerts for one ticker (or all), reusing the result for 30s.
+
+    Repeated "Check Now" clicks inside the window return the previous
+    triggers instead of rescanning every active alert.
+    """
+    triggers = get_checker().check_ticker(ticker) if ticker else get_checker().check_all()
+    # A real check may record history and flip triggered flags
+    _get_alert_summary.clear()
+    return triggers
+
+
+def _build_alert_frame(alerts: list[tuple]) -> pd.DataFrame:
+    """Build the alert list grid from (Alert, ticker) tuples."""
+    rows = {
+        "Ticker": [],
+        "Condition": [],
+        "Severity": [],
+        "Active": [],
+        "Triggered": [],
+        "Remove": [],
+    }
+    for alert, alert_ticker in alerts:
+        template = _ALERT_TEMPLATES.get(alert.alert_type)
+        rows["Ticker"].append(alert_ticker)
+        rows["Condition"].append(
+            template.format(value=alert.threshold_value, zone=alert.threshold_zone)
+            if template else alert.alert_type
+        )
+        rows["Severity"].append(alert.severity)
+        rows["Active"].append(bool(alert.is_active))
+        rows["Triggered"].append(bool(alert.is_triggered))
+        rows["Remove"].append(False)
+    return pd.DataFrame(rows)
+
+
+def _remove_selected_alerts(alert_ids: tuple[int, ...]) -> None:
+    """Form callback: delete the alerts ticked in the editor, in one batch."""
+    edited_rows = st.session_state.get("alerts_editor", {}).get("edited_rows", {})
+    selected = [
+        alert_ids[int(row)]
+        for row, changes in edited_rows.items()
+        if changes.get("Remove")
+    ]
+    # Row positions refer to the list being replaced; drop them
+    st.session_state.pop("alerts_editor", None)
+    if selected:
+        checker.remove_many(selected)
+        _get_alert_summary.clear()
+
+
+def _show_more_alerts() -> None:
+    """Button callback: extend the alert list by one batch."""
+    st.session_state.alerts_shown += ALERTS_BATCH_SIZE
+
+
+def _reset_alerts_shown() -> None:
+    """Filter callback: go back to the first batch when the filters change."""
+    st.session_state.alerts_shown = ALERTS_BATCH_SIZE
+
+
+def _build_history_frame(history: list[tuple]) -> pd.DataFrame:
+    """Build the alert history grid from (AlertHistory, ticker, alert_type) tuples."""
+    rows = {
+        "Ticker": [],
+        "triggered_at": [],
+        "Message": [],
+        "Change": [],
+        "Status": [],
+        "Acknowledge": [],
+    }
+    for h, alert_ticker, _alert_type in history:
+        if h.previous_value is not None and h.current_value is not None:
+            change = f"Value: {h.previous_value:.2f} \u2192 {h.current_value:.2f}"
+        elif h.previous_zone and h.current_zone:
+            change = f"Zone: {h.previous_zone} \u2192 {h.current_zone}"
+        else:
+            change = ""
+
+        if h.acknowledged:
+            status = f"Acknowledged by {h.acknowledged_by}" if h.acknowledged_by else "Acknowledged"
+        else:
+            status = "New"
+
+        rows["Ticker"].append(alert_ticker)
+        rows["triggered_at"].append(h.triggered_at)
+        rows["Message"].append(h.message or "Alert triggered")
+        rows["Change"].append(change)
+        rows["Status"].append(status)
+        rows["Acknowledge"].append(False)
+
+    frame = pd.DataFrame(rows)
+    # Format every timestamp in one vectorized pass instead of strftime per row
+    triggered = pd.to_datetime(frame.pop("triggered_at"))
+    frame.insert(1, "Triggered", triggered.dt.strftime("%Y-%m-%d %H:%M").fillna("Unknown"))
+    return frame
+
+
+def _acknowledge_selected(pending_ids: tuple[int | None, ...]) -> None:
+    """Form callback: acknowledge the history rows ticked in the editor.
+
+    Args:
+        pending_ids: History ID per grid row, or None for rows that are
+            already acknowledged.
+    """
+    edited_rows = st.session_state.get("history_editor", {}).get("edited_rows", {})
+    selected = [
+        pending_ids[int(row)]
+        for row, changes in edited_rows.items()
+        if changes.get("Acknowledge") and pending_ids[int(row)] is not None
+    ]
+    st.session_state.pop("history_editor", None)
+    if selected:
+        checker.acknowledge_many(selected, acknowledged_by="dashboard")
+        _get_alert_summary.clear()
+
+
+@fragment
+def _render_config_tab() -> None:
+    """Render the alert creation form and the filtered alert list."""
     section_header("Configure Alerts")
 
     # Add new alert form
@@ -50,20 +217,15 @@ with tab_config:
         with col2:
             alert_type = st.selectbox(
                 "Alert Type",
-                ["fscore_above", "fscore_below", "zscore_above", "zscore_below", "zscore_zone"],
-                format_func=lambda x: {
-                    "fscore_above": "F-Score rises above",
-                    "fscore_below": "F-Score falls below",
-                    "zscore_above": "Z-Score rises above",
-                    "zscore_below": "Z-Score falls below",
-                    "zscore_zone": "Z-Score enters zone"
-                }.get(x, x)
+                _ALERT_TYPES,
+                format_func=_format_alert_type,
+                key="new_alert_type",
             )
 
         col3, col4, col5 = st.columns(3)
         with col3:
             if alert_type == "zscore_zone":
-                threshold_zone = st.selectbox("Zone", ["Safe", "Grey", "Distress"])
+                threshold_zone = st.selectbox("Zone", _ZONE_OPTIONS, key="new_alert_zone")
                 threshold_value = None
             else:
                 threshold_value = st.number_input(
@@ -75,7 +237,7 @@ with tab_config:
                 )
                 threshold_zone = None
         with col4:
-            severity = st.selectbox("Severity", ["info", "warning", "critical"])
+            severity = st.selectbox("Severity", _SEVERITY_OPTIONS, key="new_alert_severity")
         with col5:
             is_active = st.checkbox("Active", value=True)
 
@@ -92,8 +254,10 @@ with tab_config:
                     is_active=is_active
                 )
                 if alert:
+                    _get_alert_summary.clear()
+                    # The list below is fetched after this point, so the new
+                    # alert shows up without another rerun.
                     st.success(f"Alert created for {ticker}")
-                    st.rerun()
                 else:
                     st.error(f"Failed to create alert. Make sure {ticker} exists in the database.")
             except Exception as e:
@@ -107,49 +271,57 @@ with tab_config:
     # Filter options
     col1, col2 = st.columns(2)
     with col1:
-        filter_ticker = st.text_input("Filter by Ticker", key="filter_ticker").upper()
+        filter_ticker = st.text_input(
+            "Filter by Ticker", key="filter_ticker", on_change=_reset_alerts_shown
+        ).upper()
     with col2:
-        filter_active = st.selectbox("Status", ["All", "Active Only", "Inactive Only"])
-
-    active_only = filter_active == "Active Only" if filter_active != "All" else None
-    if filter_active == "Inactive Only":
-        active_only = False
+        filter_active = st.selectbox(
+            "Status",
+            _STATUS_FILTER_OPTIONS,
+            key="filter_alert_status",
+            on_change=_reset_alerts_shown,
+        )
 
+    # Fetch one row past the current window to know whether more remain
+    shown = st.session_state.alerts_shown
     alerts = checker.get_alerts(
         ticker=filter_ticker if filter_ticker else None,
-        active_only=active_only
+        active_only=filter_active == "Active Only",
+        inactive_only=filter_active == "Inactive Only",
+        limit=shown + 1,
     )
+    has_more = len(alerts) > shown
+    alerts = alerts[:shown]
 
     if alerts:
-        for alert in alerts:
-            severity_class = alert.severity if alert.severity in ("critical", "warning", "info") else "info"
-            with st.container(border=True):
-                col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
-
-                with col1:
-                    status_icon = "" if alert.is_active else " (inactive)"
-                    triggered_icon = " [TRIGGERED]" if alert.is_triggered else ""
-                    st.markdown(f"**{alert.ticker}**{status_icon}{triggered_icon}")
-
-                with col2:
-                    # Format alert condition
-                    type_labels = {
-                        "fscore_above": f"F-Score > {alert.threshold_value}",
-                        "fscore_below": f"F-Score < {alert.threshold_value}",
-                        "zscore_above": f"Z-Score > {alert.threshold_value}",
-                        "zscore_below": f"Z-Score < {alert.threshold_value}",
-                        "zscore_zone": f"Zone = {alert.threshold_zone}"
-                    }
-                    st.caption(type_labels.get(alert.alert_type, alert.alert_type))
-
-                with col3:
-                    severity_colors = {"info": "blue", "warning": "orange", "critical": "red"}
-                    st.markdown(f":{severity_colors.get(alert.severity, 'grey')}[{alert.severity}]")
-
-                with col4:
-                    if st.button("Remove", key=f"remove_{alert.id}"):
-                        checker.remove_alert(alert.id)
-                        st.rerun()
+        # One editable grid instead of a container + columns + button per alert;
+        # rows ticked in "Remove" are deleted together on submit
+        alert_ids = tuple(alert.id for alert, _ in alerts)
+        with st.form("alerts_editor_form", border=False):
+            st.data_editor(
+                _build_alert_frame(alerts),
+                column_config={
+                    "Active": st.column_config.CheckboxColumn("Active"),
+                    "Triggered": st.column_config.CheckboxColumn("Triggered"),
+                    "Remove": st.column_config.CheckboxColumn("Remove", default=False),
+                },
+                disabled=("Ticker", "Condition", "Severity", "Active", "Triggered"),
+                hide_index=True,
+                use_container_width=True,
+                key="alerts_editor",
+            )
+            st.form_submit_button(
+                "Remove Selected",
+                on_click=_remove_selected_alerts,
+                args=(alert_ids,),
+            )
+
+        if has_more:
+            st.button(
+                f"Load {ALERTS_BATCH_SIZE} more",
+                key="load_more_alerts",
+                on_click=_show_more_alerts,
+            )
     else:
         from dashboard.components.icons import bell as bell_icon
         empty_state(
@@ -158,15 +330,20 @@ with tab_config:
             message="Create one above to get started.",
         )
 
-with tab_history:
+
+@fragment
+def _render_history_tab() -> None:
+    """Render triggered-alert history with acknowledge buttons."""
     section_header("Alert History")
     st.caption("Record of triggered alerts")
 
     col1, col2 = st.columns(2)
     with col1:
-        show_unack = st.checkbox("Show unacknowledged only", value=False)
+        show_unack = st.checkbox("Show unacknowledged only", value=False, key="history_unack_only")
     with col2:
-        history_limit = st.selectbox("Show last", [10, 25, 50, 100], index=1)
+        history_limit = st.selectbox(
+            "Show last", _HISTORY_LIMIT_OPTIONS, index=1, key="history_limit"
+        )
 
     history = checker.get_alert_history(
         unacknowledged_only=show_unack,
@@ -174,32 +351,23 @@ with tab_history:
     )
 
     if history:
-        for h in history:
-            with st.container(border=True):
-                col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
-
-                with col1:
-                    st.markdown(f"**{h.ticker}**")
-                    st.caption(h.triggered_at.strftime("%Y-%m-%d %H:%M") if h.triggered_at else "Unknown")
-
-                with col2:
-                    st.caption(h.message or "Alert triggered")
-
-                with col3:
-                    if h.previous_value is not None and h.current_value is not None:
-                        st.caption(f"Value: {h.previous_value:.2f} \u2192 {h.current_value:.2f}")
-                    elif h.previous_zone and h.current_zone:
-                        st.caption(f"Zone: {h.previous_zone} \u2192 {h.current_zone}")
-
-                with col4:
-                    if h.acknowledged:
-                        st.caption("Acknowledged")
-                        if h.acknowledged_by:
-                            st.caption(f"by {h.acknowledged_by}")
-                    else:
-                        if st.button("Ack", key=f"ack_{h.id}"):
-                            checker.acknowledge_alert(h.id, acknowledged_by="dashboard")
-                            st.rerun()
+        pending_ids = tuple(None if h.acknowledged else h.id for h, _, _ in history)
+        with st.form("history_editor_form", border=False):
+            st.data_editor(
+                _build_history_frame(history),
+                column_config={
+                    "Acknowledge": st.column_config.CheckboxColumn("Acknowledge", default=False),
+                },
+                disabled=("Ticker", "Triggered", "Message", "Change", "Status"),
+                hide_index=True,
+                use_container_width=True,
+                key="history_editor",
+            )
+            st.form_submit_button(
+                "Acknowledge Selected",
+                on_click=_acknowledge_selected,
+                args=(pending_ids,),
+            )
     else:
         empty_state(
             icon_html='<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="48" height="48" fill="none" stroke="#9ca3af" stroke-width="2"><circle cx="12" cy="12" r="10"/><line x1="12" y1="8" x2="12" y2="12"/><line x1="12" y1="16" x2="12.01" y2="16"/></svg>',
@@ -207,7 +375,10 @@ with tab_history:
             message="Alerts will appear here when triggered.",
         )
 
-with tab_check:
+
+@fragment
+def _render_check_tab() -> None:
+    """Render the manual alert check controls and results."""
     section_header("Check Alerts Now")
     st.caption("Manually check all active alerts against current scores")
 
@@ -223,13 +394,18 @@ with tab_check:
         st.write("")
         check_button = st.button("Check Now", type="primary", use_container_width=True)
 
+    force_refresh = st.checkbox(
+        "Force refresh",
+        help="Re-run the check even if one ran in the last 30 seconds",
+        key="check_force_refresh",
+    )
+
     if check_button:
+        if force_refresh:
+            _run_alert_check.clear()
         with st.spinner("Checking alerts..."):
             try:
-                if check_ticker:
-                    triggers = checker.check_ticker(check_ticker)
-                else:
-                    triggers = checker.check_all()
+                triggers = _run_alert_check(check_ticker or None)
 
                 if triggers:
                     st.warning(f"{len(triggers)} alert(s) triggered!")
@@ -256,20 +432,41 @@ with tab_check:
     *Tip: Schedule regular checks using the CLI: `asymmetric alerts check`*
     """)
 
+
+@fragment(run_every=60)
+def _render_alert_summary() -> None:
+    """Render the sidebar alert counts, refreshing on their own timer."""
+    st.markdown("---")
+    st.markdown("**Alert Summary**")
+
+    try:
+        summary = _get_alert_summary()
+
+        st.metric("Active Alerts", summary["active"])
+        st.metric("Currently Triggered", summary["triggered"])
+        st.metric("Unacknowledged", summary["unacknowledged"])
+    except Exception:
+        st.caption("Unable to load alert summary")
+
+
+# Tabs for different views
+tab_config, tab_history, tab_check = st.tabs([
+    "Configure Alerts",
+    "Alert History",
+    "Check Now"
+])
+
+with tab_config:
+    _render_config_tab()
+
+with tab_history:
+    _render_history_tab()
+
+with tab_check:
+    _render_check_tab()
+
 # Sidebar summary
-st.sidebar.markdown("---")
-st.sidebar.markdown("**Alert Summary**")
-
-try:
-    all_alerts = checker.get_alerts()
-    active_count = sum(1 for a in all_alerts if a.is_active)
-    triggered_count = sum(1 for a in all_alerts if a.is_triggered)
-    unack_history = checker.get_alert_history(unacknowledged_only=True, limit=100)
-
-    st.sidebar.metric("Active Alerts", active_count)
-    st.sidebar.metric("Currently Triggered", triggered_count)
-    st.sidebar.metric("Unacknowledged", len(unack_history))
-except Exception:
-    st.sidebar.caption("Unable to load alert summary")
+with st.sidebar:
+    _render_alert_summary()
 
 page_footer()
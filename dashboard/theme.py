@@ -133,6 +133,23 @@ def get_plotly_theme() -> dict:
     }
 
 
+def get_plotly_layout(**overrides) -> dict:
+    """Get the Plotly theme merged with chart-specific layout settings.
+
+    Lets a chart apply the theme and its own settings in one
+    fig.update_layout(**get_plotly_layout(...)) call. Dict overrides of a
+    theme key (e.g. ``legend``) are merged into the theme's dict rather than
+    replacing it, matching two successive update_layout calls.
+    """
+    layout = get_plotly_theme()
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(layout.get(key), dict):
+            layout[key] = {**layout[key], **value}
+        else:
+            layout[key] = value
+    return layout
+
+
 def get_plotly_chart_config() -> dict:
     """Get Plotly config for mode bar cleanup.
 
@@ -1,22 +1,23 @@
 """AI analysis utilities for the dashboard."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any, Optional
 
 import streamlit as st
 
-from asymmetric.core.ai.gemini_client import (
-    AnalysisResult,
-    GeminiClient,
-    GeminiModel,
-    get_gemini_client,
-)
 from asymmetric.core.ai.exceptions import (
     GeminiCacheExpiredError,
     GeminiConfigError,
     GeminiContextTooLargeError,
     GeminiRateLimitError,
 )
+from asymmetric.core.ai.gemini_client import (
+    AnalysisResult,
+    GeminiClient,
+    GeminiModel,
+    get_gemini_client,
+)
 
 
 @st.cache_resource
@@ -175,6 +176,54 @@ def run_single_stock_analysis(
             "message": "GEMINI_API_KEY not configured. Set it in your .env file.",
         }
 
+    return _analyze_single_stock(client, ticker, scores, model)
+
+
+def run_many_models(
+    ticker: str,
+    scores: dict,
+    models: tuple[str, ...] = ("flash", "pro"),
+) -> dict[str, dict[str, Any]]:
+    """
+    Run single-stock AI analysis with several models concurrently.
+
+    The Gemini calls are network-bound, so running them on worker threads
+    brings the wall time down to the slowest model instead of the sum.
+
+    Args:
+        ticker: Stock ticker symbol.
+        scores: Dictionary with piotroski and altman scores.
+        models: Models to run ("flash" and/or "pro").
+
+    Returns:
+        Dict mapping each model to its result dict (success or error info),
+        in the order given.
+    """
+    # Resolve the (Streamlit-cached) client on the script thread
+    client = get_gemini_client_cached()
+
+    if client is None:
+        error = {
+            "error": "config",
+            "message": "GEMINI_API_KEY not configured. Set it in your .env file.",
+        }
+        return {model: dict(error) for model in models}
+
+    with ThreadPoolExecutor(max_workers=len(models), thread_name_prefix="ai-analysis") as pool:
+        futures = {
+            model: pool.submit(_analyze_single_stock, client, ticker, scores, model)
+            for model in models
+        }
+    return {model: future.result() for model, future in futures.items()}
+
+
+def _analyze_single_stock(
+    client: GeminiClient,
+    ticker: str,
+    scores: dict,
+    model: str,
+) -> dict[str, Any]:
+    """Build the single-stock prompt and run it on ``client``."""
     # Build single-stock context
     piotroski = scores.get("piotroski", {})
     altman = scores.get("altman", {})
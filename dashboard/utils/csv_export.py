@@ -1,5 +1,7 @@
 """CSV export utilities with injection protection."""
 
+import io
+
 import pandas as pd
 
 # Characters that can trigger formula execution in spreadsheet applications
@@ -20,10 +22,42 @@ def sanitize_csv_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         Sanitized copy safe for CSV export.
     """
     export_df = df.copy()
-    for col in export_df.select_dtypes(include=["object"]).columns:
-        export_df[col] = export_df[col].apply(
-            lambda v: "'" + str(v)
-            if isinstance(v, str) and v and v[0] in _FORMULA_TRIGGERS
-            else v
-        )
+    for col in export_df.select_dtypes(include=["object", "string"]).columns:
+        _escape_formula_cells(export_df, col)
     return export_df
+
+
+def export_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to UTF-8 CSV bytes for st.download_button.
+
+    Applies sanitize_csv_dataframe() and writes straight into a binary
+    buffer, so the CSV is never held as an intermediate str before
+    encoding.
+
+    Args:
+        df: Source DataFrame (index is not written).
+
+    Returns:
+        Encoded CSV content.
+    """
+    buf = io.BytesIO()
+    sanitize_csv_dataframe(df).to_csv(buf, index=False, encoding="utf-8")
+    return buf.getvalue()
+
+
+def _escape_formula_cells(df: pd.DataFrame, col) -> None:
+    """Prefix formula-leading strings in ``df[col]`` in place.
+
+    Uses a vectorized first-character mask instead of a per-cell apply.
+    Non-string cells (None, numbers) map to NaN under ``.str`` and are
+    left untouched.
+    """
+    try:
+        first = df[col].str[:1]
+    except AttributeError:
+        # Object column holding no strings at all (e.g. boxed numbers).
+        return
+    mask = first.isin(_FORMULA_TRIGGERS)
+    if mask.any():
+        df.loc[mask, col] = "'" + df.loc[mask, col]
@@ -5,10 +5,10 @@ following the same patterns as watchlist.py and scoring.py.
 """
 
 from datetime import UTC, datetime
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlmodel import select
+from sqlmodel import func, select
 
 from asymmetric.db.database import get_or_create_stock, get_session, init_db
 from asymmetric.db.models import Decision, Stock, StockScore, Thesis
@@ -18,6 +18,7 @@ def get_decisions(
     action: Optional[str] = None,
     ticker: Optional[str] = None,
     limit: int = 20,
+    offset: int = 0,
 ) -> list[dict[str, Any]]:
     """
     Fetch decisions with optional filters.
@@ -26,6 +27,7 @@ def get_decisions(
         action: Filter by decision action (buy/hold/sell/pass) or None for all.
         ticker: Filter by stock ticker or None for all.
         limit: Maximum number of results.
+        offset: Number of matching decisions to skip (for pagination).
 
     Returns:
         List of decision dicts with stock data for display.
@@ -46,7 +48,11 @@ def get_decisions(
             if ticker:
                 query = query.where(Stock.ticker == ticker.upper())
 
-            query = query.order_by(Decision.decided_at.desc()).limit(limit)
+            query = (
+                query.order_by(Decision.decided_at.desc(), Decision.id.desc())
+                .offset(offset)
+                .limit(limit)
+            )
 
             results = []
             for decision, thesis, stock in session.exec(query):
@@ -68,6 +74,40 @@ def get_decisions(
             raise ValueError(f"Failed to fetch decisions: {e}") from e
 
 
+def count_decisions(
+    action: Optional[str] = None,
+    ticker: Optional[str] = None,
+) -> int:
+    """
+    Count decisions matching the same filters as get_decisions().
+
+    Args:
+        action: Filter by decision action (buy/hold/sell/pass) or None for all.
+        ticker: Filter by stock ticker or None for all.
+
+    Returns:
+        Number of matching decisions.
+    """
+    init_db()
+
+    with get_session() as session:
+        try:
+            query = (
+                select(func.count(Decision.id))
+                .join(Thesis, Decision.thesis_id == Thesis.id)
+                .join(Stock, Thesis.stock_id == Stock.id)
+            )
+
+            if action:
+                query = query.where(Decision.decision == action)
+            if ticker:
+                query = query.where(Stock.ticker == ticker.upper())
+
+            return session.exec(query).one()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Failed to count decisions: {e}") from e
+
+
 def get_decision_by_id(decision_id: int) -> Optional[dict[str, Any]]:
     """
     Fetch a single decision with full details.
@@ -92,21 +132,25 @@ def get_decision_by_id(decision_id: int) -> Optional[dict[str, Any]]:
         if not result:
             return None
 
-        decision, thesis, stock = result
-        return {
-            "id": decision.id,
-            "ticker": stock.ticker,
-            "company_name": stock.company_name,
-            "action": decision.decision,
-            "confidence": decision.confidence,
-            "target_price": decision.target_price,
-            "stop_loss": decision.stop_loss,
-            "rationale": decision.rationale,
-            "decided_at": decision.decided_at.isoformat() if decision.decided_at else None,
-            "thesis_id": thesis.id,
-            "thesis_summary": thesis.summary,
-            "thesis_status": thesis.status,
-        }
+        return _decision_detail(*result)
+
+
+def _decision_detail(decision: Decision, thesis: Thesis, stock: Stock) -> dict[str, Any]:
+    """Convert a (Decision, Thesis, Stock) row into a decision detail dict."""
+    return {
+        "id": decision.id,
+        "ticker": stock.ticker,
+        "company_name": stock.company_name,
+        "action": decision.decision,
+        "confidence": decision.confidence,
+        "target_price": decision.target_price,
+        "stop_loss": decision.stop_loss,
+        "rationale": decision.rationale,
+        "decided_at": decision.decided_at.isoformat() if decision.decided_at else None,
+        "thesis_id": thesis.id,
+        "thesis_summary": thesis.summary,
+        "thesis_status": thesis.status,
+    }
 
 
 def create_decision(
@@ -183,6 +227,7 @@ def get_theses(
     status: Optional[str] = None,
     ticker: Optional[str] = None,
     limit: int = 20,
+    offset: int = 0,
 ) -> list[dict[str, Any]]:
     """
     Fetch theses with optional filters.
@@ -191,6 +236,7 @@ def get_theses(
         status: Filter by status (draft/active/archived) or None for all.
         ticker: Filter by stock ticker or None for all.
         limit: Maximum number of results.
+        offset: Number of matching theses to skip (for pagination).
 
     Returns:
         List of thesis dicts with stock data.
@@ -208,7 +254,11 @@ def get_theses(
         if ticker:
             query = query.where(Stock.ticker == ticker.upper())
 
-        query = query.order_by(Thesis.created_at.desc()).limit(limit)
+        query = (
+            query.order_by(Thesis.created_at.desc(), Thesis.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
 
         results = []
         for thesis, stock in session.exec(query):
@@ -235,6 +285,39 @@ def get_theses(
         return results
 
 
+def count_theses(
+    status: Optional[str] = None,
+    ticker: Optional[str] = None,
+) -> int:
+    """
+    Count theses matching the same filters as get_theses().
+
+    Args:
+        status: Filter by status (draft/active/archived) or None for all.
+        ticker: Filter by stock ticker or None for all.
+
+    Returns:
+        Number of matching theses.
+    """
+    init_db()
+
+    with get_session() as session:
+        try:
+            query = (
+                select(func.count(Thesis.id))
+                .join(Stock, Thesis.stock_id == Stock.id)
+            )
+
+            if status:
+                query = query.where(Thesis.status == status)
+            if ticker:
+                query = query.where(Stock.ticker == ticker.upper())
+
+            return session.exec(query).one()
+        except SQLAlchemyError as e:
+            raise ValueError(f"Failed to count theses: {e}") from e
+
+
 def get_thesis_by_id(thesis_id: int) -> Optional[dict[str, Any]]:
     """
     Fetch a single thesis with full details.
@@ -265,37 +348,102 @@ def get_thesis_by_id(thesis_id: int) -> Optional[dict[str, Any]]:
             select(Decision).where(Decision.thesis_id == thesis_id)
         ).all()
 
-        return {
-            "id": thesis.id,
-            "ticker": stock.ticker,
-            "company_name": stock.company_name,
-            "summary": thesis.summary,
-            "analysis_text": thesis.analysis_text,
-            "bull_case": thesis.bull_case,
-            "bear_case": thesis.bear_case,
-            "key_metrics": thesis.key_metrics,
-            "status": thesis.status,
-            "conviction": thesis.conviction,
-            "conviction_rationale": thesis.conviction_rationale,
-            "ai_generated": bool(thesis.ai_model),
-            "ai_model": thesis.ai_model,
-            "ai_cost_usd": thesis.ai_cost_usd,
-            "ai_tokens_input": thesis.ai_tokens_input,
-            "ai_tokens_output": thesis.ai_tokens_output,
-            "cached": thesis.cached,
-            "decision_count": len(decisions),
-            "decisions": [
-                {
-                    "id": d.id,
-                    "action": d.decision,
-                    "confidence": d.confidence,
-                    "decided_at": d.decided_at.isoformat() if d.decided_at else None,
-                }
-                for d in decisions
-            ],
-            "created_at": thesis.created_at.isoformat() if thesis.created_at else None,
-            "updated_at": thesis.updated_at.isoformat() if thesis.updated_at else None,
-        }
+        return _thesis_detail(thesis, stock, decisions)
+
+
+def _thesis_detail(thesis: Thesis, stock: Stock, decisions: list[Decision]) -> dict[str, Any]:
+    """Convert a (Thesis, Stock) row and its decisions into a thesis detail dict."""
+    return {
+        "id": thesis.id,
+        "ticker": stock.ticker,
+        "company_name": stock.company_name,
+        "summary": thesis.summary,
+        "analysis_text": thesis.analysis_text,
+        "bull_case": thesis.bull_case,
+        "bear_case": thesis.bear_case,
+        "key_metrics": thesis.key_metrics,
+        "status": thesis.status,
+        "conviction": thesis.conviction,
+        "conviction_rationale": thesis.conviction_rationale,
+        "ai_generated": bool(thesis.ai_model),
+        "ai_model": thesis.ai_model,
+        "ai_cost_usd": thesis.ai_cost_usd,
+        "ai_tokens_input": thesis.ai_tokens_input,
+        "ai_tokens_output": thesis.ai_tokens_output,
+        "cached": thesis.cached,
+        "decision_count": len(decisions),
+        "decisions": [
+            {
+                "id": d.id,
+                "action": d.decision,
+                "confidence": d.confidence,
+                "decided_at": d.decided_at.isoformat() if d.decided_at else None,
+            }
+            for d in decisions
+        ],
+        "created_at": thesis.created_at.isoformat() if thesis.created_at else None,
+        "updated_at": thesis.updated_at.isoformat() if thesis.updated_at else None,
+    }
+
+
+def get_entities_by_ids(
+    decision_ids: Iterable[int] = (),
+    thesis_ids: Iterable[int] = (),
+) -> tuple[dict[int, dict[str, Any]], dict[int, dict[str, Any]]]:
+    """
+    Fetch decision and thesis details for several IDs in one session.
+
+    Batched counterpart of get_decision_by_id() / get_thesis_by_id(): each
+    table is read with a single IN query instead of one query per ID.
+
+    Args:
+        decision_ids: Decision IDs to fetch.
+        thesis_ids: Thesis IDs to fetch.
+
+    Returns:
+        Tuple of (decisions by ID, theses by ID). Missing IDs are omitted.
+    """
+    decision_ids = set(decision_ids)
+    thesis_ids = set(thesis_ids)
+    decisions_by_id: dict[int, dict[str, Any]] = {}
+    theses_by_id: dict[int, dict[str, Any]] = {}
+    if not decision_ids and not thesis_ids:
+        return decisions_by_id, theses_by_id
+
+    init_db()
+
+    with get_session() as session:
+        if decision_ids:
+            query = (
+                select(Decision, Thesis, Stock)
+                .join(Thesis, Decision.thesis_id == Thesis.id)
+                .join(Stock, Thesis.stock_id == Stock.id)
+                .where(Decision.id.in_(decision_ids))
+            )
+            for row in session.exec(query):
+                detail = _decision_detail(*row)
+                decisions_by_id[detail["id"]] = detail
+
+        if thesis_ids:
+            query = (
+                select(Thesis, Stock)
+                .join(Stock, Thesis.stock_id == Stock.id)
+                .where(Thesis.id.in_(thesis_ids))
+            )
+            thesis_rows = session.exec(query).all()
+
+            decisions_by_thesis: dict[int, list[Decision]] = {}
+            for decision in session.exec(
+                select(Decision).where(Decision.thesis_id.in_(thesis_ids))
+            ):
+                decisions_by_thesis.setdefault(decision.thesis_id, []).append(decision)
+
+            for thesis, stock in thesis_rows:
+                theses_by_id[thesis.id] = _thesis_detail(
+                    thesis, stock, decisions_by_thesis.get(thesis.id, [])
+                )
+
+    return decisions_by_id, theses_by_id
 
 
 def create_thesis(
@@ -676,6 +824,36 @@ def analyze_by_conviction(decisions_with_outcomes: list[dict[str, Any]]) -> list
     return results
 
 
+def _tally_returns_by_conviction(
+    decisions_with_outcomes: list[dict[str, Any]],
+) -> dict[int, list[float]]:
+    """
+    Tally returns per conviction level in a single pass.
+
+    Args:
+        decisions_with_outcomes: List of decisions with outcome data.
+
+    Returns:
+        Dict mapping conviction level to [return_sum, return_count, decision_count].
+    """
+    tallies: dict[int, list[float]] = {}
+
+    for decision in decisions_with_outcomes:
+        confidence = decision.get("confidence") or 3  # Default to medium
+        tally = tallies.setdefault(confidence, [0.0, 0, 0])
+        tally[2] += 1
+
+        target = decision.get("target_price")
+        actual = decision.get("actual_price")
+
+        if target and actual and target > 0:
+            # Return percentage from target to actual
+            tally[0] += ((actual - target) / target) * 100
+            tally[1] += 1
+
+    return tallies
+
+
 def calculate_portfolio_return(
     decisions_with_outcomes: list[dict[str, Any]],
     conviction_min: int = 1,
@@ -692,22 +870,44 @@ def calculate_portfolio_return(
     Returns:
         Average return percentage across qualifying decisions.
     """
-    returns = []
+    stats = calculate_what_if_returns(decisions_with_outcomes, (conviction_min,))
+    return stats[conviction_min]["avg_return"]
 
-    for decision in decisions_with_outcomes:
-        confidence = decision.get("confidence") or 3
-        if confidence < conviction_min:
-            continue
 
-        target = decision.get("target_price")
-        actual = decision.get("actual_price")
+def calculate_what_if_returns(
+    decisions_with_outcomes: list[dict[str, Any]],
+    conviction_mins: tuple[int, ...] = (1, 4, 5),
+) -> dict[int, dict[str, Any]]:
+    """
+    Calculate hypothetical returns for several conviction thresholds at once.
 
-        if target and actual and target > 0:
-            # Calculate return percentage
-            ret = ((actual - target) / target) * 100
-            returns.append(ret)
+    Walks the decisions once, then derives each threshold from the
+    per-level tallies instead of re-scanning the list per threshold.
 
-    if not returns:
-        return 0.0
+    Args:
+        decisions_with_outcomes: List of decisions with outcome data.
+        conviction_mins: Minimum conviction levels to evaluate (1-5).
 
-    return sum(returns) / len(returns)
+    Returns:
+        Dict mapping each minimum to {"avg_return": float, "decision_count": int},
+        where decision_count counts all decisions at or above the minimum.
+    """
+    tallies = _tally_returns_by_conviction(decisions_with_outcomes)
+
+    results = {}
+    for conviction_min in conviction_mins:
+        return_sum = 0.0
+        return_count = 0
+        decision_count = 0
+        for level, (level_sum, level_returns, level_decisions) in tallies.items():
+            if level >= conviction_min:
+                return_sum += level_sum
+                return_count += level_returns
+                decision_count += level_decisions
+
+        results[conviction_min] = {
+            "avg_return": return_sum / return_count if return_count else 0.0,
+            "decision_count": decision_count,
+        }
+
+    return results
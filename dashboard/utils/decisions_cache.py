@@ -0,0 +1,152 @@
+"""Caching layer for decision and thesis data.
+
+Avoids redundant DB queries on Streamlit page reruns (every widget
+interaction on the Decisions page triggers a full rerun).
+
+TTLs:
+- 30s for decision/thesis lists (short, so edits from other pages show up quickly)
+- 60s for the active-thesis choices in the decision form
+- 120s for detail lookups by ID (every write path calls clear_decisions_cache())
+"""
+
+import streamlit as st
+
+from dashboard.utils.decisions import (
+    count_decisions,
+    count_theses,
+    get_decisions,
+    get_decisions_with_outcomes,
+    get_entities_by_ids,
+    get_theses,
+)
+
+
+@st.cache_data(ttl=30)
+def get_cached_decisions(
+    action: str | None = None,
+    ticker: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> list[dict]:
+    """Fetch one page of the decision log for the given filters.
+
+    Args:
+        action: Decision action filter or None for all.
+        ticker: Ticker filter or None for all.
+        limit: Maximum number of decisions.
+        offset: Number of decisions to skip.
+
+    Returns:
+        List of decision dicts.
+    """
+    return get_decisions(action=action, ticker=ticker, limit=limit, offset=offset)
+
+
+@st.cache_data(ttl=30)
+def get_cached_decision_count(action: str | None = None, ticker: str | None = None) -> int:
+    """Count decisions for the given filters (for pagination)."""
+    return count_decisions(action=action, ticker=ticker)
+
+
+@st.cache_data(ttl=30)
+def get_cached_theses(
+    status: str | None = None,
+    ticker: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> list[dict]:
+    """Fetch one page of the thesis library for the given filters.
+
+    Args:
+        status: Thesis status filter or None for all.
+        ticker: Ticker filter or None for all.
+        limit: Maximum number of theses.
+        offset: Number of theses to skip.
+
+    Returns:
+        List of thesis dicts.
+    """
+    return get_theses(status=status, ticker=ticker, limit=limit, offset=offset)
+
+
+@st.cache_data(ttl=30)
+def get_cached_thesis_count(status: str | None = None, ticker: str | None = None) -> int:
+    """Count theses for the given filters (for pagination)."""
+    return count_theses(status=status, ticker=ticker)
+
+
+@st.cache_data(ttl=60)
+def get_cached_active_theses(limit: int = 50) -> list[dict]:
+    """Fetch active theses for the decision form's thesis picker.
+
+    Args:
+        limit: Maximum number of theses.
+
+    Returns:
+        List of active thesis dicts.
+    """
+    return get_theses(status="active", limit=limit)
+
+
+@st.cache_data(ttl=30)
+def get_cached_decisions_with_outcomes(
+    ticker: str | None = None,
+    limit: int = 100,
+) -> list[dict]:
+    """Fetch decisions that have outcome data recorded.
+
+    Args:
+        ticker: Ticker filter or None for all.
+        limit: Maximum number of decisions.
+
+    Returns:
+        List of decision dicts including outcome data.
+    """
+    return get_decisions_with_outcomes(ticker=ticker, limit=limit)
+
+
+@st.cache_data(ttl=30)
+def get_cached_review_decisions(limit: int = 100) -> tuple[list[dict], tuple[str, ...]]:
+    """Fetch decisions for outcome review along with their ticker filter options.
+
+    The ticker options are derived once per fetch, so the filter selectbox
+    doesn't re-sort the tickers on every rerun.
+
+    Args:
+        limit: Maximum number of decisions.
+
+    Returns:
+        Tuple of (decision dicts, ticker options with "" first for "All").
+    """
+    decisions = get_decisions(limit=limit)
+    ticker_options = ("", *sorted({d["ticker"] for d in decisions}))
+    return decisions, ticker_options
+
+
+@st.cache_data(ttl=120)
+def get_cached_entities(
+    decision_ids: tuple[int, ...] = (),
+    thesis_ids: tuple[int, ...] = (),
+) -> tuple[dict[int, dict], dict[int, dict]]:
+    """Fetch decision and thesis details in one round-trip.
+
+    Args:
+        decision_ids: Decision IDs to fetch (tuple so it can key the cache).
+        thesis_ids: Thesis IDs to fetch.
+
+    Returns:
+        Tuple of (decisions by ID, theses by ID).
+    """
+    return get_entities_by_ids(decision_ids, thesis_ids)
+
+
+def clear_decisions_cache() -> None:
+    """Clear all decision caches. Call after creating or updating decisions/theses."""
+    get_cached_decisions.clear()
+    get_cached_decision_count.clear()
+    get_cached_theses.clear()
+    get_cached_thesis_count.clear()
+    get_cached_active_theses.clear()
+    get_cached_decisions_with_outcomes.clear()
+    get_cached_review_decisions.clear()
+    get_cached_entities.clear()
@@ -0,0 +1,34 @@
+"""Fragment helper for partial reruns.
+
+``st.fragment`` (Streamlit 1.37+) lets a widget interaction rerun only the
+decorated function instead of the whole page script. The dashboard still
+supports older Streamlit releases, where the decorator falls back to a
+plain function call and the page simply reruns as before.
+"""
+
+from typing import Callable, Optional
+
+import streamlit as st
+
+
+def fragment(func: Optional[Callable] = None, *, run_every=None):
+    """Decorate a render function as a Streamlit fragment when supported.
+
+    Usable both bare (``@fragment``) and with arguments
+    (``@fragment(run_every=30)``).
+
+    Args:
+        func: Render function to wrap.
+        run_every: Optional auto-rerun interval (seconds or timedelta).
+            Ignored on Streamlit versions without fragment support.
+    """
+    st_fragment = getattr(st, "fragment", None)
+
+    def decorate(f: Callable) -> Callable:
+        if st_fragment is None:
+            return f
+        return st_fragment(f, run_every=run_every)
+
+    if func is not None:
+        return decorate(func)
+    return decorate
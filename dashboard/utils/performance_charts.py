@@ -9,25 +9,71 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence, Union
 
-from dashboard.theme import get_plotly_theme, get_semantic_color
+from dashboard.theme import get_plotly_layout, get_plotly_theme, get_semantic_color
 
+# Snapshot attributes the charts read; Decimal money columns become floats.
+SNAPSHOT_COLUMNS = (
+    'snapshot_date',
+    'total_value',
+    'total_cost_basis',
+    'unrealized_pnl',
+    'realized_pnl_total',
+    'weighted_fscore',
+    'weighted_zscore',
+    'position_count',
+)
+_MONEY_COLUMNS = ('total_value', 'total_cost_basis', 'unrealized_pnl', 'realized_pnl_total')
 
-def create_portfolio_value_chart(snapshots: List[Dict]) -> go.Figure:
+SnapshotData = Union[pd.DataFrame, List[Dict]]
+
+
+def snapshot_frame(snapshots: Sequence[Any]) -> pd.DataFrame:
+    """
+    Build one DataFrame from PortfolioSnapshot objects for all chart builders.
+
+    Reads only the charted attributes instead of dumping every model to a
+    dict, so the frame is built once per render and shared by each chart.
+
+    Args:
+        snapshots: PortfolioSnapshot objects ordered by snapshot_date
+
+    Returns:
+        DataFrame with SNAPSHOT_COLUMNS
+    """
+    df = pd.DataFrame.from_records(
+        [tuple(getattr(s, col) for col in SNAPSHOT_COLUMNS) for s in snapshots],
+        columns=SNAPSHOT_COLUMNS,
+    )
+    for col in _MONEY_COLUMNS:
+        df[col] = df[col].astype(float)
+    for col in ('weighted_fscore', 'weighted_zscore'):
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def _as_frame(snapshots: SnapshotData) -> pd.DataFrame:
+    """Accept a prebuilt snapshot frame or a list of snapshot dicts."""
+    if isinstance(snapshots, pd.DataFrame):
+        return snapshots
+    return pd.DataFrame(snapshots)
+
+
+def create_portfolio_value_chart(snapshots: SnapshotData) -> go.Figure:
     """
     Line chart showing portfolio value over time.
 
     Args:
-        snapshots: List of snapshot dicts with keys: snapshot_date, total_value
+        snapshots: Snapshot frame or list of dicts with keys: snapshot_date, total_value
 
     Returns:
         Plotly figure with theme applied
     """
-    df = pd.DataFrame(snapshots)
+    df = _as_frame(snapshots)
 
     # Calculate percent change from previous snapshot
-    df['pct_change'] = df['total_value'].pct_change() * 100
+    pct_change = df['total_value'].pct_change() * 100
 
     blue = get_semantic_color('blue')
 
@@ -46,7 +92,7 @@ def create_portfolio_value_chart(snapshots: List[Dict]) -> go.Figure:
             'Change: %{customdata:.2f}%' +
             '<extra></extra>'
         ),
-        customdata=df['pct_change']
+        customdata=pct_change
     ))
 
     fig.update_layout(
@@ -62,17 +108,18 @@ def create_portfolio_value_chart(snapshots: List[Dict]) -> go.Figure:
     return fig
 
 
-def create_pnl_attribution_chart(snapshots: List[Dict]) -> go.Figure:
+def create_pnl_attribution_chart(snapshots: SnapshotData) -> go.Figure:
     """
     Line chart showing unrealized vs realized P&L over time.
 
     Args:
-        snapshots: List with keys: snapshot_date, unrealized_pnl, realized_pnl_total
+        snapshots: Snapshot frame or list of dicts with keys:
+            snapshot_date, unrealized_pnl, realized_pnl_total
 
     Returns:
         Plotly figure with separate lines (green=realized, blue=unrealized)
     """
-    df = pd.DataFrame(snapshots)
+    df = _as_frame(snapshots)
 
     green = get_semantic_color('green')
     blue = get_semantic_color('blue')
@@ -109,7 +156,8 @@ def create_pnl_attribution_chart(snapshots: List[Dict]) -> go.Figure:
         ),
     ))
 
-    fig.update_layout(
+    # The theme carries its own legend styling; the horizontal legend merges into it
+    fig.update_layout(**get_plotly_layout(
         title='P&L Attribution Over Time',
         xaxis_title='Date',
         yaxis_title='P&L ($)',
@@ -117,41 +165,38 @@ def create_pnl_attribution_chart(snapshots: List[Dict]) -> go.Figure:
         margin=dict(t=50, l=25, r=25, b=25),
         hovermode='x unified',
         legend=dict(orientation='h', yanchor='bottom', y=1.02),
-        **get_plotly_theme()
-    )
+    ))
 
     return fig
 
 
-def create_return_percentage_chart(snapshots: List[Dict]) -> go.Figure:
+def create_return_percentage_chart(snapshots: SnapshotData) -> go.Figure:
     """
     Line chart showing cumulative return percentage over time.
 
     Args:
-        snapshots: List with keys: snapshot_date, total_value, total_cost_basis
+        snapshots: Snapshot frame or list of dicts with keys:
+            snapshot_date, total_value, total_cost_basis
 
     Returns:
         Plotly figure showing (total_value - total_cost_basis) / total_cost_basis * 100
     """
-    df = pd.DataFrame(snapshots)
+    df = _as_frame(snapshots)
 
-    # Calculate return percentage for each snapshot (guard against zero cost basis)
-    df['return_pct'] = df.apply(
-        lambda r: ((r['total_value'] - r['total_cost_basis']) / r['total_cost_basis'] * 100)
-        if r['total_cost_basis'] != 0 else 0.0,
-        axis=1
-    )
-    df['return_dollars'] = df['total_value'] - df['total_cost_basis']
+    # Calculate return percentage for each snapshot (zero cost basis -> 0%)
+    cost_basis = df['total_cost_basis'].astype(float)
+    return_dollars = df['total_value'].astype(float) - cost_basis
+    return_pct = (return_dollars / cost_basis.where(cost_basis != 0) * 100).fillna(0.0)
 
     # Determine line color based on final return
-    final_return = df['return_pct'].iloc[-1]
+    final_return = return_pct.iloc[-1]
     line_color = get_semantic_color('green') if final_return >= 0 else get_semantic_color('red')
 
     fig = go.Figure()
 
     fig.add_trace(go.Scatter(
         x=df['snapshot_date'],
-        y=df['return_pct'],
+        y=return_pct,
         mode='lines+markers',
         name='Return %',
         line=dict(color=line_color, width=3),
@@ -162,7 +207,7 @@ def create_return_percentage_chart(snapshots: List[Dict]) -> go.Figure:
             'Gain/Loss: $%{customdata:,.2f}' +
             '<extra></extra>'
         ),
-        customdata=df['return_dollars']
+        customdata=return_dollars
     ))
 
     # Add 0% reference line
@@ -188,17 +233,18 @@ def create_return_percentage_chart(snapshots: List[Dict]) -> go.Figure:
     return fig
 
 
-def create_portfolio_health_chart(snapshots: List[Dict]) -> go.Figure:
+def create_portfolio_health_chart(snapshots: SnapshotData) -> go.Figure:
     """
     Dual-axis chart showing weighted F-Score and Z-Score over time.
 
     Args:
-        snapshots: List with keys: snapshot_date, weighted_fscore, weighted_zscore
+        snapshots: Snapshot frame or list of dicts with keys:
+            snapshot_date, weighted_fscore, weighted_zscore
 
     Returns:
         Plotly figure with two y-axes (pattern from 5_Trends.py:82-131)
     """
-    df = pd.DataFrame(snapshots)
+    df = _as_frame(snapshots)
 
     # Filter out snapshots with missing scores
     df = df.dropna(subset=['weighted_fscore', 'weighted_zscore'])
@@ -272,14 +318,13 @@ def create_portfolio_health_chart(snapshots: List[Dict]) -> go.Figure:
         secondary_y=True
     )
 
-    fig.update_layout(
+    fig.update_layout(**get_plotly_layout(
         title='Portfolio Health Scores Over Time',
         hovermode='x unified',
         height=400,
         margin=dict(t=50, l=25, r=25, b=25),
         legend=dict(orientation='h', yanchor='bottom', y=1.02),
-        **get_plotly_theme()
-    )
+    ))
 
     fig.update_xaxes(title_text='Date')
     fig.update_yaxes(title_text='F-Score (0-9)', secondary_y=False, range=[0, 9])
@@ -288,17 +333,17 @@ def create_portfolio_health_chart(snapshots: List[Dict]) -> go.Figure:
     return fig
 
 
-def create_position_count_chart(snapshots: List[Dict]) -> go.Figure:
+def create_position_count_chart(snapshots: SnapshotData) -> go.Figure:
     """
     Bar chart showing number of positions over time.
 
     Args:
-        snapshots: List with keys: snapshot_date, position_count
+        snapshots: Snapshot frame or list of dicts with keys: snapshot_date, position_count
 
     Returns:
         Plotly figure with bars showing diversification trend
     """
-    df = pd.DataFrame(snapshots)
+    df = _as_frame(snapshots)
 
     blue = get_semantic_color('blue')
 
@@ -319,12 +364,12 @@ def create_position_count_chart(snapshots: List[Dict]) -> go.Figure:
     # Add trend line if sufficient data points
     if len(df) >= 5:
         # Trailing moving average (no lookahead bias)
-        df['ma'] = df['position_count'].rolling(window=5, center=False).mean()
+        moving_avg = df['position_count'].rolling(window=5, center=False).mean()
         gray = get_semantic_color('gray')
 
         fig.add_trace(go.Scatter(
             x=df['snapshot_date'],
-            y=df['ma'],
+            y=moving_avg,
             name='5-Snapshot Avg',
             mode='lines',
             line=dict(color=gray, width=2, dash='dash'),
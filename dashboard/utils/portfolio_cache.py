@@ -4,16 +4,29 @@ Avoids redundant DB queries and yfinance API calls on Streamlit page reruns
 (every tab switch, button click, etc. triggers a full page rerun).
 
 TTLs:
-- 300s for price-dependent data (summary, holdings, scores, realized P&L)
+- 300s for live prices and price-dependent data (summary, holdings, scores,
+  realized P&L) and the transaction history table; the DB-side portfolio
+  data is additionally keyed on the prices, so unchanged quotes reuse it
 - 600s for historical snapshots (change infrequently intraday)
 - 3600s for performance stats (expensive math, stable over short periods)
+- 30s for the last snapshot date (guards the "Take Portfolio Snapshot" button;
+  short because the CLI can take snapshots from another process)
+
+Live prices are fetched on a background thread (see prices_pending()), so a
+cold price cache renders with the last known prices instead of blocking the
+page on the Yahoo round-trip.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from typing import Optional
 
 import streamlit as st
 
 from asymmetric.core.portfolio import PortfolioManager
+from asymmetric.core.portfolio.snapshot_service import get_last_snapshot_date
 from asymmetric.db.database import init_db
 
 
@@ -29,9 +42,8 @@ def _sync_portfolio_to_watchlist() -> None:
     try:
         from dashboard.utils.watchlist import add_stock
         manager = PortfolioManager()
-        holdings = manager.get_holdings(include_market_data=False)
-        for h in holdings:
-            add_stock(h.ticker, note="Portfolio holding (auto-synced)")
+        for ticker in manager.get_open_tickers():
+            add_stock(ticker, note="Portfolio holding (auto-synced)")
     except Exception:
         pass  # Non-critical — don't block startup
 
@@ -39,30 +51,161 @@ def _sync_portfolio_to_watchlist() -> None:
 _ensure_db()
 
 
-@st.cache_data(ttl=300)
-def get_cached_portfolio_data():
-    """Fetch summary, holdings, weighted scores, and prices in one cached call.
+@st.cache_resource
+def get_portfolio_manager() -> PortfolioManager:
+    """Return the process-wide PortfolioManager.
+
+    The manager holds no per-request state (each call opens its own
+    session), so one instance is shared across reruns and sessions.
+    """
+    return PortfolioManager()
+
+
+_PRICE_TTL = 300
+# How long a fresh submit may hold the render: enough for a warm cache hit
+# (e.g. after clear_portfolio_cache() with unchanged tickers) to finish,
+# too short to notice when the fetch really goes to Yahoo.
+_PRICE_SUBMIT_WAIT = 0.25
+
+
+@st.cache_resource
+def _last_known_prices() -> dict:
+    """Process-wide ticker -> price map of the most recent successful fetches."""
+    return {}
+
+
+@st.cache_resource
+def _price_refresh() -> dict:
+    """Process-wide state of the background price fetch.
+
+    Shared across sessions like the price cache it warms: ``future`` is the
+    latest fetch and ``submitted`` its time.monotonic() submit time.
+    """
+    return {"lock": threading.Lock(), "future": None, "submitted": 0.0}
+
+
+@st.cache_resource
+def _price_executor() -> ThreadPoolExecutor:
+    """Single worker, so concurrent sessions queue behind one fetch and then hit the cache."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="portfolio-prices")
+
+
+@st.cache_data(ttl=_PRICE_TTL, show_spinner=False)
+def get_cached_market_prices(tickers: tuple[str, ...]) -> dict:
+    """Fetch live prices for a sorted tuple of tickers.
+
+    Kept separate from the portfolio data so a price refresh does not
+    require clearing the snapshot and performance caches.
 
     Returns:
-        Tuple of (PortfolioSummary, list[HoldingDetail], WeightedScores, dict)
+        Dict mapping ticker -> price (None if unavailable).
     """
-    manager = PortfolioManager()
-    holdings_basic = manager.get_holdings(include_market_data=False)
-    tickers = [h.ticker for h in holdings_basic]
+    if not tickers:
+        return {}
     try:
-        prices = manager.refresh_market_prices(tickers) if tickers else {}
+        prices = get_portfolio_manager().refresh_market_prices(list(tickers))
     except Exception:
         prices = {}
-    if prices is None:
-        prices = {}
+    _last_known_prices().update((t, p) for t, p in (prices or {}).items() if p is not None)
+    return prices or {}
+
+
+def prices_pending() -> bool:
+    """Start a background price fetch when due; True while it is still running.
+
+    A fetch is submitted on the first call in the process and again once the
+    price cache TTL has elapsed since the last submit. The submit precedes the
+    cache write, so while a fetch is not due the price cache is still warm and
+    get_cached_portfolio_data() does not block. The worker warms
+    get_cached_market_prices(), so the render after it finishes reads prices
+    from the cache. A new submit waits up to _PRICE_SUBMIT_WAIT, so a fetch
+    that is only a cache hit is normally done before this render.
+    """
+    refresh = _price_refresh()
+    with refresh["lock"]:
+        future = refresh["future"]
+        due = future is None or time.monotonic() - refresh["submitted"] >= _PRICE_TTL
+        if due:
+            tickers = tuple(get_portfolio_manager().get_open_tickers())
+            future = refresh["future"] = _price_executor().submit(get_cached_market_prices, tickers)
+            refresh["submitted"] = time.monotonic()
+    if due:
+        wait([future], timeout=_PRICE_SUBMIT_WAIT)
+    return not future.done()
 
+
+def _reset_price_refresh() -> None:
+    """Make the next prices_pending() call submit a fresh fetch."""
+    refresh = _price_refresh()
+    with refresh["lock"]:
+        refresh["future"] = None
+
+
+def _portfolio_data(prices: dict):
+    """Build (summary, holdings, weighted scores, prices) from a price map."""
+    return _priced_portfolio_data(tuple(sorted(prices.items())))
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _priced_portfolio_data(price_items: tuple):
+    """DB-side portfolio data for one set of prices.
+
+    Keyed on the prices themselves, so a price refresh that returns the
+    same quotes (e.g. outside market hours) and the repeated reruns that
+    render with the last known prices skip the holdings/summary queries.
+    """
+    prices = dict(price_items)
+    manager = get_portfolio_manager()
     summary = manager.get_portfolio_summary(market_prices=prices)
     holdings = manager.get_holdings(market_prices=prices)
     weighted_scores = manager.get_weighted_scores(holdings=holdings)
-
     return summary, holdings, weighted_scores, prices
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def get_cached_portfolio_data():
+    """Fetch summary, holdings, weighted scores, and prices in one cached call.
+
+    Returns:
+        Tuple of (PortfolioSummary, list[HoldingDetail], WeightedScores, dict)
+    """
+    manager = get_portfolio_manager()
+    return _portfolio_data(get_cached_market_prices(tuple(manager.get_open_tickers())))
+
+
+def get_stale_portfolio_data():
+    """Portfolio data priced with the last known prices, without network calls.
+
+    Used while prices_pending() is True. Tickers never priced in this process
+    fall back to cost basis, as with any missing price.
+
+    Returns:
+        Same tuple as get_cached_portfolio_data().
+    """
+    return _portfolio_data(dict(_last_known_prices()))
+
+
+# Rolling windows for the historical time-range selector; "YTD" and
+# "All Time" are calendar/unbounded and handled in _range_start().
+_RANGE_DELTAS = {
+    "7D": timedelta(days=7),
+    "30D": timedelta(days=30),
+    "90D": timedelta(days=90),
+    "1Y": timedelta(days=365),
+}
+
+
+def _range_start(time_range: str) -> Optional[datetime]:
+    """Map a time-range label to its snapshot start date (None = all time)."""
+    now = datetime.now()
+    delta = _RANGE_DELTAS.get(time_range)
+    if delta is not None:
+        return now - delta
+    if time_range == "YTD":
+        return datetime(now.year, 1, 1)
+    return None
+
+
 @st.cache_data(ttl=600)
 def get_cached_snapshots(time_range: str):
     """Fetch snapshots for a given time range.
@@ -73,36 +216,52 @@ def get_cached_snapshots(time_range: str):
     Returns:
         List of PortfolioSnapshot objects.
     """
-    now = datetime.now()
-    start_date = None
+    manager = get_portfolio_manager()
+    return manager.get_snapshots(start_date=_range_start(time_range))
 
-    if time_range == "7D":
-        start_date = (now - timedelta(days=7)).replace(tzinfo=None)
-    elif time_range == "30D":
-        start_date = (now - timedelta(days=30)).replace(tzinfo=None)
-    elif time_range == "90D":
-        start_date = (now - timedelta(days=90)).replace(tzinfo=None)
-    elif time_range == "YTD":
-        start_date = datetime(now.year, 1, 1)
-    elif time_range == "1Y":
-        start_date = (now - timedelta(days=365)).replace(tzinfo=None)
 
-    manager = PortfolioManager()
-    return manager.get_snapshots(start_date=start_date)
+@st.cache_data(ttl=30, show_spinner=False)
+def get_cached_last_snapshot_date() -> Optional[datetime]:
+    """Date of the most recent snapshot, or None if there are none."""
+    return get_last_snapshot_date()
+
+
+def snapshot_fingerprint(snapshots) -> tuple:
+    """Identify a snapshot series cheaply: count, date span and latest value."""
+    first, last = snapshots[0], snapshots[-1]
+    return (
+        len(snapshots),
+        first.snapshot_date.isoformat(),
+        last.snapshot_date.isoformat(),
+        str(last.total_value),
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_performance_stats(fingerprint: tuple, _snapshots: list):
+    """Compute performance stats once per distinct snapshot series.
+
+    Keyed on ``fingerprint`` only; the leading underscore tells Streamlit
+    not to hash the snapshot objects themselves.
+    """
+    manager = get_portfolio_manager()
+    return manager.get_performance_stats(_snapshots)
 
 
-@st.cache_data(ttl=3600)
 def get_cached_performance_stats(time_range: str):
     """Calculate performance stats for a given time range.
 
+    Stats are cached on the snapshot fingerprint rather than the range
+    label, so refreshed snapshots recompute them while reruns over the same
+    series (and ranges that resolve to the same series) reuse the result.
+
     Returns:
         Dict with performance metrics, or None if insufficient data.
     """
     snapshots = get_cached_snapshots(time_range)
     if not snapshots or len(snapshots) < 2:
         return None
-    manager = PortfolioManager()
-    return manager.get_performance_stats(snapshots)
+    return _cached_performance_stats(snapshot_fingerprint(snapshots), snapshots)
 
 
 @st.cache_data(ttl=300)
@@ -112,13 +271,44 @@ def get_cached_realized_pnl():
     Returns:
         Dict mapping ticker -> realized gain (float).
     """
-    manager = PortfolioManager()
+    manager = get_portfolio_manager()
     return manager.get_realized_pnl_by_ticker()
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def get_cached_transaction_history(ticker: Optional[str], limit: int):
+    """Fetch transaction history for the history table.
+
+    Args:
+        ticker: Optional ticker filter.
+        limit: Maximum number of transactions.
+
+    Returns:
+        List of TransactionRecord, newest first.
+    """
+    manager = get_portfolio_manager()
+    return manager.get_transaction_history(ticker=ticker, limit=limit)
+
+
+def refresh_portfolio_prices():
+    """Drop cached prices and the price-dependent portfolio data.
+
+    The per-price-set DB results are kept: they are only recomputed if the
+    refreshed prices actually differ.
+    """
+    get_cached_market_prices.clear()
+    get_cached_portfolio_data.clear()
+    _reset_price_refresh()
+
+
 def clear_portfolio_cache():
     """Clear all portfolio caches. Call after buy/sell transactions."""
+    # Open tickers may have changed; fetch prices for the new set
+    _reset_price_refresh()
     get_cached_portfolio_data.clear()
+    _priced_portfolio_data.clear()
+    get_cached_transaction_history.clear()
     get_cached_snapshots.clear()
-    get_cached_performance_stats.clear()
+    get_cached_last_snapshot_date.clear()
+    _cached_performance_stats.clear()
     get_cached_realized_pnl.clear()
@@ -5,7 +5,9 @@ and initialization functions to reduce duplication across pages.
 """
 
 import streamlit as st
-from typing import Any
+from typing import Any, Iterable
+
+from dashboard.config import ALERTS_BATCH_SIZE
 
 
 # Define all session state defaults by page
@@ -40,17 +42,25 @@ SESSION_DEFAULTS = {
     "pending_cash_flow": None,
     "pending_dividend": None,
 
-    # Research page
-    "research_ticker": "",
-    "research_step": 1,
+    # Research page (wizard; research_step is 0-based)
+    "research_step": 0,
+    "research_ticker": None,
+    "research_scores": None,
+    "research_ai_analysis": None,  # preferred result, feeds the thesis step
+    "research_ai_analyses": {},  # model -> result for every model run
+    "research_thesis_draft": {},
+    "confirm_reset": False,
+
+    # Alerts page
+    "alerts_shown": ALERTS_BATCH_SIZE,
 }
 
 
-# Page-specific keys mapping
+# Page-specific keys mapping (tuples: read on every rerun, never mutated)
 PAGE_KEYS = {
-    "watchlist": ["theme"],
-    "compare": ["theme", "compare_tickers", "compare_results", "compare_ai_result"],
-    "decisions": [
+    "watchlist": ("theme",),
+    "compare": ("theme", "compare_tickers", "compare_results", "compare_ai_result"),
+    "decisions": (
         "theme",
         "selected_decision_id",
         "selected_thesis_id",
@@ -61,37 +71,57 @@ PAGE_KEYS = {
         "thesis_status_filter",
         "thesis_ticker_filter",
         "editing_thesis_id",
-    ],
-    "portfolio": ["theme", "pending_buy", "pending_sell", "pending_cash_flow", "pending_dividend"],
-    "research": ["theme", "research_ticker", "research_step"],
+    ),
+    "portfolio": ("theme", "pending_buy", "pending_sell", "pending_cash_flow", "pending_dividend"),
+    "research": (
+        "theme",
+        "research_step",
+        "research_ticker",
+        "research_scores",
+        "research_ai_analysis",
+        "research_ai_analyses",
+        "research_thesis_draft",
+        "confirm_reset",
+    ),
+    "alerts": ("theme", "alerts_shown"),
 }
 
 
-def init_session_state(keys: list[str] | None = None) -> None:
+def _fresh_default(key: str) -> Any:
+    """Return the default for a key, copying mutable defaults (lists, dicts)."""
+    default = SESSION_DEFAULTS[key]
+    if isinstance(default, (list, dict)):
+        return default.copy() if default else type(default)()
+    return default
+
+
+def init_session_state(keys: Iterable[str] | None = None) -> None:
     """Initialize session state with defaults.
 
+    Missing keys are collected first and written with a single update,
+    so reruns where everything is already initialized do no writes.
+
     Args:
         keys: Specific keys to initialize. If None, initializes all.
     """
     to_init = keys if keys else SESSION_DEFAULTS.keys()
 
-    for key in to_init:
-        if key not in st.session_state and key in SESSION_DEFAULTS:
-            # Use a copy for mutable defaults (lists, dicts)
-            default = SESSION_DEFAULTS[key]
-            if isinstance(default, (list, dict)):
-                st.session_state[key] = default.copy() if default else type(default)()
-            else:
-                st.session_state[key] = default
+    missing = {
+        key: _fresh_default(key)
+        for key in to_init
+        if key in SESSION_DEFAULTS and key not in st.session_state
+    }
+    if missing:
+        st.session_state.update(missing)
 
 
 def init_page_state(page: str) -> None:
     """Initialize session state for a specific page.
 
     Args:
-        page: Page name ('watchlist', 'compare', 'decisions', 'portfolio', 'research')
+        page: Page name ('watchlist', 'compare', 'decisions', 'portfolio', 'research', 'alerts')
     """
-    keys = PAGE_KEYS.get(page, ["theme"])
+    keys = PAGE_KEYS.get(page, ("theme",))
     init_session_state(keys)
 
 
@@ -101,14 +131,12 @@ def reset_page_state(page: str) -> None:
     Args:
         page: Page name to reset.
     """
-    keys = PAGE_KEYS.get(page, [])
-    for key in keys:
-        if key in SESSION_DEFAULTS and key != "theme":
-            default = SESSION_DEFAULTS[key]
-            if isinstance(default, (list, dict)):
-                st.session_state[key] = default.copy() if default else type(default)()
-            else:
-                st.session_state[key] = default
+    keys = PAGE_KEYS.get(page, ())
+    st.session_state.update({
+        key: _fresh_default(key)
+        for key in keys
+        if key in SESSION_DEFAULTS and key != "theme"
+    })
 
 
 def get_state(key: str, default: Any = None) -> Any:
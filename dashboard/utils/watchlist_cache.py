@@ -0,0 +1,79 @@
+"""Caching layer for watchlist reads.
+
+The watchlist lives in a JSON file that both the dashboard and the CLI
+write to. Cached reads are keyed on the file's modification time, so any
+write (from either side) is picked up on the next rerun without explicit
+invalidation, while unchanged files skip the read + JSON parse entirely.
+
+TTLs:
+- 300s backstop for cached ticker lists
+"""
+
+import streamlit as st
+
+from dashboard.config import WATCHLIST_FILE
+from dashboard.utils.watchlist import get_stocks
+
+
+def _watchlist_mtime() -> int:
+    """Return the watchlist file's mtime in ns, or 0 if it doesn't exist."""
+    try:
+        return WATCHLIST_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_sorted_tickers(mtime_ns: int) -> list[str]:
+    """Read and sort the watchlist tickers for a given file version."""
+    return sorted(get_stocks())
+
+
+def get_cached_tickers() -> list[str]:
+    """Get the watchlist tickers, sorted, re-reading only when the file changes.
+
+    Returns:
+        Sorted list of ticker symbols.
+    """
+    return _load_sorted_tickers(_watchlist_mtime())
+
+
+@st.cache_resource(ttl=300, max_entries=4, show_spinner=False)
+def _load_ticker_options(mtime_ns: int) -> tuple[str, ...]:
+    """Build the ticker filter options for a given file version.
+
+    Cached as a resource so every rerun gets the same (immutable) tuple
+    object rather than a fresh unpickled copy.
+    """
+    return ("", *_load_sorted_tickers(mtime_ns))
+
+
+def get_cached_ticker_options() -> tuple[str, ...]:
+    """Get ticker filter options: "" (for "All") followed by the sorted tickers.
+
+    Returned as a tuple, and as the same object until the watchlist
+    file changes, so filter selectboxes can share it unchanged.
+
+    Returns:
+        Tuple of ticker options.
+    """
+    return _load_ticker_options(_watchlist_mtime())
+
+
+@st.cache_resource(ttl=300, max_entries=4, show_spinner=False)
+def _load_ticker_positions(mtime_ns: int) -> dict[str, int]:
+    """Map each ticker option to its index for a given file version."""
+    return {ticker: i for i, ticker in enumerate(_load_ticker_options(mtime_ns))}
+
+
+def get_cached_ticker_positions() -> dict[str, int]:
+    """Get each ticker's index within get_cached_ticker_options().
+
+    Lets selectboxes resolve their initial ``index`` with a dict lookup
+    instead of scanning the options. Treat the returned dict as read-only;
+    it is shared across reruns until the watchlist file changes.
+
+    Returns:
+        Dict mapping ticker option -> index.
+    """
+    return _load_ticker_positions(_watchlist_mtime())
@@ -325,6 +325,64 @@ class TestRunSingleStockAnalysis:
         assert "Unexpected error" in result["message"]
 
 
+class TestRunManyModels:
+    """Tests for run_many_models()."""
+
+    def test_returns_config_error_per_model_when_no_client(self, monkeypatch):
+        """Every requested model should get the config error."""
+        from dashboard.utils import ai_analysis
+
+        monkeypatch.setattr(ai_analysis, "get_gemini_client_cached", lambda: None)
+
+        results = ai_analysis.run_many_models("AAPL", {})
+
+        assert list(results) == ["flash", "pro"]
+        assert all(r["error"] == "config" for r in results.values())
+
+    def test_runs_each_model_once(self, monkeypatch):
+        """Each model should be analyzed with its own Gemini model, keyed in order."""
+        from dashboard.utils import ai_analysis
+
+        def analyze(context, prompt, model):
+            result = MagicMock()
+            result.content = f"{model.name} analysis"
+            result.model = model.value
+            return result
+
+        mock_client = MagicMock()
+        mock_client.analyze_with_cache.side_effect = analyze
+        get_client = MagicMock(return_value=mock_client)
+        monkeypatch.setattr(ai_analysis, "get_gemini_client_cached", get_client)
+
+        results = ai_analysis.run_many_models(
+            "AAPL", {"piotroski": {"score": 8}, "altman": {"z_score": 4.5}}
+        )
+
+        get_client.assert_called_once()
+        assert mock_client.analyze_with_cache.call_count == 2
+        assert list(results) == ["flash", "pro"]
+        assert results["flash"]["content"] == "FLASH analysis"
+        assert results["pro"]["content"] == "PRO analysis"
+
+    def test_one_model_failing_keeps_the_other(self, monkeypatch):
+        """A failure in one model should not discard the other's result."""
+        from dashboard.utils import ai_analysis
+
+        def analyze(context, prompt, model):
+            if model.name == "PRO":
+                raise RuntimeError("boom")
+            return MagicMock(content="ok")
+
+        mock_client = MagicMock()
+        mock_client.analyze_with_cache.side_effect = analyze
+        monkeypatch.setattr(ai_analysis, "get_gemini_client_cached", lambda: mock_client)
+
+        results = ai_analysis.run_many_models("AAPL", {})
+
+        assert results["flash"]["content"] == "ok"
+        assert results["pro"]["error"] == "unknown"
+
+
 class TestRunComparisonAnalysis:
     """Tests for run_comparison_analysis()."""
 
@@ -3,7 +3,7 @@
 import pandas as pd
 import pytest
 
-from dashboard.utils.csv_export import sanitize_csv_dataframe
+from dashboard.utils.csv_export import export_csv_bytes, sanitize_csv_dataframe
 
 
 class TestSanitizeCsvDataframe:
@@ -57,3 +57,26 @@ class TestSanitizeCsvDataframe:
         df = pd.DataFrame({"name": ["=BAD"]})
         sanitize_csv_dataframe(df)
         assert df["name"].iloc[0] == "=BAD"
+
+    def test_escapes_backslash_prefix_and_skips_non_strings(self):
+        df = pd.DataFrame({"mixed": ["\\\\server\\share", 5, "", None, "-x"]})
+        result = sanitize_csv_dataframe(df)
+        assert result["mixed"].tolist() == ["'\\\\server\\share", 5, "", None, "'-x"]
+
+    def test_handles_object_column_without_strings(self):
+        df = pd.DataFrame({"ids": pd.Series([1, 2], dtype=object)})
+        result = sanitize_csv_dataframe(df)
+        assert result["ids"].tolist() == [1, 2]
+
+
+class TestExportCsvBytes:
+    """Tests for the sanitized CSV bytes helper."""
+
+    def test_matches_sanitized_to_csv(self):
+        df = pd.DataFrame({"name": ["=BAD", "Café"], "price": [1.5, -2.0]})
+        expected = sanitize_csv_dataframe(df).to_csv(index=False).encode("utf-8")
+        assert export_csv_bytes(df) == expected
+
+    def test_empty_dataframe_writes_header_only(self):
+        df = pd.DataFrame({"name": pd.Series([], dtype=str)})
+        assert export_csv_bytes(df) == b"name\n"
@@ -4,6 +4,8 @@ Tests for dashboard/components/decisions.py - confidence indicator.
 Tests for dashboard/utils/formatters.py - date formatting.
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from dashboard.components.decisions import render_confidence_indicator
@@ -116,3 +118,166 @@ class TestRenderConfidenceIndicator:
         html = render_confidence_indicator(0)
         # 0 is not in CONFIDENCE_LEVELS, should fallback
         assert "Medium" in html
+
+
+class TestOutcomeReviewFrame:
+    """Tests for the batched outcome-review editor helpers."""
+
+    @pytest.fixture
+    def decisions(self):
+        return [
+            {"id": 1, "ticker": "AAPL", "action": "buy", "confidence": 4,
+             "decided_at": "2025-01-15T10:30:00", "target_price": 200.0},
+            {"id": 2, "ticker": "MSFT", "action": "hold", "confidence": None,
+             "decided_at": None, "target_price": None},
+        ]
+
+    def test_frame_has_one_row_per_decision(self, decisions):
+        """Frame should have a row per decision with no outcome pre-selected."""
+        from dashboard.components.decisions.outcomes_tab import _build_outcome_frame
+
+        df = _build_outcome_frame(decisions)
+        assert list(df["id"]) == [1, 2]
+        assert list(df["action"]) == ["BUY", "HOLD"]
+        assert list(df["decided_at"]) == ["2025-01-15", "N/A"]
+        assert df["outcome"].isna().all()
+
+    def test_untouched_frame_yields_no_updates(self, decisions):
+        """Rows without a chosen outcome should not be saved."""
+        from dashboard.components.decisions.outcomes_tab import (
+            _build_outcome_frame,
+            _collect_outcomes,
+        )
+
+        assert _collect_outcomes(_build_outcome_frame(decisions)) == []
+
+    def test_only_edited_rows_are_collected(self, decisions):
+        """Only rows with an outcome should produce update kwargs."""
+        from dashboard.components.decisions.outcomes_tab import (
+            _build_outcome_frame,
+            _collect_outcomes,
+        )
+
+        df = _build_outcome_frame(decisions)
+        df.loc[1, ["outcome", "lessons", "hit"]] = ["failure", "Too early", True]
+
+        assert _collect_outcomes(df) == [{
+            "decision_id": 2,
+            "actual_outcome": "failure",
+            "actual_price": None,
+            "lessons_learned": "Too early",
+            "hit": True,
+        }]
+
+
+@pytest.fixture
+def temp_db(monkeypatch, tmp_path):
+    """Point the database at a temporary SQLite file."""
+    from asymmetric.config import Config
+    from asymmetric.db.database import reset_engine
+
+    test_config = Config()
+    test_config.db_path = tmp_path / "test_decisions.db"
+    monkeypatch.setattr("asymmetric.db.database.config", test_config)
+    reset_engine()
+    yield
+    reset_engine()
+
+
+class TestGetEntitiesByIds:
+    """Tests for the batched decision/thesis detail lookup."""
+
+    def test_empty_ids_skip_database(self):
+        """No IDs should return empty mappings without touching the DB."""
+        from dashboard.utils.decisions import get_entities_by_ids
+
+        with patch("dashboard.utils.decisions.get_session") as mock_get_session:
+            assert get_entities_by_ids((), ()) == ({}, {})
+            mock_get_session.assert_not_called()
+
+    def test_matches_single_lookups(self, temp_db):
+        """Batched results should match get_decision_by_id/get_thesis_by_id."""
+        from dashboard.utils.decisions import (
+            create_decision,
+            create_thesis,
+            get_decision_by_id,
+            get_entities_by_ids,
+            get_thesis_by_id,
+        )
+
+        thesis_id = create_thesis(ticker="AAPL", summary="Moat", status="active")
+        decision_id = create_decision(ticker="AAPL", action="buy", thesis_id=thesis_id)
+
+        decisions, theses = get_entities_by_ids([decision_id, 999], [thesis_id])
+
+        assert decisions == {decision_id: get_decision_by_id(decision_id)}
+        assert theses == {thesis_id: get_thesis_by_id(thesis_id)}
+        assert theses[thesis_id]["decision_count"] == 1
+
+
+class TestPagination:
+    """Tests for paginated decision/thesis queries and their counts."""
+
+    def test_offset_pages_through_results(self, temp_db):
+        """Consecutive pages should cover every decision exactly once."""
+        from dashboard.utils.decisions import (
+            count_decisions,
+            create_decision,
+            create_thesis,
+            get_decisions,
+        )
+
+        thesis_id = create_thesis(ticker="AAPL", summary="Moat", status="active")
+        for action in ("buy", "hold", "sell"):
+            create_decision(ticker="AAPL", action=action, thesis_id=thesis_id)
+
+        first = get_decisions(limit=2)
+        second = get_decisions(limit=2, offset=2)
+
+        assert len(first) == 2
+        assert len(second) == 1
+        assert {d["id"] for d in first + second} == {d["id"] for d in get_decisions()}
+        assert count_decisions() == 3
+        assert count_decisions(action="buy") == 1
+        assert count_decisions(ticker="MSFT") == 0
+
+    def test_count_theses_matches_filters(self, temp_db):
+        """Thesis counts should honour the same filters as get_theses()."""
+        from dashboard.utils.decisions import count_theses, create_thesis, get_theses
+
+        create_thesis(ticker="AAPL", summary="Moat", status="active")
+        create_thesis(ticker="MSFT", summary="Cloud", status="draft")
+
+        assert count_theses() == len(get_theses()) == 2
+        assert count_theses(status="draft") == 1
+        assert count_theses(ticker="aapl") == 1
+
+    def test_counts_wrap_database_errors(self, temp_db):
+        """Count failures should surface as ValueError, like get_decisions()."""
+        from sqlalchemy.exc import SQLAlchemyError
+
+        from dashboard.utils import decisions
+
+        session = MagicMock()
+        session.exec.side_effect = SQLAlchemyError("db down")
+        with patch.object(decisions, "get_session") as mock_get_session:
+            mock_get_session.return_value.__enter__.return_value = session
+            with pytest.raises(ValueError, match="Failed to count decisions"):
+                decisions.count_decisions()
+            with pytest.raises(ValueError, match="Failed to count theses"):
+                decisions.count_theses()
+
+
+class TestDetailPicker:
+    """Tests for the table views' detail-picker callback."""
+
+    def test_open_detail_is_mutually_exclusive(self):
+        """Opening one detail view should close the other."""
+        from dashboard.components.decisions import cards
+
+        with patch.object(cards.st, "session_state", MagicMock()) as state:
+            state.selected_thesis_id = 7
+            cards._open_detail("selected_decision_id", 3)
+
+        state.__setitem__.assert_called_once_with("selected_decision_id", 3)
+        assert state.selected_thesis_id is None
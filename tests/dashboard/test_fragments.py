@@ -0,0 +1,35 @@
+"""Test fragment helper.
+
+Tests for dashboard/utils/fragments.py - st.fragment with a fallback.
+"""
+
+from unittest.mock import MagicMock, patch
+
+
+class TestFragmentHelper:
+    """Test the fragment decorator wrapper."""
+
+    def test_falls_back_to_plain_function(self):
+        """Without st.fragment the function is returned unchanged."""
+        from dashboard.utils import fragments
+
+        def render():
+            return "rendered"
+
+        with patch.object(fragments, "st", MagicMock(spec=[])):
+            assert fragments.fragment(render) is render
+            assert fragments.fragment(run_every=30)(render) is render
+
+    def test_uses_st_fragment_when_available(self):
+        """With st.fragment the function is wrapped and run_every forwarded."""
+        from dashboard.utils import fragments
+
+        def render():
+            return "rendered"
+
+        mock_st = MagicMock()
+        with patch.object(fragments, "st", mock_st):
+            wrapped = fragments.fragment(run_every=30)(render)
+
+        mock_st.fragment.assert_called_once_with(render, run_every=30)
+        assert wrapped is mock_st.fragment.return_value
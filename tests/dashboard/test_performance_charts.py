@@ -0,0 +1,95 @@
+"""Test historical performance chart helpers.
+
+Tests for dashboard/utils/performance_charts.py - snapshot frame and charts.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from asymmetric.db.portfolio_models import PortfolioSnapshot
+
+
+def _snapshots(count=6):
+    return [
+        PortfolioSnapshot(
+            snapshot_date=datetime(2026, 1, 1) + timedelta(days=i),
+            total_value=Decimal(1000 + i * 10),
+            total_cost_basis=Decimal(0 if i == 0 else 1000),
+            unrealized_pnl=Decimal(i * 10),
+            realized_pnl_total=Decimal("5.50"),
+            position_count=3 + i % 2,
+            weighted_fscore=None if i == 1 else 6.5,
+            weighted_zscore=2.5,
+        )
+        for i in range(count)
+    ]
+
+
+class TestSnapshotFrame:
+    """Test the shared snapshot DataFrame."""
+
+    def test_columns_and_float_money(self):
+        """Frame has the charted columns with Decimals converted to floats."""
+        from dashboard.utils.performance_charts import SNAPSHOT_COLUMNS, snapshot_frame
+
+        df = snapshot_frame(_snapshots())
+
+        assert tuple(df.columns) == SNAPSHOT_COLUMNS
+        assert len(df) == 6
+        assert df["total_value"].dtype == float
+        assert df["realized_pnl_total"].iloc[0] == 5.5
+        assert df["weighted_fscore"].isna().sum() == 1
+
+    def test_empty(self):
+        """No snapshots yields an empty frame with the same columns."""
+        from dashboard.utils.performance_charts import SNAPSHOT_COLUMNS, snapshot_frame
+
+        df = snapshot_frame([])
+
+        assert tuple(df.columns) == SNAPSHOT_COLUMNS
+        assert df.empty
+
+
+class TestCharts:
+    """Test chart builders against the shared frame."""
+
+    def test_return_pct_vectorized(self):
+        """Zero cost basis returns 0%, others (value - cost) / cost."""
+        from dashboard.utils.performance_charts import (
+            create_return_percentage_chart,
+            snapshot_frame,
+        )
+
+        fig = create_return_percentage_chart(snapshot_frame(_snapshots()))
+
+        assert list(fig.data[0].y) == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+        assert list(fig.data[0].customdata) == [1000.0, 10.0, 20.0, 30.0, 40.0, 50.0]
+
+    def test_charts_do_not_mutate_shared_frame(self):
+        """Chart builders leave the shared frame's columns untouched."""
+        from dashboard.utils.performance_charts import (
+            create_pnl_attribution_chart,
+            create_portfolio_value_chart,
+            create_position_count_chart,
+            create_return_percentage_chart,
+            snapshot_frame,
+        )
+
+        df = snapshot_frame(_snapshots())
+        columns = list(df.columns)
+
+        create_portfolio_value_chart(df)
+        create_return_percentage_chart(df)
+        create_position_count_chart(df)
+        fig = create_pnl_attribution_chart(df)
+
+        assert list(df.columns) == columns
+        assert fig.layout.legend.orientation == "h"
+
+    def test_accepts_snapshot_dicts(self):
+        """List-of-dict input still works."""
+        from dashboard.utils.performance_charts import create_position_count_chart
+
+        fig = create_position_count_chart([s.model_dump() for s in _snapshots()])
+
+        assert len(fig.data) == 2
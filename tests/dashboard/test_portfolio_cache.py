@@ -0,0 +1,142 @@
+"""Tests for the background price fetch in dashboard/utils/portfolio_cache.py."""
+
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def price_refresh(tmp_db):
+    """Fresh process-wide refresh state, with the manager and executor mocked.
+
+    Uses tmp_db so importing portfolio_cache initializes a temporary database.
+    Yields (portfolio_cache module, mock executor, mock manager).
+    """
+    from dashboard.utils import portfolio_cache
+
+    portfolio_cache._price_refresh.clear()
+    portfolio_cache._last_known_prices.clear()
+
+    manager = MagicMock()
+    manager.get_open_tickers.return_value = ["AAPL", "MSFT"]
+    executor = MagicMock()
+    executor.submit.side_effect = lambda fn, *args: Future()
+
+    with patch.object(portfolio_cache, "get_portfolio_manager", return_value=manager), \
+            patch.object(portfolio_cache, "_price_executor", return_value=executor), \
+            patch.object(portfolio_cache, "_PRICE_SUBMIT_WAIT", 0):
+        yield portfolio_cache, executor, manager
+
+    portfolio_cache._price_refresh.clear()
+    portfolio_cache._last_known_prices.clear()
+
+
+class TestPricesPending:
+    """Test prices_pending() submit/poll behaviour."""
+
+    def test_first_call_submits_fetch(self, price_refresh):
+        """The first call submits one fetch for the open tickers and reports it pending."""
+        portfolio_cache, executor, _ = price_refresh
+
+        assert portfolio_cache.prices_pending() is True
+
+        executor.submit.assert_called_once_with(
+            portfolio_cache.get_cached_market_prices, ("AAPL", "MSFT")
+        )
+
+    def test_pending_then_done(self, price_refresh):
+        """Polling reuses the running fetch and turns False once it finishes."""
+        portfolio_cache, executor, _ = price_refresh
+
+        assert portfolio_cache.prices_pending() is True
+        assert portfolio_cache.prices_pending() is True
+
+        future = portfolio_cache._price_refresh()["future"]
+        future.set_result({"AAPL": 190.0})
+
+        assert portfolio_cache.prices_pending() is False
+        assert executor.submit.call_count == 1
+
+    def test_state_is_shared_across_sessions(self, price_refresh):
+        """A finished fetch is not resubmitted for a new session within the TTL."""
+        portfolio_cache, executor, _ = price_refresh
+
+        portfolio_cache.prices_pending()
+        portfolio_cache._price_refresh()["future"].set_result({})
+
+        with patch.object(portfolio_cache.st, "session_state", {}):
+            assert portfolio_cache.prices_pending() is False
+
+        assert executor.submit.call_count == 1
+
+    def test_resubmits_after_ttl(self, price_refresh):
+        """Once the price TTL has elapsed a new fetch is submitted."""
+        portfolio_cache, executor, _ = price_refresh
+
+        with patch.object(portfolio_cache.time, "monotonic", return_value=1000.0):
+            portfolio_cache.prices_pending()
+        portfolio_cache._price_refresh()["future"].set_result({})
+
+        later = 1000.0 + portfolio_cache._PRICE_TTL
+        with patch.object(portfolio_cache.time, "monotonic", return_value=later - 1):
+            assert portfolio_cache.prices_pending() is False
+        with patch.object(portfolio_cache.time, "monotonic", return_value=later):
+            assert portfolio_cache.prices_pending() is True
+
+        assert executor.submit.call_count == 2
+
+    def test_warm_cache_fetch_is_not_pending(self, price_refresh):
+        """A fetch that finishes within the submit wait renders live prices straight away."""
+        portfolio_cache, executor, _ = price_refresh
+
+        def finished(fn, *args):
+            future = Future()
+            future.set_result({})
+            return future
+
+        executor.submit.side_effect = finished
+
+        assert portfolio_cache.prices_pending() is False
+
+    def test_reset_forces_resubmit(self, price_refresh):
+        """Clearing the portfolio cache makes the next call fetch again."""
+        portfolio_cache, executor, _ = price_refresh
+
+        portfolio_cache.prices_pending()
+        portfolio_cache._price_refresh()["future"].set_result({})
+        portfolio_cache._reset_price_refresh()
+
+        assert portfolio_cache.prices_pending() is True
+        assert executor.submit.call_count == 2
+
+
+class TestStalePortfolioData:
+    """Test get_stale_portfolio_data() pricing."""
+
+    def test_uses_last_known_prices(self, price_refresh):
+        """Stale data is priced from the last successful fetch, without a network call."""
+        portfolio_cache, executor, manager = price_refresh
+        portfolio_cache._priced_portfolio_data.clear()
+        portfolio_cache._last_known_prices().update({"AAPL": 190.0, "MSFT": 410.0})
+        manager.get_portfolio_summary.return_value = "summary"
+        manager.get_holdings.return_value = []
+        manager.get_weighted_scores.return_value = None
+
+        _, _, _, prices = portfolio_cache.get_stale_portfolio_data()
+
+        assert prices == {"AAPL": 190.0, "MSFT": 410.0}
+        manager.get_portfolio_summary.assert_called_once_with(market_prices=prices)
+        manager.refresh_market_prices.assert_not_called()
+        executor.submit.assert_not_called()
+
+    def test_fetch_records_last_known_prices(self, price_refresh):
+        """Successful quotes are remembered; missing ones keep the previous price."""
+        portfolio_cache, _, manager = price_refresh
+        portfolio_cache.get_cached_market_prices.clear()
+        portfolio_cache._last_known_prices().update({"MSFT": 400.0})
+        manager.refresh_market_prices.return_value = {"AAPL": 190.0, "MSFT": None}
+
+        portfolio_cache.get_cached_market_prices(("AAPL", "MSFT"))
+
+        assert portfolio_cache._last_known_prices() == {"AAPL": 190.0, "MSFT": 400.0}
@@ -136,6 +136,201 @@ class TestHoldingsDataPrep:
         assert pnl_text == "N/A"
         assert market_value == 15000.0  # Falls back to cost basis
 
+    def test_holdings_frame_columns_and_formatting(self):
+        """Test the Holdings DataFrame column order and score formatting."""
+        from dashboard.components.portfolio.holdings_tab import HOLDINGS_COLUMNS, holdings_frame
+
+        df = holdings_frame([MockHolding(), MockHolding(ticker="MSFT", fscore=None, zone=None)])
+
+        assert tuple(df.columns) == HOLDINGS_COLUMNS
+        assert df["Unrealized P&L"].iloc[0].startswith("▲ $3,500.00")
+        assert df["F-Score"].tolist() == ["7/9", "N/A"]
+        assert df["Z-Zone"].tolist() == ["Safe", "N/A"]
+
+    def test_holdings_frame_pnl_text(self):
+        """Test the P&L column text for gains, losses, flat and unpriced holdings."""
+        from dashboard.components.portfolio.holdings_tab import holdings_frame
+
+        df = holdings_frame([
+            MockHolding(unrealized_pnl=1234.5, unrealized_pnl_percent=5.0),
+            MockHolding(unrealized_pnl=-20.0, unrealized_pnl_percent=-2.25),
+            MockHolding(unrealized_pnl=0.0, unrealized_pnl_percent=0.0),
+            MockHolding(unrealized_pnl=None, unrealized_pnl_percent=None),
+        ])
+
+        assert df["Unrealized P&L"].tolist() == [
+            "▲ $1,234.50 (+5.0%)",
+            "▼ $-20.00 (-2.2%)",
+            "— $0.00 (+0.0%)",
+            "N/A",
+        ]
+
+    def test_holdings_frame_numeric_columns_are_typed(self):
+        """Test numeric columns come out as numeric dtypes, not object."""
+        import pandas as pd
+
+        from dashboard.components.portfolio.holdings_tab import holdings_frame
+
+        df = holdings_frame([
+            MockHolding(),
+            MockHolding(ticker="MSFT", current_price=None, market_value=None),
+        ])
+
+        for col in (
+            "Shares", "Cost Basis", "Current Price", "Market Value", "_pnl_pct", "Allocation %"
+        ):
+            assert pd.api.types.is_float_dtype(df[col]), col
+        assert pd.api.types.is_integer_dtype(df["Days Held"])
+
+    def test_holdings_frame_without_any_scores(self):
+        """Test formatting when no holding has been scored yet."""
+        from dashboard.components.portfolio.holdings_tab import holdings_frame
+
+        df = holdings_frame([MockHolding(fscore=None, zone=None)])
+
+        assert df["F-Score"].tolist() == ["N/A"]
+        assert df["Z-Zone"].tolist() == ["N/A"]
+
+
+class TestPnlStyles:
+    """Test column-wise P&L color rules for the Holdings table."""
+
+    def test_colors_follow_sign(self):
+        """Test gains are green, losses red and flat values unstyled."""
+        import pandas as pd
+
+        from dashboard.components.portfolio.holdings_tab import _pnl_styles
+        from dashboard.theme import get_semantic_color
+
+        styles = _pnl_styles(pd.Series([12.5, -3.0, 0.0]))
+
+        assert styles.tolist() == [
+            f"color: {get_semantic_color('green')}",
+            f"color: {get_semantic_color('red')}",
+            "",
+        ]
+
+
+class TestSortHoldings:
+    """Test in-memory holdings sort used by the Holdings tab."""
+
+    def _holdings(self):
+        """Three holdings with mixed missing values."""
+        return [
+            MockHolding(
+                ticker="MSFT", market_value=5000.0, unrealized_pnl_percent=-4.0, fscore=None
+            ),
+            MockHolding(
+                ticker="AAPL", market_value=None, cost_basis_total=9000.0,
+                unrealized_pnl_percent=None, fscore=5,
+            ),
+            MockHolding(
+                ticker="NVDA", market_value=20000.0, unrealized_pnl_percent=40.0, fscore=8
+            ),
+        ]
+
+    def test_sort_by_value_falls_back_to_cost_basis(self):
+        """Test value sort uses cost basis when market value is missing."""
+        from dashboard.components.portfolio.holdings_tab import sort_holdings
+
+        result = sort_holdings(self._holdings(), "value")
+        assert [h.ticker for h in result] == ["NVDA", "AAPL", "MSFT"]
+
+    def test_sort_by_gainloss_puts_missing_last(self):
+        """Test gain/loss sort places holdings without a P&L % last."""
+        from dashboard.components.portfolio.holdings_tab import sort_holdings
+
+        result = sort_holdings(self._holdings(), "gainloss")
+        assert [h.ticker for h in result] == ["NVDA", "MSFT", "AAPL"]
+
+    def test_sort_by_ticker_and_fscore(self):
+        """Test ticker and F-Score sort orders."""
+        from dashboard.components.portfolio.holdings_tab import sort_holdings
+
+        by_ticker = sort_holdings(self._holdings(), "ticker")
+        by_fscore = sort_holdings(self._holdings(), "fscore")
+        assert [h.ticker for h in by_ticker] == ["AAPL", "MSFT", "NVDA"]
+        assert [h.ticker for h in by_fscore] == ["NVDA", "AAPL", "MSFT"]
+
+    def test_does_not_mutate_input(self):
+        """Test sorting returns a new list and leaves the input order alone."""
+        from dashboard.components.portfolio.holdings_tab import sort_holdings
+
+        holdings = self._holdings()
+        sort_holdings(holdings, "ticker")
+        assert [h.ticker for h in holdings] == ["MSFT", "AAPL", "NVDA"]
+
+
+class TestAllocationChart:
+    """Test allocation chart inputs on the Holdings tab."""
+
+    def test_top_positions_keeps_largest(self):
+        """Test only the largest positions are kept, largest first."""
+        import pandas as pd
+
+        from dashboard.components.portfolio.holdings_tab import _top_positions
+
+        df = pd.DataFrame({
+            "Ticker": ["A", "B", "C", "D"],
+            "Market Value": [10.0, 40.0, 5.0, 25.0],
+        })
+        top = _top_positions(df, 2)
+        assert list(top.index) == ["B", "D"]
+        assert list(top) == [40.0, 25.0]
+
+    def test_allocation_pie_labels_inside(self):
+        """Test the allocation pie keeps values in order with inside labels."""
+        from dashboard.components.portfolio.holdings_tab import _allocation_pie
+
+        fig = _allocation_pie((300.0, 100.0), ("AAPL", "MSFT"), "Ticker", "By Position")
+        assert list(fig.data[0].values) == [300.0, 100.0]
+        assert fig.data[0].textposition == "inside"
+
+    def test_zone_allocation_bar_single_trace(self):
+        """Test the zone allocation bar is one trace with per-zone colors."""
+        from dashboard.components.portfolio.health_tab import _zone_allocation_bar
+
+        fig = _zone_allocation_bar(60.0, 30.0, 10.0)
+        assert len(fig.data) == 1
+        assert list(fig.data[0].x) == ["Safe", "Grey", "Distress"]
+        assert list(fig.data[0].y) == [60.0, 30.0, 10.0]
+        assert list(fig.data[0].marker.color) == ["green", "orange", "red"]
+
+
+class TestHealthAssessments:
+    """Test the Health Assessment rule tables."""
+
+    def test_fscore_bands(self):
+        """Test the weighted F-Score maps to green/orange/red at 7 and 5."""
+        from dashboard.components.portfolio.health_tab import _health_assessments
+
+        colors = [
+            _health_assessments(MockWeightedScores(weighted_fscore=f))[0][2]
+            for f in (8.0, 7.0, 6.9, 5.0, 4.9)
+        ]
+        assert colors == ["green", "green", "orange", "orange", "red"]
+
+    def test_zone_first_match_wins(self):
+        """Test only the first matching zone rule (distress) is reported."""
+        from dashboard.components.portfolio.health_tab import _health_assessments
+
+        result = _health_assessments(MockWeightedScores(
+            safe_allocation=70.0, grey_allocation=45.0, distress_allocation=25.0,
+        ))
+        assert result[1] == (
+            "Z-Score",
+            "25.0% in Distress zone - high bankruptcy risk exposure",
+            "red",
+        )
+        assert len(result) == 2
+
+    def test_no_zone_line_below_thresholds(self):
+        """Test no zone line is added when no zone rule matches."""
+        from dashboard.components.portfolio.health_tab import _health_assessments
+
+        # Default mock: safe 60 (not > 60), grey 30, distress 10
+        assert len(_health_assessments(MockWeightedScores())) == 1
+
 
 class TestPerformanceMetrics:
     """Test performance metric calculations."""
@@ -172,6 +367,104 @@ class TestPerformanceMetrics:
         assert avg_gain == 750.0
         assert avg_loss == -200.0
 
+    def test_win_loss_stats_single_pass(self):
+        """Test the combined win/loss summary matches the per-metric formulas."""
+        from dashboard.components.portfolio.performance_tab import _win_loss_stats
+
+        holdings = [
+            MockHolding(
+                ticker="A", unrealized_pnl=1000, unrealized_pnl_percent=10.0, market_value=11000.0
+            ),
+            MockHolding(
+                ticker="B", unrealized_pnl=500, unrealized_pnl_percent=0.0, market_value=5500.0
+            ),
+            MockHolding(
+                ticker="C", unrealized_pnl=-200, unrealized_pnl_percent=-4.0, market_value=4800.0
+            ),
+            MockHolding(
+                ticker="D", unrealized_pnl=0, unrealized_pnl_percent=None, market_value=None
+            ),
+        ]
+
+        stats = _win_loss_stats(holdings)
+
+        assert (stats["count"], stats["winners"], stats["losers"]) == (4, 2, 1)
+        assert stats["win_rate"] == 50.0
+        assert stats["avg_gain"] == 750.0
+        assert stats["avg_loss"] == -200.0
+        assert (stats["best"].ticker, stats["best_pct"]) == ("A", 10.0)
+        assert (stats["worst"].ticker, stats["worst_pct"]) == ("C", -4.0)
+        assert stats["total_market_value"] == 21300.0
+
+    def test_win_loss_stats_without_percentages(self):
+        """Test best/worst fall back to the first holding when no percentages exist."""
+        from dashboard.components.portfolio.performance_tab import _win_loss_stats
+
+        stats = _win_loss_stats([MockHolding(ticker="Z", unrealized_pnl_percent=None)])
+
+        assert stats["best"].ticker == stats["worst"].ticker == "Z"
+        assert stats["best_pct"] == stats["worst_pct"] == 0.0
+
+    def test_top_bottom_performers(self):
+        """Best and worst n by P&L %, missing percentages ranked as 0."""
+        from dashboard.components.portfolio.performance_tab import _top_bottom_performers
+
+        holdings = [
+            MockHolding(ticker=f"T{pct}", unrealized_pnl_percent=pct)
+            for pct in (5.0, -12.0, 30.0, 0.5, -3.0, 18.0, -40.0)
+        ]
+        holdings.append(MockHolding(ticker="NONE", unrealized_pnl_percent=None))
+
+        top, bottom = _top_bottom_performers(holdings, n=3)
+
+        assert [h.ticker for h in top] == ["T30.0", "T18.0", "T5.0"]
+        assert [h.ticker for h in bottom] == ["T-40.0", "T-12.0", "T-3.0"]
+
+        top, bottom = _top_bottom_performers(holdings[:2])
+        assert [h.ticker for h in top] == ["T5.0", "T-12.0"]
+        assert [h.ticker for h in bottom] == ["T-12.0", "T5.0"]
+
+    def test_performers_frame_formatting(self):
+        """Test winners/losers rows keep the displayed formatting."""
+        from dashboard.components.portfolio.performance_tab import (
+            PERFORMER_COLUMNS,
+            _performers_frame,
+        )
+
+        df = _performers_frame([
+            MockHolding(),
+            MockHolding(ticker="MSFT", unrealized_pnl=-250.0, unrealized_pnl_percent=-5.0),
+        ])
+
+        assert tuple(df.columns) == PERFORMER_COLUMNS
+        assert df["P&L ($)"].tolist() == ["▲ $3,500.00", "▼ $-250.00"]
+        assert df["P&L (%)"].tolist() == ["+23.3%", "-5.0%"]
+        assert df["Cost Basis"].iloc[0] == "$15,000.00"
+
+    def test_pnl_chart_frame_filters_realized(self):
+        """Test realized rows keep only non-zero gains for current holdings."""
+        from dashboard.components.portfolio.performance_tab import _pnl_chart_frame
+
+        holdings = [MockHolding(), MockHolding(ticker="MSFT", unrealized_pnl=-250.0)]
+        realized = {"AAPL": 120.0, "MSFT": 0.0, "TSLA": 900.0}
+
+        df = _pnl_chart_frame(holdings, realized)
+
+        assert df.to_dict("records") == [
+            {"Ticker": "AAPL", "P&L": 3500.0, "Type": "Unrealized"},
+            {"Ticker": "MSFT", "P&L": -250.0, "Type": "Unrealized"},
+            {"Ticker": "AAPL", "P&L": 120.0, "Type": "Realized"},
+        ]
+
+    def test_pnl_chart_frame_without_realized(self):
+        """Test the frame still has all columns when nothing was realized."""
+        from dashboard.components.portfolio.performance_tab import _pnl_chart_frame
+
+        df = _pnl_chart_frame([MockHolding()], {})
+
+        assert list(df.columns) == ["Ticker", "P&L", "Type"]
+        assert df["Type"].tolist() == ["Unrealized"]
+
 
 class TestHealthAssessment:
     """Test health assessment logic."""
@@ -200,3 +493,60 @@ class TestHealthAssessment:
         scores = MockWeightedScores(safe_allocation=60.0, grey_allocation=30.0, distress_allocation=10.0)
         total = scores.safe_allocation + scores.grey_allocation + scores.distress_allocation
         assert total == pytest.approx(100.0)
+
+
+class TestHistoryFrame:
+    """Test Transaction History table construction."""
+
+    def _record(self, transaction_type, date, total_cost, total_proceeds, realized_gain=None):
+        """Build a TransactionRecord on ``date`` (year, month, day)."""
+        from datetime import datetime, timezone
+
+        from asymmetric.core.portfolio.manager import TransactionRecord
+
+        return TransactionRecord(
+            id=1, ticker="AAPL", company_name="Apple Inc.", transaction_type=transaction_type,
+            transaction_date=datetime(*date, 15, tzinfo=timezone.utc), quantity=2.0,
+            price_per_share=10.0, fees=1.0, total_cost=total_cost, total_proceeds=total_proceeds,
+            realized_gain=realized_gain, notes=None,
+        )
+
+    def test_columns_and_formatting(self):
+        """Test history columns, date/type formatting and zeroed cost/proceeds."""
+        from dashboard.components.portfolio.transactions_tab import HISTORY_COLUMNS, history_frame
+
+        df = history_frame([
+            self._record("sell", (2026, 3, 5), 20.0, 19.0, realized_gain=4.5),
+            self._record("buy", (2026, 3, 4), 21.0, 0.0),
+        ])
+
+        assert tuple(df.columns) == HISTORY_COLUMNS
+        assert df["Date"].tolist() == ["2026-03-05", "2026-03-04"]
+        assert df["Type"].tolist() == ["SELL", "BUY"]
+        assert df["Total Cost"].tolist() == [0, 21.0]
+        assert df["Proceeds"].tolist() == [19.0, 0]
+        assert df["Notes"].tolist() == ["", ""]
+
+    def test_cash_flow_frame(self):
+        """Test cash flow columns, title-cased types and float amounts."""
+        from datetime import datetime, timezone
+        from decimal import Decimal
+
+        from asymmetric.db.portfolio_models import CashFlow
+        from dashboard.components.portfolio.transactions_tab import (
+            CASH_FLOW_COLUMNS,
+            cash_flow_frame,
+        )
+
+        df = cash_flow_frame([
+            CashFlow(flow_type="deposit", amount=Decimal("1500.50"),
+                     flow_date=datetime(2026, 2, 1, tzinfo=timezone.utc), notes="Initial"),
+            CashFlow(flow_type="withdrawal", amount=Decimal("200"),
+                     flow_date=datetime(2026, 3, 1, tzinfo=timezone.utc)),
+        ])
+
+        assert tuple(df.columns) == CASH_FLOW_COLUMNS
+        assert df["Date"].tolist() == ["2026-02-01", "2026-03-01"]
+        assert df["Type"].tolist() == ["Deposit", "Withdrawal"]
+        assert df["Amount"].tolist() == [1500.5, 200.0]
+        assert df["Notes"].tolist() == ["Initial", ""]
@@ -96,6 +96,148 @@ class TestWizardStepLogic:
         assert len(valid_summary.strip()) >= 20
 
 
+class TestStepIndicator:
+    """Test the precomputed wizard step indicator."""
+
+    def test_renders_precomputed_markup(self):
+        from dashboard.components.research import wizard_steps
+
+        mock_st = MagicMock()
+        with patch.object(wizard_steps, "st", mock_st):
+            wizard_steps.render_step_indicator(1)
+
+        html = mock_st.markdown.call_args.args[0]
+        assert html is wizard_steps._STEP_INDICATOR_HTML[1]
+        assert html.count("circle completed") == 1
+        assert html.count("circle active") == 1
+        assert html.count("circle pending") == 1
+
+    def test_marks_final_step_active(self):
+        from dashboard.components.research import wizard_steps
+
+        html = wizard_steps._STEP_INDICATOR_HTML[2]
+        assert html.count("\u2713") == 2
+        assert "asym-wizard-connector pending" not in html
+
+
+class TestWizardSessionState:
+    """Test wizard state init/reset through the shared session_state helpers."""
+
+    def test_init_sets_wizard_defaults(self):
+        from dashboard.utils import session_state
+
+        with patch.object(session_state, "st", MagicMock(session_state={})) as mock_st:
+            session_state.init_page_state("research")
+            state = mock_st.session_state
+
+        assert state["research_step"] == 0
+        assert state["research_ticker"] is None
+        assert state["research_thesis_draft"] == {}
+        assert state["confirm_reset"] is False
+
+    def test_reset_clears_wizard_data_in_one_update(self):
+        from dashboard.utils import session_state
+
+        state = MagicMock()
+        with patch.object(session_state, "st", MagicMock(session_state=state)):
+            session_state.reset_page_state("research")
+
+        state.update.assert_called_once()
+        values = state.update.call_args.args[0]
+        assert "theme" not in values
+        assert values["research_step"] == 0
+        assert values["research_scores"] is None
+        assert values["research_thesis_draft"] == {}
+        default_draft = session_state.SESSION_DEFAULTS["research_thesis_draft"]
+        assert values["research_thesis_draft"] is not default_draft
+
+
+class TestWizardBackendGuards:
+    """Test the wizard's handling of unavailable AI/decision backends."""
+
+    def test_ai_analysis_unavailable_shows_error(self):
+        from dashboard.components.research import wizard_steps
+
+        mock_st = MagicMock(session_state={})
+        with patch.object(wizard_steps, "st", mock_st), \
+                patch.object(wizard_steps, "AI_AVAILABLE", False):
+            wizard_steps._run_ai_analysis("AAPL", {}, "flash")
+
+        mock_st.error.assert_called_once()
+        mock_st.spinner.assert_not_called()
+        assert "research_ai_analysis" not in mock_st.session_state
+
+    def test_run_both_prefers_last_successful_model(self):
+        from dashboard.components.research import wizard_steps
+
+        results = {"flash": {"content": "quick"}, "pro": {"error": "rate_limited"}}
+        mock_st = MagicMock(session_state={})
+        with patch.object(wizard_steps, "st", mock_st), \
+                patch.object(wizard_steps, "AI_AVAILABLE", True), \
+                patch.object(
+                    wizard_steps, "run_many_models", create=True, return_value=results
+                ) as mock_run:
+            wizard_steps._run_ai_analysis("AAPL", {}, "flash", "pro")
+
+        mock_run.assert_called_once_with("AAPL", {}, ("flash", "pro"))
+        assert mock_st.session_state["research_ai_analyses"] is results
+        assert mock_st.session_state["research_ai_analysis"] == {"content": "quick"}
+
+    def test_save_unavailable_shows_error(self):
+        from dashboard.components.research import wizard_steps
+
+        mock_st = MagicMock()
+        with patch.object(wizard_steps, "st", mock_st), \
+                patch.object(wizard_steps, "DECISIONS_AVAILABLE", False), \
+                patch.object(wizard_steps, "add_stock") as mock_add_stock:
+            wizard_steps._save_thesis_and_decision("AAPL", {"summary": "x"}, "buy", 3, "", 0.0, 0.0)
+
+        mock_st.error.assert_called_once()
+        mock_add_stock.assert_not_called()
+
+
+class TestResearchScoreLookup:
+    """Test score loading for the Analyze Stock button."""
+
+    def test_repeat_lookup_reuses_result(self):
+        from dashboard.components.research import wizard_steps
+
+        wizard_steps._fetch_scores.clear()
+        scores = {"piotroski": {"score": 7}, "altman": {"z_score": 3.2}}
+        with patch.object(wizard_steps, "get_cached_scores", return_value=None), \
+                patch.object(
+                    wizard_steps, "get_scores_for_ticker", return_value=scores
+                ) as mock_fetch:
+            assert wizard_steps._load_scores("ZZZT") == scores
+            assert wizard_steps._load_scores("ZZZT") == scores
+
+        mock_fetch.assert_called_once_with("ZZZT")
+
+    def test_errors_are_not_cached(self):
+        from dashboard.components.research import wizard_steps
+
+        wizard_steps._fetch_scores.clear()
+        error = {"error": "rate_limited", "message": "slow down"}
+        with patch.object(wizard_steps, "get_cached_scores", return_value=None), \
+                patch.object(
+                    wizard_steps, "get_scores_for_ticker", return_value=error
+                ) as mock_fetch:
+            assert wizard_steps._load_scores("ZZZT") == error
+            assert wizard_steps._load_scores("ZZZT") == error
+
+        assert mock_fetch.call_count == 2
+
+    def test_watchlist_cache_takes_precedence(self):
+        from dashboard.components.research import wizard_steps
+
+        cached = {"piotroski": {"score": 5}}
+        with patch.object(wizard_steps, "get_cached_scores", return_value=cached), \
+                patch.object(wizard_steps, "get_scores_for_ticker") as mock_fetch:
+            assert wizard_steps._load_scores("AAPL") is cached
+
+        mock_fetch.assert_not_called()
+
+
 class TestThesisDraftState:
     """Test thesis draft state structure."""
 
@@ -9,6 +9,7 @@ from dashboard.utils.decisions import (
     get_decisions_with_outcomes,
     analyze_by_conviction,
     calculate_portfolio_return,
+    calculate_what_if_returns,
 )
 
 
@@ -154,3 +155,37 @@ class TestOutcomeValidation:
         avg_return = calculate_portfolio_return(decisions, conviction_min=5)
         # Only second decision counted
         assert avg_return == pytest.approx(10.0, rel=0.01)
+
+
+class TestWhatIfReturns:
+    """Tests for the single-pass what-if return calculation."""
+
+    DECISIONS = [
+        {"confidence": 5, "target_price": 100.0, "actual_price": 120.0},  # +20%
+        {"confidence": 4, "target_price": 50.0, "actual_price": 55.0},    # +10%
+        {"confidence": None, "target_price": 200.0, "actual_price": 180.0},  # -10%, medium
+        {"confidence": 1, "target_price": None, "actual_price": 70.0},    # No return
+    ]
+
+    def test_matches_calculate_portfolio_return(self):
+        """Each threshold should match the one-threshold calculation."""
+        what_if = calculate_what_if_returns(self.DECISIONS, conviction_mins=(1, 3, 4, 5))
+
+        for conviction_min, stats in what_if.items():
+            assert stats["avg_return"] == pytest.approx(
+                calculate_portfolio_return(self.DECISIONS, conviction_min=conviction_min)
+            )
+
+    def test_decision_count_includes_decisions_without_prices(self):
+        """Decision counts cover every decision at or above the threshold."""
+        what_if = calculate_what_if_returns(self.DECISIONS, conviction_mins=(1, 4, 5))
+
+        assert what_if[1]["decision_count"] == 4
+        assert what_if[4]["decision_count"] == 2
+        assert what_if[5]["decision_count"] == 1
+
+    def test_empty_input(self):
+        """No decisions should yield zero returns and counts."""
+        assert calculate_what_if_returns([], conviction_mins=(1,)) == {
+            1: {"avg_return": 0.0, "decision_count": 0}
+        }
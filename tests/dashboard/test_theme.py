@@ -7,6 +7,7 @@ from dashboard.theme import (
     SEMANTIC_COLORS,
     THEME,
     get_color,
+    get_plotly_layout,
     get_plotly_theme,
     get_semantic_color,
     get_theme,
@@ -178,6 +179,25 @@ class TestGetPlotlyTheme:
         assert result["font"]["color"] == "#f1f5f9"
 
 
+class TestGetPlotlyLayout:
+    """Tests for get_plotly_layout() function."""
+
+    def test_adds_settings_over_theme(self):
+        result = get_plotly_layout(title="Chart", height=400)
+        assert result["title"] == "Chart"
+        assert result["height"] == 400
+        assert result["paper_bgcolor"] == get_plotly_theme()["paper_bgcolor"]
+
+    def test_merges_nested_dicts(self):
+        result = get_plotly_layout(legend=dict(orientation="h", y=1.02))
+        assert result["legend"]["orientation"] == "h"
+        assert result["legend"]["bgcolor"] == get_plotly_theme()["legend"]["bgcolor"]
+
+    def test_does_not_leak_between_calls(self):
+        get_plotly_layout(legend=dict(orientation="h"))
+        assert "orientation" not in get_plotly_theme()["legend"]
+
+
 class TestColorContrast:
     """Tests to verify colors have appropriate contrast."""
 
@@ -480,3 +480,75 @@ class TestClearWatchlist:
         count = watchlist.clear_watchlist()
 
         assert count == 0
+
+
+class TestCachedTickers:
+    """Tests for dashboard/utils/watchlist_cache.py."""
+
+    def test_rereads_only_when_file_changes(self, tmp_path, monkeypatch):
+        """Cached tickers should refresh when the file is rewritten."""
+        import os
+
+        from dashboard.utils import watchlist, watchlist_cache
+
+        fake_file = tmp_path / "watchlist.json"
+        monkeypatch.setattr(watchlist, "WATCHLIST_FILE", fake_file)
+        monkeypatch.setattr(watchlist_cache, "WATCHLIST_FILE", fake_file)
+        watchlist_cache._load_sorted_tickers.clear()
+
+        fake_file.write_text(json.dumps({"stocks": {"MSFT": {}, "AAPL": {}}}))
+        assert watchlist_cache.get_cached_tickers() == ["AAPL", "MSFT"]
+
+        with patch.object(watchlist_cache, "get_stocks") as mock_get_stocks:
+            assert watchlist_cache.get_cached_tickers() == ["AAPL", "MSFT"]
+            mock_get_stocks.assert_not_called()
+
+        fake_file.write_text(json.dumps({"stocks": {"GOOG": {}}}))
+        stat = fake_file.stat()
+        os.utime(fake_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert watchlist_cache.get_cached_tickers() == ["GOOG"]
+
+    def test_missing_file_returns_empty(self, tmp_path, monkeypatch):
+        """A missing watchlist file should yield no tickers."""
+        from dashboard.utils import watchlist, watchlist_cache
+
+        fake_file = tmp_path / "missing" / "watchlist.json"
+        monkeypatch.setattr(watchlist, "WATCHLIST_FILE", fake_file)
+        monkeypatch.setattr(watchlist_cache, "WATCHLIST_FILE", fake_file)
+        watchlist_cache._load_sorted_tickers.clear()
+
+        assert watchlist_cache.get_cached_tickers() == []
+
+    def test_ticker_options_lead_with_all(self, tmp_path, monkeypatch):
+        """Ticker options should be a tuple with "" (All) before the sorted tickers."""
+        from dashboard.utils import watchlist, watchlist_cache
+
+        fake_file = tmp_path / "watchlist.json"
+        monkeypatch.setattr(watchlist, "WATCHLIST_FILE", fake_file)
+        monkeypatch.setattr(watchlist_cache, "WATCHLIST_FILE", fake_file)
+        watchlist_cache._load_sorted_tickers.clear()
+        watchlist_cache._load_ticker_options.clear()
+
+        fake_file.write_text(json.dumps({"stocks": {"MSFT": {}, "AAPL": {}}}))
+        assert watchlist_cache.get_cached_ticker_options() == ("", "AAPL", "MSFT")
+        options = watchlist_cache.get_cached_ticker_options()
+        assert watchlist_cache.get_cached_ticker_options() is options
+
+    def test_ticker_positions_match_options(self, tmp_path, monkeypatch):
+        """Ticker positions should index into the cached ticker options."""
+        from dashboard.utils import watchlist, watchlist_cache
+
+        fake_file = tmp_path / "watchlist.json"
+        monkeypatch.setattr(watchlist, "WATCHLIST_FILE", fake_file)
+        monkeypatch.setattr(watchlist_cache, "WATCHLIST_FILE", fake_file)
+        watchlist_cache._load_sorted_tickers.clear()
+        watchlist_cache._load_ticker_options.clear()
+        watchlist_cache._load_ticker_positions.clear()
+
+        fake_file.write_text(json.dumps({"stocks": {"MSFT": {}, "AAPL": {}}}))
+        positions = watchlist_cache.get_cached_ticker_positions()
+        options = watchlist_cache.get_cached_ticker_options()
+
+        assert positions == {"": 0, "AAPL": 1, "MSFT": 2}
+        assert all(options[i] == ticker for ticker, i in positions.items())
+        assert positions.get("GOOG", 0) == 0
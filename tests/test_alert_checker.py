@@ -356,6 +356,27 @@ class TestAlertAcknowledge:
 
         assert result is False
 
+    def test_acknowledge_many_updates_in_one_call(self, checker, stock_with_score):
+        """Test acknowledge_many marks several history records acknowledged."""
+        _, ticker = stock_with_score
+
+        checker.create_alert(ticker=ticker, alert_type="fscore_above", threshold_value=8.0)
+        alert_obj, _ = checker.get_alerts(ticker=ticker)[0]
+
+        with get_session() as session:
+            records = [AlertHistory(alert_id=alert_obj.id, message=f"Test {i}") for i in range(3)]
+            session.add_all(records)
+            session.commit()
+            history_ids = [r.id for r in records]
+
+        assert checker.acknowledge_many(history_ids[:2], acknowledged_by="tester") == 2
+        # Already-acknowledged records are not counted again
+        assert checker.acknowledge_many(history_ids[:2]) == 0
+        assert checker.acknowledge_many([]) == 0
+
+        pending = checker.get_alert_history(unacknowledged_only=True)
+        assert [h.id for h, _, _ in pending] == [history_ids[2]]
+
 
 class TestAlertRemove:
     """Tests for alert removal."""
@@ -424,6 +445,25 @@ class TestAlertRemove:
 
         assert result is False
 
+    def test_remove_many_deletes_alerts_and_history(self, checker, stock_with_score):
+        """Test remove_many deletes several alerts and their history together."""
+        _, ticker = stock_with_score
+
+        for threshold in (6.0, 7.0, 8.0):
+            checker.create_alert(
+                ticker=ticker, alert_type="fscore_above", threshold_value=threshold
+            )
+        alert_ids = [a.id for a, _ in checker.get_alerts(ticker=ticker)]
+
+        with get_session() as session:
+            session.add(AlertHistory(alert_id=alert_ids[0], message="Test"))
+            session.commit()
+
+        assert checker.remove_many(alert_ids[:2]) == 2
+        assert [a.id for a, _ in checker.get_alerts(ticker=ticker)] == alert_ids[2:]
+        assert checker.get_alert_history() == []
+        assert checker.remove_many([]) == 0
+
 
 class TestGetAlerts:
     """Tests for alert retrieval."""
@@ -481,6 +521,24 @@ class TestGetAlerts:
         alerts = checker.get_alerts(active_only=False)
         assert len(alerts) == 1
 
+        # Should return only the inactive alert when inactive_only=True
+        checker.create_alert(ticker=ticker, alert_type="fscore_below", threshold_value=3.0)
+        alerts = checker.get_alerts(active_only=False, inactive_only=True)
+        assert [a.id for a, _ in alerts] == [alert_id]
+
+    def test_get_alerts_limit_returns_newest(self, checker, stock_with_score):
+        """Test get_alerts caps results, newest first."""
+        _, ticker = stock_with_score
+
+        for threshold in (6.0, 7.0, 8.0):
+            checker.create_alert(
+                ticker=ticker, alert_type="fscore_above", threshold_value=threshold
+            )
+
+        alerts = checker.get_alerts(ticker=ticker, limit=2)
+        assert [a.threshold_value for a, _ in alerts] == [8.0, 7.0]
+        assert len(checker.get_alerts(ticker=ticker)) == 3
+
 
 class TestAlertHistory:
     """Tests for alert history retrieval."""
@@ -533,3 +591,27 @@ class TestAlertHistory:
         assert len(results) == 1
         history, _, _ = results[0]
         assert history.message == "Not acked"
+
+
+class TestAlertSummary:
+    """Tests for the aggregate alert summary."""
+
+    def test_summary_empty(self, checker):
+        """Test summary counts are zero with no alerts."""
+        assert checker.get_summary() == {"active": 0, "triggered": 0, "unacknowledged": 0}
+
+    def test_summary_counts(self, checker, stock_with_score):
+        """Test summary counts active, triggered and unacknowledged alerts."""
+        stock_id, ticker = stock_with_score
+
+        checker.create_alert(ticker=ticker, alert_type="fscore_above", threshold_value=8.0)
+        checker.create_alert(ticker=ticker, alert_type="fscore_below", threshold_value=3.0)
+        alert_obj, _ = checker.get_alerts(ticker=ticker)[0]
+
+        with get_session() as session:
+            db_alert = session.exec(select(Alert).where(Alert.id == alert_obj.id)).first()
+            db_alert.is_triggered = True
+            session.add(AlertHistory(alert_id=alert_obj.id, message="Triggered"))
+            session.commit()
+
+        assert checker.get_summary() == {"active": 2, "triggered": 1, "unacknowledged": 1}
@@ -323,3 +323,29 @@ def test_performance_stats_zero_cost_basis(manager):
     # Should not crash, should return stats with zero/invalid returns
     assert stats is not None
     assert stats["days_tracked"] == 2
+
+
+def test_performance_stats_skips_zero_value_returns(manager):
+    """Returns after a zero-value snapshot are skipped, not divided by zero."""
+    base_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=4)
+    snapshots = [
+        PortfolioSnapshot(
+            snapshot_date=base_date + timedelta(days=day),
+            total_value=value,
+            total_cost_basis=100.0,
+            unrealized_pnl=0.0,
+            unrealized_pnl_percent=0.0,
+            position_count=1,
+        )
+        for day, value in enumerate([100.0, 0.0, 50.0, 75.0, 60.0])
+    ]
+
+    stats = manager.get_performance_stats(snapshots)
+
+    # Returns: -100% (100 -> 0), skipped (0 -> 50), +50%, -20%
+    assert stats["avg_daily_return"] == pytest.approx(-70 / 3)
+    assert stats["best_day"] == {"date": snapshots[3].snapshot_date, "return": pytest.approx(50.0)}
+    assert stats["worst_day"]["date"] == snapshots[1].snapshot_date
+    assert stats["worst_day"]["return"] == pytest.approx(-100.0)
+    assert stats["max_drawdown"] == pytest.approx(-100.0)
+    assert stats["volatility"] == pytest.approx(75.05553, rel=1e-5)
@@ -276,6 +276,16 @@ class TestGetHoldings:
         for h in holdings:
             assert h.allocation_percent == pytest.approx(50.0, rel=0.01)
 
+    def test_get_open_tickers_excludes_closed(self, manager, stock_aapl, stock_msft):
+        """Test open tickers are sorted and skip fully sold positions."""
+        manager.add_buy(ticker=stock_msft, quantity=10, price_per_share=100.00)
+        manager.add_buy(ticker=stock_aapl, quantity=10, price_per_share=100.00)
+        assert manager.get_open_tickers() == ["AAPL", "MSFT"]
+
+        manager.add_sell(ticker=stock_msft, quantity=10, price_per_share=110.00)
+
+        assert manager.get_open_tickers() == ["AAPL"]
+
 
 class TestPortfolioSummary:
     """Tests for portfolio summary."""
@@ -308,6 +318,18 @@ class TestPortfolioSummary:
         # Realized gain = (200 - 150) * 50 = 2500
         assert summary.realized_pnl_total == pytest.approx(2500.00, rel=0.01)
 
+    def test_total_return_percent(self, manager, stock_aapl):
+        """Test total return combines realized and unrealized P&L over cash invested."""
+        assert manager.get_portfolio_summary().total_return_percent == 0.0
+
+        manager.add_buy(ticker=stock_aapl, quantity=100, price_per_share=150.00)
+        manager.add_sell(ticker=stock_aapl, quantity=50, price_per_share=200.00)
+
+        summary = manager.get_portfolio_summary(market_prices={"AAPL": 160.00})
+
+        # Realized 2500 + unrealized (160 - 150) * 50 = 500, over 15000 invested
+        assert summary.total_return_percent == pytest.approx(20.0)
+
 
 class TestTransactionHistory:
     """Tests for transaction history."""
@@ -364,3 +386,36 @@ class TestWeightedScores:
 
         assert scores.holdings_with_scores == 0
         assert scores.holdings_without_scores == 1
+
+    def test_get_weighted_scores_mixed_zones(self, manager):
+        """Test cost-weighted averages and zone allocation from pre-fetched holdings."""
+        from types import SimpleNamespace
+
+        holdings = [
+            SimpleNamespace(cost_basis_total=1000.0, fscore=7, zscore=3.5, zone="Safe"),
+            SimpleNamespace(cost_basis_total=500.0, fscore=3, zscore=1.2, zone="Distress"),
+            SimpleNamespace(cost_basis_total=250.0, fscore=5, zscore=2.2, zone="Grey"),
+            SimpleNamespace(cost_basis_total=250.0, fscore=None, zscore=None, zone=None),
+        ]
+
+        scores = manager.get_weighted_scores(holdings=holdings)
+
+        assert scores.holdings_with_scores == 3
+        assert scores.holdings_without_scores == 1
+        assert scores.weighted_fscore == pytest.approx(4.88, abs=0.01)
+        assert scores.safe_allocation == 50.0
+        assert scores.grey_allocation == 12.5
+        assert scores.distress_allocation == 25.0
+
+    def test_get_weighted_scores_zero_cost_basis(self, manager):
+        """Test that a zero total cost basis yields zero weights instead of dividing by zero."""
+        from types import SimpleNamespace
+
+        holdings = [SimpleNamespace(cost_basis_total=0.0, fscore=6, zscore=2.5, zone="Grey")]
+
+        scores = manager.get_weighted_scores(holdings=holdings)
+
+        assert scores.holdings_with_scores == 1
+        assert scores.weighted_fscore == 0.0
+        assert scores.weighted_zscore == 0.0
+        assert scores.grey_allocation == 0.0
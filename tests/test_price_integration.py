@@ -96,6 +96,18 @@ class TestRefreshMarketPrices:
             assert prices["TEST1"] == 60.0
             assert prices["TEST2"] is None
 
+    def test_refresh_market_prices_single_batch_request(self, setup_portfolio_with_holdings):
+        """Duplicates are fetched once and tickers absent from the batch map to None."""
+        manager = setup_portfolio_with_holdings
+
+        with patch("asymmetric.core.portfolio.manager.fetch_batch_prices") as mock_get_prices:
+            mock_get_prices.return_value = {"TEST1": {"price": 60.0, "change_percent": 20.0}}
+
+            prices = manager.refresh_market_prices(["TEST1", "TEST2", "TEST1"])
+
+            mock_get_prices.assert_called_once_with(("TEST1", "TEST2"))
+            assert prices == {"TEST1": 60.0, "TEST2": None}
+
     def test_refresh_market_prices_empty_tickers(self):
         """Test behavior with empty ticker list."""
         manager = PortfolioManager()
@@ -177,6 +177,29 @@ class TestGetScoreHistory:
         for h in history:
             assert h.fiscal_year >= current_year - 2
 
+    def test_get_score_history_excludes_other_period_types(
+        self, analyzer, stock_with_improving_history
+    ):
+        """Test FY history leaves out quarterly rows (filtered in SQL)."""
+        current_year = datetime.now(UTC).year
+        analyzer.save_score_to_history(
+            ticker=stock_with_improving_history,
+            fiscal_year=current_year,
+            fiscal_period="Q2",
+            piotroski_score=3,
+            altman_z_score=2.0,
+            altman_zone="Grey",
+        )
+
+        history = analyzer.get_score_history(stock_with_improving_history, years=5)
+        assert len(history) == 4
+        assert {h.fiscal_period for h in history} == {"FY"}
+
+        quarterly = analyzer.get_score_history(
+            stock_with_improving_history, years=5, period_type="Q2"
+        )
+        assert [(h.fiscal_year, h.fiscal_period) for h in quarterly] == [(current_year, "Q2")]
+
     def test_get_score_history_no_data(self, analyzer):
         """Test getting history for non-existent stock."""
         history = analyzer.get_score_history("NOTEXIST", years=5)